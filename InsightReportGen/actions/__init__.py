@@ -1,5 +1,5 @@
 from .retriever import get_retriever, get_retrievers
-from .query_processing import plan_research_outline, get_search_results
+from .query_processing import plan_research_outline, get_search_results, run_retriever_search
 from .agent_creator import extract_json_with_regex, choose_agent
 from .web_scraping import scrape_urls
 from .report_generation import write_conclusion, summarize_url, generate_draft_section_titles, generate_report, write_report_introduction
@@ -10,6 +10,7 @@ __all__ = [
     "get_retriever",
     "get_retrievers",
     "get_search_results",
+    "run_retriever_search",
     "plan_research_outline",
     "extract_json_with_regex",
     "scrape_urls",
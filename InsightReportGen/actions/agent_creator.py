@@ -2,6 +2,7 @@ import json
 import re
 import json_repair
 from utils.llm import create_chat_completion
+from gpt_researcher.llm_provider.scheduler import LLMPriority
 from prompts import PromptFamily
 
 async def choose_agent(
@@ -39,6 +40,7 @@ async def choose_agent(
             ],
             temperature=0.15,
             llm_provider=cfg.smart_llm_provider,
+            priority=LLMPriority.PLANNING,
             llm_kwargs=cfg.llm_kwargs,
             cost_callback=cost_callback,
             **kwargs
@@ -1,6 +1,8 @@
+import asyncio
 import json_repair
 
 from gpt_researcher.llm_provider.generic.base import ReasoningEfforts
+from gpt_researcher.llm_provider.scheduler import LLMPriority
 from utils.llm import create_chat_completion
 from prompts import PromptFamily
 from typing import Any, List, Dict
@@ -31,8 +33,25 @@ async def get_search_results(query: str, retriever: Any, query_domains: List[str
         )
     else:
         search_retriever = retriever(query, query_domains=query_domains)
-    
-    return search_retriever.search()
+
+    return await run_retriever_search(search_retriever)
+
+async def run_retriever_search(search_retriever: Any, **search_kwargs) -> List[Dict[str, Any]]:
+    """
+    Run a retriever's search without blocking the event loop.
+
+    Args:
+        search_retriever: The retriever instance
+        search_kwargs: Arguments passed to the search method (e.g. max_results)
+
+    Returns:
+        A list of search results
+    """
+    # Prefer the native async contract, which uses the shared pooled HTTP client
+    if hasattr(search_retriever, "asearch"):
+        return await search_retriever.asearch(**search_kwargs)
+    # Retrievers without one do blocking I/O, so they run in a worker thread
+    return await asyncio.to_thread(search_retriever.search, **search_kwargs)
 
 async def generate_sub_queries(
     query: str,
@@ -73,6 +92,7 @@ async def generate_sub_queries(
             model=cfg.strategic_llm_model,
             messages=[{"role": "user", "content": gen_queries_prompt}],
             llm_provider=cfg.strategic_llm_provider,
+            priority=LLMPriority.PLANNING,
             max_tokens=None,
             llm_kwargs=cfg.llm_kwargs,
             reasoning_effort=ReasoningEfforts.Medium.value,
@@ -88,6 +108,7 @@ async def generate_sub_queries(
                 messages=[{"role": "user", "content": gen_queries_prompt}],
                 max_tokens=cfg.strategic_token_limit,
                 llm_provider=cfg.strategic_llm_provider,
+                priority=LLMPriority.PLANNING,
                 llm_kwargs=cfg.llm_kwargs,
                 cost_callback=cost_callback,
                 **kwargs
@@ -102,6 +123,7 @@ async def generate_sub_queries(
                 temperature=cfg.temperature,
                 max_tokens=cfg.smart_token_limit,
                 llm_provider=cfg.smart_llm_provider,
+                priority=LLMPriority.PLANNING,
                 llm_kwargs=cfg.llm_kwargs,
                 cost_callback=cost_callback,
                 **kwargs
@@ -2,6 +2,7 @@ import asyncio
 from typing import List, Dict, Any
 from config.config import Config
 from utils.llm import create_chat_completion
+from gpt_researcher.llm_provider.scheduler import LLMPriority
 from utils.logger import get_formatted_logger
 from prompts import PromptFamily, get_prompt_by_report_type
 from utils.enum import Tone
@@ -47,11 +48,13 @@ async def write_report_introduction(
             ],
             temperature=0.25,
             llm_provider=config.smart_llm_provider,
+            priority=LLMPriority.REPORT,
             stream=True,
             websocket=websocket,
             max_tokens=config.smart_token_limit,
             llm_kwargs=config.llm_kwargs,
             cost_callback=cost_callback,
+            cache=False,
             **kwargs
         )
         return introduction
@@ -99,11 +102,13 @@ async def write_conclusion(
             ],
             temperature=0.25,
             llm_provider=config.smart_llm_provider,
+            priority=LLMPriority.REPORT,
             stream=True,
             websocket=websocket,
             max_tokens=config.smart_token_limit,
             llm_kwargs=config.llm_kwargs,
             cost_callback=cost_callback,
+            cache=False,
             **kwargs
         )
         return conclusion
@@ -144,6 +149,7 @@ async def summarize_url(
             ],
             temperature=0.25,
             llm_provider=config.smart_llm_provider,
+            priority=LLMPriority.SUMMARY,
             stream=True,
             websocket=websocket,
             max_tokens=config.smart_token_limit,
@@ -193,6 +199,7 @@ async def generate_draft_section_titles(
             ],
             temperature=0.25,
             llm_provider=config.smart_llm_provider,
+            priority=LLMPriority.PLANNING,
             stream=True,
             websocket=None,
             max_tokens=config.smart_token_limit,
@@ -262,11 +269,13 @@ async def generate_report(
             ],
             temperature=0.35,
             llm_provider=cfg.smart_llm_provider,
+            priority=LLMPriority.REPORT,
             stream=True,
             websocket=websocket,
             max_tokens=cfg.smart_token_limit,
             llm_kwargs=cfg.llm_kwargs,
             cost_callback=cost_callback,
+            cache=False,
             **kwargs
         )
     except:
@@ -278,11 +287,13 @@ async def generate_report(
                 ],
                 temperature=0.35,
                 llm_provider=cfg.smart_llm_provider,
+                priority=LLMPriority.REPORT,
                 stream=True,
                 websocket=websocket,
                 max_tokens=cfg.smart_token_limit,
                 llm_kwargs=cfg.llm_kwargs,
                 cost_callback=cost_callback,
+                cache=False,
                 **kwargs
             )
         except Exception as e:
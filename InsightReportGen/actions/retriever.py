@@ -105,8 +105,18 @@ def get_retrievers(headers: dict[str, str], cfg):
 
     # Convert retriever names to actual retriever classes
     # Use get_default_retriever() as a fallback for any invalid retriever names
-    retriever_classes = [get_retriever(r) or get_default_retriever() for r in retrievers]
-    
+    from ..retrievers.cache import with_search_cache
+
+    retriever_classes = []
+    for r in retrievers:
+        retriever_class = get_retriever(r)
+        if retriever_class is None:
+            retriever_class, r = get_default_retriever(), "tavily"
+        # MCP results depend on the connected servers, so they are never cached
+        if r != "mcp":
+            retriever_class = with_search_cache(retriever_class, r, cfg)
+        retriever_classes.append(retriever_class)
+
     return retriever_classes
 
 
@@ -3,6 +3,7 @@ from colorama import Fore, Style
 
 from gpt_researcher.utils.workers import WorkerPool
 from scraper import Scraper
+from scraper.page_cache import PageCache
 from config.config import Config
 from utils.logger import get_formatted_logger
 
@@ -10,13 +11,15 @@ logger = get_formatted_logger()
 
 
 async def scrape_urls(
-    urls, cfg: Config, worker_pool: WorkerPool
+    urls, cfg: Config, worker_pool: WorkerPool, page_cache: PageCache | None = None
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
     """
     Scrapes the urls
     Args:
         urls: List of urls
         cfg: Config (optional)
+        worker_pool: WorkerPool running the fetch and parse stages
+        page_cache: PageCache serving and storing scraped pages (optional)
 
     Returns:
         tuple[list[dict[str, Any]], list[dict[str, Any]]]: tuple containing scraped content and images
@@ -31,7 +34,8 @@ async def scrape_urls(
     )
 
     try:
-        scraper = Scraper(urls, user_agent, cfg.scraper, worker_pool=worker_pool)
+        scraper = Scraper(urls, user_agent, cfg.scraper, worker_pool=worker_pool, page_cache=page_cache,
+                          cfg=cfg)
         scraped_data = await scraper.run()
         for item in scraped_data:
             if 'image_urls' in item:
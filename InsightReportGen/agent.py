@@ -1,13 +1,17 @@
 from typing import Any, Optional
+import copy
 import json
 import os
+import uuid
 
 from .config import Config
-from .memory import Memory
+from .memory import Memory, get_embedding_cache
 from .utils.enum import ReportSource, ReportType, Tone
 from .llm_provider import GenericLLMProvider
 from .prompts import get_prompt_family
 from .vector_store import VectorStoreWrapper
+from .utils.loop_monitor import start_loop_monitor
+from .llm_provider.scheduler import research_job
 
 # Research skills
 from .skills.researcher import ResearchConductor
@@ -51,6 +55,7 @@ class GPTResearcher:
         parent_query: str = "",
         subtopics: list | None = None,
         visited_urls: set | None = None,
+        shared_visited_urls: set | None = None,
         verbose: bool = True,
         context=None,
         headers: dict | None = None,
@@ -60,6 +65,7 @@ class GPTResearcher:
         mcp_configs: list[dict] | None = None,
         mcp_max_iterations: int | None = None,
         mcp_strategy: str | None = None,
+        parent: "GPTResearcher | None" = None,
         **kwargs
     ):
         """
@@ -85,6 +91,8 @@ class GPTResearcher:
             parent_query: Parent query for subtopic reports.
             subtopics: List of subtopics to research.
             visited_urls: Set of already visited URLs.
+            shared_visited_urls: URLs claimed by researchers running alongside this one. They are
+                skipped when scraping, extended with this researcher's URLs and never cleared.
             verbose (bool): Whether to output verbose logs.
             context: Pre-loaded research context.
             headers (dict, optional): Additional headers for requests and configuration.
@@ -114,12 +122,19 @@ class GPTResearcher:
                 - "fast" (default): Run MCP once with original query for best performance
                 - "deep": Run MCP for all sub-queries for maximum thoroughness  
                 - "disabled": Skip MCP entirely, use only web retrievers
+            parent (GPTResearcher, optional): Researcher whose config (copied), embeddings, retrievers,
+                scraper worker pool, caches and cost total are shared. Use `spawn_child` instead.
         """
         self.kwargs = kwargs
+        self.parent = parent
         self.query = query
         self.report_type = report_type
-        self.cfg = Config(config_path)
-        self.cfg.set_verbose(verbose)
+        if parent is not None:
+            # A copy, so per-child changes such as MCP retrievers stay out of the parent's config
+            self.cfg = copy.copy(parent.cfg)
+        else:
+            self.cfg = Config(config_path)
+            self.cfg.set_verbose(verbose)
         self.report_source = report_source if report_source else getattr(self.cfg, 'report_source', None)
         self.report_format = report_format
         self.max_subtopics = max_subtopics
@@ -131,7 +146,9 @@ class GPTResearcher:
         self.research_sources = []  # The list of scraped sources including title, content and images
         self.research_images = []  # The list of selected research images
         self.documents = documents
-        self.vector_store = VectorStoreWrapper(vector_store) if vector_store else None
+        # Chunk embeddings are cached per researcher (or on disk) so each chunk is embedded once
+        self.embedding_cache = parent.embedding_cache if parent is not None else get_embedding_cache(self.cfg)
+        self.vector_store = VectorStoreWrapper(vector_store, embedding_cache=self.embedding_cache) if vector_store else None
         self.vector_store_filter = vector_store_filter
         self.websocket = websocket
         self.agent = agent
@@ -139,22 +156,35 @@ class GPTResearcher:
         self.parent_query = parent_query
         self.subtopics = subtopics or []
         self.visited_urls = visited_urls or set()
+        self.shared_visited_urls = shared_visited_urls
         self.verbose = verbose
         self.context = context or []
         self.headers = headers or {}
         self.research_costs = 0.0
+        # LLM calls of this researcher share one fair-queuing slot in the provider scheduler
+        self.research_job = parent.research_job if parent is not None else uuid.uuid4().hex[:12]
         self.log_handler = log_handler
-        self.prompt_family = get_prompt_family(prompt_family or self.cfg.prompt_family, self.cfg)
+        if parent is not None and prompt_family is None:
+            self.prompt_family = parent.prompt_family
+        else:
+            self.prompt_family = get_prompt_family(prompt_family or self.cfg.prompt_family, self.cfg)
         
         # Process MCP configurations if provided
         self.mcp_configs = mcp_configs
         if mcp_configs:
             self._process_mcp_configs(mcp_configs)
         
-        self.retrievers = get_retrievers(self.headers, self.cfg)
-        self.memory = Memory(
-            self.cfg.embedding_provider, self.cfg.embedding_model, **self.cfg.embedding_kwargs
-        )
+        if parent is not None and self.headers == parent.headers and mcp_configs == parent.mcp_configs:
+            self.retrievers = parent.retrievers
+        else:
+            self.retrievers = get_retrievers(self.headers, self.cfg)
+        if parent is not None:
+            self.memory = parent.memory
+        else:
+            self.memory = Memory(
+                self.cfg.embedding_provider, self.cfg.embedding_model, embedding_cache=self.embedding_cache,
+                **self.cfg.embedding_kwargs
+            )
         
         # Set default encoding to utf-8
         self.encoding = kwargs.get('encoding', 'utf-8')
@@ -164,7 +194,11 @@ class GPTResearcher:
         self.report_generator: ReportGenerator = ReportGenerator(self)
         self.code_generator: CodeGenerator = CodeGenerator(self)
         self.context_manager: ContextManager = ContextManager(self)
-        self.scraper_manager: BrowserManager = BrowserManager(self)
+        self.scraper_manager: BrowserManager = BrowserManager(
+            self,
+            worker_pool=parent.scraper_manager.worker_pool if parent is not None else None,
+            page_cache=parent.scraper_manager.page_cache if parent is not None else None,
+        )
         self.source_curator: SourceCurator = SourceCurator(self)
         self.deep_researcher: Optional[DeepResearchSkill] = None
         if report_type == ReportType.DeepResearch.value:
@@ -173,6 +207,40 @@ class GPTResearcher:
         # Handle MCP strategy configuration with backwards compatibility
         self.mcp_strategy = self._resolve_mcp_strategy(mcp_strategy, mcp_max_iterations)
 
+    def spawn_child(self, query: str, report_type: str = ReportType.ResearchReport.value, **kwargs) -> "GPTResearcher":
+        """
+        Create a researcher for a sub-query that shares this researcher's resources.
+
+        The child reuses a copy of the config, the embeddings client and cache, retrievers, prompt family,
+        scraper worker pool and LLM scheduling slot, and adds its costs to this researcher.
+        Query state (context, visited URLs, sources, images) is its own.
+
+        Args:
+            query (str): The sub-query to research.
+            report_type (str): Type of report the child will write.
+            **kwargs: Other `GPTResearcher` arguments. Source, tone, websocket, headers, verbosity,
+                agent, role, domains and MCP settings default to this researcher's.
+
+        Returns:
+            GPTResearcher: The child researcher.
+        """
+        params = {
+            "report_source": self.report_source,
+            "report_format": self.report_format,
+            "tone": self.tone,
+            "query_domains": self.query_domains,
+            "websocket": self.websocket,
+            "agent": self.agent,
+            "role": self.role,
+            "verbose": self.verbose,
+            "headers": self.headers,
+            "log_handler": self.log_handler,
+            "mcp_configs": self.mcp_configs,
+            "mcp_strategy": self.mcp_strategy,
+        }
+        params.update(kwargs)
+        return GPTResearcher(query=query, report_type=report_type, parent=self, **params)
+
     def _resolve_mcp_strategy(self, mcp_strategy: str | None, mcp_max_iterations: int | None) -> str:
         """
         Resolve MCP strategy from various sources with backwards compatibility.
@@ -289,6 +357,11 @@ class GPTResearcher:
                 logging.getLogger('research').error(f"Error in _log_event: {e}", exc_info=True)
 
     async def conduct_research(self, on_progress=None):
+        start_loop_monitor(self.cfg.loop_lag_threshold)
+        with research_job(self.research_job):
+            return await self._conduct_research(on_progress)
+
+    async def _conduct_research(self, on_progress=None):
         await self._log_event("research", step="start", details={
             "query": self.query,
             "report_type": self.report_type,
@@ -369,6 +442,10 @@ class GPTResearcher:
         return self.context
 
     async def write_report(self, existing_headers: list = [], relevant_written_contents: list = [], ext_context=None, custom_prompt="") -> str:
+        with research_job(self.research_job):
+            return await self._write_report(existing_headers, relevant_written_contents, ext_context, custom_prompt)
+
+    async def _write_report(self, existing_headers: list, relevant_written_contents: list, ext_context, custom_prompt: str) -> str:
         await self._log_event("research", step="writing_report", details={
             "existing_headers": existing_headers,
             "context_source": "external" if ext_context else "internal"
@@ -468,6 +545,8 @@ class GPTResearcher:
         if not isinstance(cost, (float, int)):
             raise ValueError("Cost must be an integer or float")
         self.research_costs += cost
+        if self.parent is not None:
+            self.parent.add_costs(cost)
         if self.log_handler:
             self._log_event("research", step="cost_update", details={
                 "cost": cost,
@@ -12,6 +12,8 @@ class Config:
     """Config class for GPT Researcher."""
 
     CONFIG_DIR = os.path.join(os.path.dirname(__file__), "variables")
+    # Settings from the most recently loaded config file, for code that reads them without a Config
+    _file_config: Dict[str, Any] = {}
 
     def __init__(self, config_path: str | None = None):
         """Initialize the config class."""
@@ -136,6 +138,7 @@ class Config:
 
         with open(config_path, "r") as f:
             custom_config = json.load(f)
+        cls._file_config = custom_config
 
         # Merge with default config to ensure all keys are present
         merged_config = DEFAULT_CONFIG.copy()
@@ -219,6 +222,21 @@ class Config:
         """Ensure that the folder exists at the doc path"""
         os.makedirs(self.doc_path, exist_ok=True)
 
+    @staticmethod
+    def get_setting(key: str, cfg: "Config | None" = None) -> Any:
+        """
+        Read a single setting without building a Config.
+
+        The value comes from cfg when one is given, else from the environment, else from the
+        last loaded config file, else from the default config.
+        """
+        if cfg is not None and hasattr(cfg, key.lower()):
+            return getattr(cfg, key.lower())
+        env_value = os.getenv(key)
+        if env_value is None:
+            return Config._file_config.get(key, DEFAULT_CONFIG[key])
+        return Config.convert_env_value(key, env_value, BaseConfig.__annotations__[key])
+
     @staticmethod
     def convert_env_value(key: str, env_value: str, type_hint: Type) -> Any:
         """Convert environment variable to the appropriate type based on the type hint."""
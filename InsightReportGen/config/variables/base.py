@@ -26,6 +26,15 @@ class BaseConfig(TypedDict):
     AGENT_ROLE: Union[str, None]
     SCRAPER: str
     MAX_SCRAPER_WORKERS: int
+    SCRAPER_MAX_IN_FLIGHT: int
+    SCRAPER_TIMEOUT: float
+    SCRAPER_MAX_BODY_BYTES: int
+    SCRAPER_PARSE_PROCESSES: Union[int, None]
+    SCRAPER_PARSE_QUEUE_SIZE: int
+    PAGE_CACHE: str
+    PAGE_CACHE_PATH: str
+    PAGE_CACHE_MAX_ENTRIES: int
+    PAGE_CACHE_TTL: float
     MAX_SUBTOPICS: int
     MAX_RESEARCH_RESULTS: int
     REPORT_SOURCE: Union[str, None]
@@ -36,10 +45,54 @@ class BaseConfig(TypedDict):
     DEEP_RESEARCH_CONCURRENCY: int
     DEEP_RESEARCH_DEPTH: int
     DEEP_RESEARCH_BREADTH: int
+    DEEP_RESEARCH_TIME_BUDGET: float
+    DEEP_RESEARCH_COST_BUDGET: float
     MCP_SERVERS: List[Dict[str, Any]]
     MCP_AUTO_TOOL_SELECTION: bool
     MCP_USE_LLM_ARGS: bool
     MCP_ALLOWED_ROOT_PATHS: List[str]
     MCP_STRATEGY: str
     REASONING_EFFORT: str
+    RETRIEVER_FANOUT: bool
+    RETRIEVER_TIMEOUT: float
+    RETRIEVER_FANOUT_DEADLINE: float
+    RETRIEVER_FANOUT_MIN_RESULTS: int
+    HTTP_MAX_CONNECTIONS: int
+    HTTP_MAX_CONNECTIONS_PER_HOST: int
+    HTTP_KEEPALIVE_EXPIRY: float
+    HTTP2: bool
+    SEARCH_CACHE: str
+    SEARCH_CACHE_PATH: str
+    SEARCH_CACHE_MAX_ENTRIES: int
+    SEARCH_CACHE_TTL: dict
+    CONTEXT_BATCH_QUERIES: bool
+    LOOP_LAG_THRESHOLD: float
+    LLM_CACHE: str
+    LLM_CACHE_PATH: str
+    LLM_CACHE_MAX_ENTRIES: int
+    LLM_CACHE_TTL: float
+    LLM_CACHE_SEMANTIC_THRESHOLD: float
+    LLM_MAX_RETRIES: int
+    LLM_RETRY_BASE_DELAY: float
+    LLM_RETRY_MAX_DELAY: float
+    LLM_HEDGE: bool
+    LLM_HEDGE_QUANTILE: float
+    LLM_HEDGE_MIN_SAMPLES: int
+    LLM_RATE_LIMITS: dict
+    MODEL_PRICES: dict
+    DETAILED_REPORT_PARALLEL: bool
+    DETAILED_REPORT_MAX_CONCURRENCY: int
+    EMBEDDING_CACHE: str
+    EMBEDDING_CACHE_PATH: str
+    EMBEDDING_CACHE_MAX_ENTRIES: int
+    EMBEDDING_BATCH_SIZE: int
+    EMBEDDING_MAX_CONCURRENCY: int
+    EMBEDDING_MAX_BATCH_TOKENS: int
     CODE_LIBS: str
+    CODE_MAX_PARALLEL_STEPS: int
+    CODE_STEP_CACHE: str
+    CODE_STEP_CACHE_PATH: str
+    CODE_STEP_CACHE_DIR: str
+    CODE_STEP_CACHE_MAX_ENTRIES: int
+    CODE_STEP_CACHE_NAMESPACE: bool
+    NOTEBOOK_FLUSH_INTERVAL: Union[float, None]
@@ -21,8 +21,17 @@ DEFAULT_CONFIG: BaseConfig = {
     "REPORT_FORMAT": "APA",
     "MAX_ITERATIONS": 3,
     "AGENT_ROLE": None,
-    "SCRAPER": "bs",
-    "MAX_SCRAPER_WORKERS": 15,
+    "SCRAPER": "bs",  # "lxml" extracts the same content in a single pass over the page
+    "MAX_SCRAPER_WORKERS": 15,  # Threads running scrapers without an async fetch stage
+    "SCRAPER_MAX_IN_FLIGHT": 100,  # Page downloads in flight for async-fetch scrapers ("bs", "lxml")
+    "SCRAPER_TIMEOUT": 4.0,  # Connect/read timeout per page download, in seconds
+    "SCRAPER_MAX_BODY_BYTES": 5000000,  # Stop reading a page after this many bytes (0 = no limit)
+    "SCRAPER_PARSE_PROCESSES": None,  # Processes parsing fetched pages (None = one per CPU core, 0 = parse in threads)
+    "SCRAPER_PARSE_QUEUE_SIZE": 32,  # Fetched pages waiting to be parsed before downloads pause
+    "PAGE_CACHE": "sqlite",  # Scraped pages reused across runs: "memory", "sqlite" or "none"
+    "PAGE_CACHE_PATH": "./.cache/pages.sqlite",
+    "PAGE_CACHE_MAX_ENTRIES": 20000,  # Least recently used pages are evicted beyond this
+    "PAGE_CACHE_TTL": 86400,  # Seconds a page is reused without revalidation (0 = always revalidate)
     "MAX_SUBTOPICS": 5,
     "MAX_RESEARCH_RESULTS": 5,
     "LANGUAGE": "中文",
@@ -35,7 +44,9 @@ DEFAULT_CONFIG: BaseConfig = {
     # Deep research specific settings
     "DEEP_RESEARCH_BREADTH": 10,
     "DEEP_RESEARCH_DEPTH": 2,
-    "DEEP_RESEARCH_CONCURRENCY": 4,
+    "DEEP_RESEARCH_CONCURRENCY": 4,  # Queries researched at the same time, across all levels
+    "DEEP_RESEARCH_TIME_BUDGET": 0,  # Seconds before queued queries are dropped (0 = no limit)
+    "DEEP_RESEARCH_COST_BUDGET": 0,  # USD before queued queries are dropped (0 = no limit)
     
     # MCP retriever specific settings
     "MCP_SERVERS": [],  # List of predefined MCP server configurations
@@ -44,7 +55,73 @@ DEFAULT_CONFIG: BaseConfig = {
     "MCP_STRATEGY": "fast",  # MCP execution strategy: "fast", "deep", "disabled"
     "REASONING_EFFORT": "medium",
 
+    # Retriever fan-out settings
+    "RETRIEVER_FANOUT": True,  # Run all configured retrievers for a sub-query concurrently
+    "RETRIEVER_TIMEOUT": 20.0,  # Per-retriever timeout in seconds
+    "RETRIEVER_FANOUT_DEADLINE": 30.0,  # Overall deadline in seconds for one fan-out
+    "RETRIEVER_FANOUT_MIN_RESULTS": 0,  # Stop waiting once this many URLs are collected (0 = wait for all)
+
+    # Shared pooled HTTP client settings
+    "HTTP_MAX_CONNECTIONS": 100,
+    "HTTP_MAX_CONNECTIONS_PER_HOST": 10,
+    "HTTP_KEEPALIVE_EXPIRY": 30.0,
+    "HTTP2": True,
+
+    # Search-result cache settings
+    "SEARCH_CACHE": "memory",  # "memory", "sqlite" or "none"
+    "SEARCH_CACHE_PATH": "./.cache/search_results.sqlite",  # Used by the sqlite backend
+    "SEARCH_CACHE_MAX_ENTRIES": 10000,
+    "SEARCH_CACHE_TTL": {"default": 86400},  # Seconds per retriever name, 0 disables caching for it
+
+    # Chunk embedding cache settings
+    "EMBEDDING_CACHE": "memory",  # "memory" (per research), "sqlite" (persisted across runs) or "none"
+    "EMBEDDING_CACHE_PATH": "./.cache/embeddings.sqlite",
+    "EMBEDDING_CACHE_MAX_ENTRIES": 10000,
+
+    # Embedding request batching
+    "EMBEDDING_BATCH_SIZE": 10,  # Texts per request (DashScope accepts at most 10)
+    "EMBEDDING_MAX_CONCURRENCY": 4,  # Batches in flight at the same time
+    "EMBEDDING_MAX_BATCH_TOKENS": 8192,  # Estimated tokens per request
+
+    # Score all sub-queries of a research step against their scraped chunks in one batch
+    "CONTEXT_BATCH_QUERIES": True,
+
+    # Event-loop lag monitor
+    "LOOP_LAG_THRESHOLD": 0.5,  # Log callbacks that hold the event loop longer than this many seconds (0 = off)
+
+    # LLM response cache for deterministic prompts (planning, subtopics, code plans)
+    "LLM_CACHE": "none",  # "memory", "sqlite" or "none"
+    "LLM_CACHE_PATH": "./.cache/llm_responses.sqlite",
+    "LLM_CACHE_MAX_ENTRIES": 5000,
+    "LLM_CACHE_TTL": 0,  # Seconds, 0 keeps entries until evicted
+    "LLM_CACHE_SEMANTIC_THRESHOLD": 0.0,  # Reuse a response for a prompt at least this similar (0 = exact match only)
+
+    # LLM call resilience
+    "LLM_MAX_RETRIES": 4,  # Retries for timeouts, connection errors, 429 and 5xx
+    "LLM_RETRY_BASE_DELAY": 1.0,  # Seconds, doubled per retry with full jitter
+    "LLM_RETRY_MAX_DELAY": 60.0,
+    "LLM_HEDGE": False,  # Fire a second non-streamed request when the first exceeds the model's latency quantile
+    "LLM_HEDGE_QUANTILE": 0.95,
+    "LLM_HEDGE_MIN_SAMPLES": 20,  # Latency samples per model before hedging starts
+
+    # LLM admission control per "provider:model", provider or "default" (0 = unlimited)
+    "LLM_RATE_LIMITS": {"default": {"rpm": 0, "tpm": 0, "concurrency": 16}},
+
+    # Cost accounting: USD per 1M tokens as [input, output] by model-name prefix, overriding utils/costs.py
+    "MODEL_PRICES": {},
+
+    # Detailed reports: research subtopics concurrently, then write their sections in order
+    "DETAILED_REPORT_PARALLEL": True,
+    "DETAILED_REPORT_MAX_CONCURRENCY": 3,  # Subtopics researched at the same time
+
     # Coder specific settings
+    "CODE_MAX_PARALLEL_STEPS": 2,  # Plan steps that only share files run in separate kernels at once (1 = in order)
+    "CODE_STEP_CACHE": "sqlite",  # Reuse results of unchanged steps across runs: "memory", "sqlite" or "none"
+    "CODE_STEP_CACHE_PATH": "./.cache/code_steps.sqlite",
+    "CODE_STEP_CACHE_DIR": "./.cache/code_steps",  # Cached artifact files and pickled variables
+    "CODE_STEP_CACHE_MAX_ENTRIES": 1000,
+    "CODE_STEP_CACHE_NAMESPACE": False,  # Also pickle the variables each step defines instead of re-running it on demand
+    "NOTEBOOK_FLUSH_INTERVAL": 5.0,  # Seconds between full rewrites of the analysis notebook; changes in between go to a journal (None = rewrite on every change)
     "CODE_LIBS": """
     numpy, pandas, scipy,
     matplotlib, seaborn, plotly,
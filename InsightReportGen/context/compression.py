@@ -1,7 +1,11 @@
 import os
 import asyncio
+import logging
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
-from .retriever import SearchAPIRetriever, SectionRetriever
+from .retriever import SectionRetriever, pages_to_documents
 from langchain.retrievers import (
     ContextualCompressionRetriever,
 )
@@ -9,13 +13,19 @@ from langchain.retrievers.document_compressors import (
     DocumentCompressorPipeline,
     EmbeddingsFilter,
 )
+from langchain.schema import Document
 from langchain.text_splitter import RecursiveCharacterTextSplitter
+from .relevance import RelevanceIndex
+from ..config.config import Config
 from ..vector_store import VectorStoreWrapper
-from ..utils.costs import estimate_embedding_cost
+from ..utils.costs import aestimate_embedding_cost
 from ..memory.embeddings import OPENAI_EMBEDDING_MODEL
+from ..memory.embedding_cache import CachedEmbeddings
 from ..prompts import PromptFamily
 from langchain.embeddings.base import Embeddings
 
+logger = logging.getLogger(__name__)
+
 class VectorstoreCompressor:
     def __init__(
         self,
@@ -38,28 +48,156 @@ class VectorstoreCompressor:
         return self.prompt_family.pretty_print_docs(results)
 
 
+def _status_code(error: Exception) -> int | None:
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    return _status_code(error) == 429 or "rate limit" in str(error).lower()
+
+
+def _is_too_large(error: Exception) -> bool:
+    message = str(error).lower()
+    return _status_code(error) == 413 or any(
+        hint in message for hint in ("too many tokens", "maximum context length", "batch size", "too large")
+    )
+
+
+def _retry_after(error: Exception) -> float | None:
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
 class BatchedEmbeddings(Embeddings):
-    def __init__(self, base: Embeddings, batch_size: int = 10):
+    """
+    Sends document embeddings to the provider in batches, several batches at a time.
+
+    Batches hold at most `batch_size` texts and roughly `max_batch_tokens` tokens.
+    A batch the provider rejects as too large is split in half. Rate-limited
+    batches (429) are retried with exponential backoff. The output order always
+    matches the input order.
+    """
+
+    def __init__(
+        self,
+        base: Embeddings,
+        batch_size: int | None = None,
+        max_concurrency: int | None = None,
+        max_batch_tokens: int | None = None,
+        max_retries: int = 5,
+        cfg: Config | None = None,
+    ):
         self.base = base
-        self.batch_size = batch_size
+        self.batch_size = batch_size or Config.get_setting("EMBEDDING_BATCH_SIZE", cfg)
+        self.max_concurrency = max_concurrency or Config.get_setting("EMBEDDING_MAX_CONCURRENCY", cfg)
+        self.max_batch_tokens = max_batch_tokens or Config.get_setting("EMBEDDING_MAX_BATCH_TOKENS", cfg)
+        self.max_retries = max_retries
 
     # query 一般只有一条，不需要分批
     def embed_query(self, text: str) -> list[float]:
         return self.base.embed_query(text)
 
-    # 文档嵌入统一分批（同步）
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        # 粗略估计：英文约 4 字节/token，中文约 3 字节/token，按 3 字节估算偏保守
+        return len(text.encode("utf-8")) // 3 + 1
+
+    def _make_batches(self, texts: list[str]) -> list[list[str]]:
+        """按条数和 token 上限切分批次"""
+        batches, batch, batch_tokens = [], [], 0
+        for text in texts:
+            tokens = self._estimate_tokens(text)
+            if batch and (len(batch) >= self.batch_size or batch_tokens + tokens > self.max_batch_tokens):
+                batches.append(batch)
+                batch, batch_tokens = [], 0
+            batch.append(text)
+            batch_tokens += tokens
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _backoff(self, error: Exception, attempt: int) -> float:
+        retry_after = _retry_after(error)
+        if retry_after is not None:
+            return retry_after
+        return min(2 ** attempt, 30) * (0.5 + random.random() / 2)
+
+    # 单个批次（同步）：429 退避重试，批次过大则对半拆分
+    def _embed_batch(self, batch: list[str]) -> list[list[float]]:
+        for attempt in range(self.max_retries + 1):
+            try:
+                return self.base.embed_documents(batch)
+            except Exception as e:
+                if _is_too_large(e) and len(batch) > 1:
+                    middle = len(batch) // 2
+                    return self._embed_batch(batch[:middle]) + self._embed_batch(batch[middle:])
+                if not _is_rate_limited(e) or attempt == self.max_retries:
+                    raise
+                delay = self._backoff(e, attempt)
+                logger.warning(f"Embedding request rate limited, retrying in {delay:.1f}s")
+                time.sleep(delay)
+
+    # 单个批次（异步）
+    async def _aembed_batch(self, batch: list[str]) -> list[list[float]]:
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await self.base.aembed_documents(batch)
+            except Exception as e:
+                if _is_too_large(e) and len(batch) > 1:
+                    middle = len(batch) // 2
+                    first, second = await asyncio.gather(
+                        self._aembed_batch(batch[:middle]), self._aembed_batch(batch[middle:])
+                    )
+                    return first + second
+                if not _is_rate_limited(e) or attempt == self.max_retries:
+                    raise
+                delay = self._backoff(e, attempt)
+                logger.warning(f"Embedding request rate limited, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+    # 文档嵌入统一分批（同步），多个批次并发发送，结果按输入顺序拼接
     def embed_documents(self, texts: list[str]) -> list[list[float]]:
-        out: list[list[float]] = []
-        for i in range(0, len(texts), self.batch_size):
-            out.extend(self.base.embed_documents(texts[i:i + self.batch_size]))
-        return out
+        batches = self._make_batches(texts)
+        if len(batches) <= 1 or self.max_concurrency <= 1:
+            results = [self._embed_batch(batch) for batch in batches]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(batches))) as executor:
+                results = list(executor.map(self._embed_batch, batches))
+        return [vector for batch_vectors in results for vector in batch_vectors]
 
     # 文档嵌入统一分批（异步，如你的流水线用到异步）
     async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
-        out: list[list[float]] = []
-        for i in range(0, len(texts), self.batch_size):
-            out.extend(await self.base.aembed_documents(texts[i:i + self.batch_size]))
-        return out
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(batch):
+            async with semaphore:
+                return await self._aembed_batch(batch)
+
+        results = await asyncio.gather(*[run(batch) for batch in self._make_batches(texts)])
+        return [vector for batch_vectors in results for vector in batch_vectors]
+
+
+def _track_embedded_texts(embeddings):
+    """
+    Bind cached embeddings to a list collecting the texts that missed the cache.
+
+    Returns (None, embeddings) for uncached embeddings, whose cost covers every document.
+    """
+    if not isinstance(embeddings, CachedEmbeddings):
+        return None, embeddings
+    embedded_texts = []
+    return embedded_texts, embeddings.bind(on_embed=embedded_texts.extend)
+
+
+def _embedding_model_name(embeddings) -> str:
+    base = embeddings.base if isinstance(embeddings, CachedEmbeddings) else embeddings
+    return getattr(base, "model", None) or OPENAI_EMBEDDING_MODEL
 
 
 class ContextCompressor:
@@ -69,49 +207,62 @@ class ContextCompressor:
         embeddings,
         max_results=5,
         prompt_family: type[PromptFamily] | PromptFamily = PromptFamily,
+        cfg: Config | None = None,
         **kwargs,
     ):
         self.max_results = max_results
         self.documents = documents
         self.kwargs = kwargs
+        self.cfg = cfg
         self.embeddings = embeddings
-        self.similarity_threshold = os.environ.get("SIMILARITY_THRESHOLD", 0.35)
+        self.similarity_threshold = float(os.environ.get("SIMILARITY_THRESHOLD", 0.35))
         self.prompt_family = prompt_family
 
-    def __get_contextual_retriever(self):
+    def _split_pages(self) -> list[Document]:
         splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100)
-        batched_embeddings = BatchedEmbeddings(self.embeddings, batch_size=10)
-        relevance_filter = EmbeddingsFilter(embeddings=batched_embeddings,
-                                            similarity_threshold=self.similarity_threshold)
-        pipeline_compressor = DocumentCompressorPipeline(
-            transformers=[splitter, relevance_filter]
-        )
-        base_retriever = SearchAPIRetriever(
-            pages=self.documents
-        )
-        contextual_retriever = ContextualCompressionRetriever(
-            base_compressor=pipeline_compressor, base_retriever=base_retriever
-        )
-        return contextual_retriever
+        return splitter.split_documents(pages_to_documents(self.documents))
+
+    def build_index(self, embeddings=None) -> RelevanceIndex:
+        """Split the pages and index their chunk embeddings."""
+        batched_embeddings = BatchedEmbeddings(embeddings or self.embeddings, cfg=self.cfg)
+        return RelevanceIndex.from_documents(self._split_pages(), batched_embeddings)
+
+    def _get_relevant_documents(self, queries: list[str], max_results, embeddings) -> list[list[Document]]:
+        index = self.build_index(embeddings)
+        if not len(index):
+            return [[] for _ in queries]
+        if len(queries) == 1:
+            query_embeddings = [embeddings.embed_query(queries[0])]
+        else:
+            # All queries go out in one request and are scored in one matrix multiply
+            query_embeddings = BatchedEmbeddings(embeddings, cfg=self.cfg).embed_documents(queries)
+        return index.search(query_embeddings, k=max_results, similarity_threshold=self.similarity_threshold)
 
     async def async_get_context(self, query, max_results=5, cost_callback=None):
-        compressed_docs = self.__get_contextual_retriever()
+        contexts = await self.async_get_contexts([query], max_results=max_results, cost_callback=cost_callback)
+        return contexts[0]
+
+    async def async_get_contexts(self, queries: list[str], max_results=5, cost_callback=None) -> list[str]:
+        """Get the relevant context of every query, splitting and embedding the pages only once."""
+        embedded_texts, embeddings = _track_embedded_texts(self.embeddings)
+        relevant_docs = await asyncio.to_thread(self._get_relevant_documents, queries, max_results, embeddings)
         if cost_callback:
-            cost_callback(estimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=self.documents))
-        relevant_docs = await asyncio.to_thread(compressed_docs.invoke, query, **self.kwargs)
-        return self.prompt_family.pretty_print_docs(relevant_docs, max_results)
+            docs = self.documents if embedded_texts is None else embedded_texts
+            cost_callback(await aestimate_embedding_cost(model=_embedding_model_name(self.embeddings), docs=docs))
+        return [self.prompt_family.pretty_print_docs(docs, max_results) for docs in relevant_docs]
 
 
 class WrittenContentCompressor:
-    def __init__(self, documents, embeddings, similarity_threshold, **kwargs):
+    def __init__(self, documents, embeddings, similarity_threshold, cfg: Config | None = None, **kwargs):
         self.documents = documents
         self.kwargs = kwargs
+        self.cfg = cfg
         self.embeddings = embeddings
         self.similarity_threshold = similarity_threshold
 
-    def __get_contextual_retriever(self):
+    def __get_contextual_retriever(self, embeddings):
         splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100)
-        batched_embeddings = BatchedEmbeddings(self.embeddings, batch_size=10)
+        batched_embeddings = BatchedEmbeddings(embeddings, cfg=self.cfg)
         relevance_filter = EmbeddingsFilter(embeddings=batched_embeddings,
                                             similarity_threshold=self.similarity_threshold)
         pipeline_compressor = DocumentCompressorPipeline(
@@ -129,8 +280,10 @@ class WrittenContentCompressor:
         return [f"Title: {d.metadata.get('section_title')}\nContent: {d.page_content}\n" for i, d in enumerate(docs) if i < top_n]
 
     async def async_get_context(self, query, max_results=5, cost_callback=None):
-        compressed_docs = self.__get_contextual_retriever()
-        if cost_callback:
-            cost_callback(estimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=self.documents))
+        embedded_texts, embeddings = _track_embedded_texts(self.embeddings)
+        compressed_docs = self.__get_contextual_retriever(embeddings)
         relevant_docs = await asyncio.to_thread(compressed_docs.invoke, query, **self.kwargs)
+        if cost_callback:
+            docs = self.documents if embedded_texts is None else embedded_texts
+            cost_callback(await aestimate_embedding_cost(model=_embedding_model_name(self.embeddings), docs=docs))
         return self.__pretty_docs_list(relevant_docs, max_results)
@@ -0,0 +1,71 @@
+"""
+Vectorized relevance filter for page chunks.
+
+Replaces LangChain's EmbeddingsFilter for ContextCompressor: chunk embeddings are
+kept in one contiguous, L2-normalized float32 matrix, so cosine similarity for any
+number of queries is a single matrix multiply, and top-k uses argpartition instead
+of a full sort.
+"""
+import numpy as np
+from langchain.schema import Document
+
+
+def _normalize(vectors) -> np.ndarray:
+    matrix = np.ascontiguousarray(vectors, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class RelevanceIndex:
+    """Chunks and their normalized embeddings, scored against queries by cosine similarity."""
+
+    def __init__(self, documents: list[Document], embeddings):
+        self.documents = documents
+        self.matrix = _normalize(embeddings) if documents else np.empty((0, 0), dtype=np.float32)
+
+    @classmethod
+    def from_documents(cls, documents: list[Document], embeddings) -> "RelevanceIndex":
+        """Embed the documents with a LangChain embeddings model and index them."""
+        if not documents:
+            return cls([], [])
+        vectors = embeddings.embed_documents([doc.page_content for doc in documents])
+        return cls(documents, vectors)
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def search(self, query_embeddings, k: int, similarity_threshold: float) -> list[list[Document]]:
+        """
+        Get the most similar chunks for each query.
+
+        Matches EmbeddingsFilter: the top k chunks by descending similarity, keeping
+        only those strictly above the threshold.
+
+        Args:
+            query_embeddings: One query vector, or a matrix with one row per query.
+            k (int): Maximum number of chunks per query.
+            similarity_threshold (float): Minimum cosine similarity.
+
+        Returns:
+            list[list[Document]]: The relevant chunks for each query.
+        """
+        queries = _normalize(query_embeddings)
+        if not self.documents or k <= 0:
+            return [[] for _ in range(len(queries))]
+
+        scores = queries @ self.matrix.T
+        k = min(k, len(self.documents))
+        if k < len(self.documents):
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        else:
+            top = np.broadcast_to(np.arange(k), (len(queries), k))
+
+        results = []
+        for row_scores, row_top in zip(scores, top):
+            row_top = row_top[np.argsort(-row_scores[row_top], kind="stable")]
+            row_top = row_top[row_scores[row_top] > similarity_threshold]
+            results.append([self.documents[i] for i in row_top])
+        return results
@@ -7,6 +7,20 @@ from langchain.schema import Document
 from langchain.schema.retriever import BaseRetriever
 
 
+def pages_to_documents(pages: List[Dict]) -> List[Document]:
+    """Convert scraped pages to LangChain documents"""
+    return [
+        Document(
+            page_content=page.get("raw_content", ""),
+            metadata={
+                "title": page.get("title", ""),
+                "source": page.get("url", ""),
+            },
+        )
+        for page in pages
+    ]
+
+
 class SearchAPIRetriever(BaseRetriever):
     """Search API retriever."""
     pages: List[Dict] = []
@@ -15,18 +29,7 @@ class SearchAPIRetriever(BaseRetriever):
         self, query: str, *, run_manager: CallbackManagerForRetrieverRun
     ) -> List[Document]:
 
-        docs = [
-            Document(
-                page_content=page.get("raw_content", ""),
-                metadata={
-                    "title": page.get("title", ""),
-                    "source": page.get("url", ""),
-                },
-            )
-            for page in self.pages
-        ]
-
-        return docs
+        return pages_to_documents(self.pages)
 
 class SectionRetriever(BaseRetriever):
     """
@@ -1,5 +1,14 @@
 from .generic import GenericLLMProvider
+from .registry import get_provider, close_llm_providers
+from .resilience import call_with_retry, get_latency_stats
+from .scheduler import LLMPriority, get_scheduler_stats
 
 __all__ = [
     "GenericLLMProvider",
+    "get_provider",
+    "close_llm_providers",
+    "call_with_retry",
+    "get_latency_stats",
+    "LLMPriority",
+    "get_scheduler_stats",
 ]
@@ -10,6 +10,8 @@ from colorama import Fore, Style, init
 import os
 from enum import Enum
 
+from ...utils.costs import get_token_usage
+
 _SUPPORTED_PROVIDERS = {
     "openai",
     "anthropic",
@@ -245,23 +247,34 @@ class GenericLLMProvider:
 
 
     async def get_chat_response(self, messages, stream, websocket=None, **kwargs):
+        res, _ = await self.get_chat_completion(messages, stream, websocket, **kwargs)
+        return res
+
+    async def get_chat_completion(self, messages, stream, websocket=None, **kwargs) -> tuple[str, dict | None]:
+        """Like get_chat_response, but also returns the token usage reported by the provider (None if not reported)."""
         if not stream:
             # Getting output from the model chain using ainvoke for asynchronous invoking
             output = await self.llm.ainvoke(messages, **kwargs)
 
             res = output.content
+            usage = get_token_usage(output)
 
         else:
-            res = await self.stream_response(messages, websocket, **kwargs)
+            res, usage = await self._stream_response_with_usage(messages, websocket, **kwargs)
 
         if self.chat_logger:
             await self.chat_logger.log_request(messages, res)
 
-        return res
+        return res, usage
 
     async def stream_response(self, messages, websocket=None, **kwargs):
+        response, _ = await self._stream_response_with_usage(messages, websocket, **kwargs)
+        return response
+
+    async def _stream_response_with_usage(self, messages, websocket=None, **kwargs):
         paragraph = ""
         response = ""
+        usage = None
 
         # Streaming the response using the chain astream method from langchain
         async for chunk in self.llm.astream(messages, **kwargs):
@@ -273,10 +286,17 @@ class GenericLLMProvider:
                     await self._send_output(paragraph, websocket)
                     paragraph = ""
 
+            # Providers report usage on the first and/or last chunk
+            chunk_usage = get_token_usage(chunk)
+            if chunk_usage:
+                usage = usage or {"input_tokens": 0, "output_tokens": 0}
+                usage["input_tokens"] += chunk_usage["input_tokens"]
+                usage["output_tokens"] += chunk_usage["output_tokens"]
+
         if paragraph:
             await self._send_output(paragraph, websocket)
 
-        return response
+        return response, usage
 
     async def _send_output(self, content, websocket=None):
         if websocket is not None:
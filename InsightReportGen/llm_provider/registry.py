@@ -0,0 +1,92 @@
+"""
+Process-wide registry of LLM providers.
+
+Every `GenericLLMProvider.from_provider` call builds a new chat model, and with it a
+new HTTP client and connection pool. The registry hands out one provider per
+(provider, model, kwargs fingerprint) and event loop, so warmed clients and their
+connections are reused for the life of the process.
+"""
+import asyncio
+import inspect
+import logging
+import threading
+import weakref
+from typing import Any
+
+from .generic.base import GenericLLMProvider
+from ..utils.cache import make_cache_key
+
+logger = logging.getLogger(__name__)
+
+# Async HTTP clients are bound to the loop that opened their connections, so
+# providers are kept per event loop. Providers built outside a loop share one table.
+_loop_providers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, GenericLLMProvider]]" = \
+    weakref.WeakKeyDictionary()
+_sync_providers: dict[str, GenericLLMProvider] = {}
+_lock = threading.Lock()
+
+# Attributes under which the LangChain chat models keep their SDK clients
+_CLIENT_ATTRIBUTES = ("root_async_client", "root_client", "_async_client", "_client", "async_client", "client")
+
+
+def _providers_for_running_loop() -> dict[str, GenericLLMProvider]:
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return _sync_providers
+    providers = _loop_providers.get(loop)
+    if providers is None:
+        providers = _loop_providers[loop] = {}
+    return providers
+
+
+def get_provider(provider: str, **kwargs: Any) -> GenericLLMProvider:
+    """
+    Get a shared provider for the given settings, building it on first use.
+
+    Args:
+        provider (str): The provider name, e.g. "openai".
+        **kwargs: Arguments for `GenericLLMProvider.from_provider` (model, temperature, ...).
+
+    Returns:
+        GenericLLMProvider: The shared provider.
+    """
+    key = make_cache_key(provider, kwargs)
+    with _lock:
+        providers = _providers_for_running_loop()
+        instance = providers.get(key)
+    if instance is not None:
+        return instance
+
+    instance = GenericLLMProvider.from_provider(provider, **dict(kwargs))
+    with _lock:
+        return providers.setdefault(key, instance)
+
+
+async def _close_provider(provider: GenericLLMProvider) -> None:
+    closed = set()
+    for attribute in _CLIENT_ATTRIBUTES:
+        client = getattr(provider.llm, attribute, None)
+        close = getattr(client, "close", None) or getattr(client, "aclose", None)
+        if client is None or id(client) in closed or not callable(close):
+            continue
+        closed.add(id(client))
+        try:
+            result = close()
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.debug(f"Error closing {type(provider.llm).__name__} client: {e}")
+
+
+async def close_llm_providers() -> None:
+    """Close the providers of the running event loop and those built outside a loop. Meant for shutdown hooks."""
+    with _lock:
+        providers = list(_loop_providers.pop(asyncio.get_running_loop(), {}).values())
+        providers.extend(_sync_providers.values())
+        _sync_providers.clear()
+
+    for provider in providers:
+        await _close_provider(provider)
+    if providers:
+        logger.info(f"Closed {len(providers)} cached LLM providers")
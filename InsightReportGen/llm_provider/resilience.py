@@ -0,0 +1,253 @@
+"""
+Retries and hedged requests for LLM calls.
+
+Transient failures (timeouts, connection errors, 408/409/425/429/5xx) are retried
+with exponential backoff and full jitter, honouring `Retry-After`. Optionally a
+second, identical request is fired when the first has not returned after the
+model's observed p95 latency, and whichever finishes first wins. Latencies are
+recorded per model in log-bucketed histograms, which feed the hedge delay.
+"""
+import asyncio
+import logging
+import math
+import random
+import threading
+import time
+from contextlib import nullcontext
+from typing import Any, AsyncContextManager, Awaitable, Callable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+RETRYABLE_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504, 529}
+
+# Exception class names used by the OpenAI/Anthropic/httpx SDKs for transient failures
+_RETRYABLE_ERROR_HINTS = ("Timeout", "Connection", "RateLimit", "ServiceUnavailable", "InternalServer", "Overloaded")
+
+
+def _status_code(error: Exception) -> int | None:
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status
+
+
+def _retry_after(error: Exception) -> float | None:
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        return max(float(headers.get("retry-after")), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def is_retryable(error: Exception) -> bool:
+    """Whether an LLM call that raised `error` may succeed when repeated."""
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError, ConnectionError)):
+        return True
+    status = _status_code(error)
+    if status is not None:
+        return status in RETRYABLE_STATUS_CODES
+    name = type(error).__name__
+    return any(hint in name for hint in _RETRYABLE_ERROR_HINTS)
+
+
+def backoff_delay(error: Exception, attempt: int, base_delay: float, max_delay: float) -> float:
+    """Delay before retry `attempt` (0-based): `Retry-After` if sent, else exponential backoff with full jitter."""
+    retry_after = _retry_after(error)
+    if retry_after is not None:
+        return min(retry_after, max_delay)
+    return random.uniform(0, min(base_delay * 2 ** attempt, max_delay))
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram: bounded memory, quantiles accurate to one bucket (~12%)."""
+
+    MIN_LATENCY = 0.05
+    GROWTH = 1.125
+    NUM_BUCKETS = 100  # Up to ~6 minutes
+
+    def __init__(self):
+        self.counts = [0] * self.NUM_BUCKETS
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def _bucket(self, seconds: float) -> int:
+        if seconds <= self.MIN_LATENCY:
+            return 0
+        index = int(math.log(seconds / self.MIN_LATENCY, self.GROWTH)) + 1
+        return min(index, self.NUM_BUCKETS - 1)
+
+    def _upper_bound(self, bucket: int) -> float:
+        return self.MIN_LATENCY * self.GROWTH ** bucket
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self.counts[self._bucket(seconds)] += 1
+            self.count += 1
+
+    def quantile(self, q: float) -> float | None:
+        """The upper bound of the bucket holding the q-quantile, or None without samples."""
+        with self._lock:
+            if not self.count:
+                return None
+            rank = q * self.count
+            seen = 0
+            for bucket, count in enumerate(self.counts):
+                seen += count
+                if seen >= rank:
+                    return self._upper_bound(bucket)
+            return self._upper_bound(self.NUM_BUCKETS - 1)
+
+
+_histograms: dict[str, LatencyHistogram] = {}
+_histograms_lock = threading.Lock()
+
+
+def get_latency_histogram(model: str) -> LatencyHistogram:
+    with _histograms_lock:
+        histogram = _histograms.get(model)
+        if histogram is None:
+            histogram = _histograms[model] = LatencyHistogram()
+        return histogram
+
+
+def get_latency_stats() -> dict[str, dict[str, Any]]:
+    """Sample count and p50/p95 latency (seconds) per model."""
+    with _histograms_lock:
+        histograms = dict(_histograms)
+    return {
+        model: {"count": h.count, "p50": h.quantile(0.5), "p95": h.quantile(0.95)}
+        for model, h in histograms.items()
+    }
+
+
+async def _timed(
+    call: Callable[[], Awaitable[T]],
+    histogram: LatencyHistogram,
+    record_cancelled: bool = True,
+    admit: Callable[[], AsyncContextManager] | None = None,
+    admitted: asyncio.Event | None = None,
+) -> T:
+    """
+    Await `call()` and record its latency.
+
+    With `admit`, the call first waits for admission (e.g. a rate-limit slot) and only the time
+    after admission is recorded; `admitted` is set once it is admitted. Queueing says nothing
+    about the model's latency.
+
+    Calls that time out or are cancelled are recorded with the time they had taken so far, a lower
+    bound of their latency; leaving them out would make slow requests vanish from the histogram.
+    Other failures are not latency samples. A hedge cancelled because the primary won says nothing
+    new, so hedges pass record_cancelled=False.
+    """
+    async with admit() if admit is not None else nullcontext():
+        if admitted is not None:
+            admitted.set()
+        start = time.perf_counter()
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            if record_cancelled:
+                histogram.record(time.perf_counter() - start)
+            raise
+        except (asyncio.TimeoutError, TimeoutError):
+            histogram.record(time.perf_counter() - start)
+            raise
+        histogram.record(time.perf_counter() - start)
+        return result
+
+
+async def _hedged(
+    call: Callable[[], Awaitable[T]],
+    histogram: LatencyHistogram,
+    delay: float,
+    model: str,
+    admit: Callable[[], AsyncContextManager] | None = None,
+) -> T:
+    admitted = asyncio.Event()
+    primary = asyncio.ensure_future(_timed(call, histogram, admit=admit, admitted=admitted))
+    admission = asyncio.ensure_future(admitted.wait())
+    tasks = [primary, admission]
+    try:
+        # The hedge delay runs from admission: a request still queued for a slot is not slow,
+        # and a hedge would only join the same queue
+        await asyncio.wait([primary, admission], return_when=asyncio.FIRST_COMPLETED)
+        done, _ = await asyncio.wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+
+        logger.debug(f"Hedging {model} request after {delay:.2f}s")
+        hedge = asyncio.ensure_future(_timed(call, histogram, record_cancelled=False, admit=admit))
+        tasks.append(hedge)
+        first_error = None
+        pending = {primary, hedge}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                first_error = first_error or task.exception()
+        raise first_error
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+async def call_with_retry(
+    call: Callable[[], Awaitable[T]],
+    model: str,
+    hedge: bool | None = None,
+    max_retries: int | None = None,
+    can_retry: Callable[[], bool] | None = None,
+    admit: Callable[[], AsyncContextManager] | None = None,
+) -> T:
+    """
+    Await `call()`, retrying transient failures and optionally hedging slow attempts.
+
+    Args:
+        call: Starts one request; called again for every retry and hedge.
+        model (str): Latency histogram key, e.g. "openai:gpt-4o". Calls with very different
+            latency profiles, such as streamed ones, should use their own key.
+        hedge (bool | None): Fire a second request after the model's hedge delay. Only
+            use for calls without side effects such as streaming to a websocket.
+            Defaults to LLM_HEDGE.
+        max_retries (int | None): Defaults to LLM_MAX_RETRIES.
+        can_retry (Callable[[], bool] | None): Checked after a failed attempt; return False once
+            the attempt had effects a retry would repeat, e.g. output already streamed.
+        admit (Callable[[], AsyncContextManager] | None): Admission every attempt, retry and hedge
+            waits for before it starts, e.g. a rate-limit slot. The wait is not counted as latency.
+
+    Returns:
+        The result of the first successful attempt.
+    """
+    from ..config.config import Config
+
+    if hedge is None:
+        hedge = Config.get_setting("LLM_HEDGE")
+    if max_retries is None:
+        max_retries = Config.get_setting("LLM_MAX_RETRIES")
+    base_delay = Config.get_setting("LLM_RETRY_BASE_DELAY")
+    max_delay = Config.get_setting("LLM_RETRY_MAX_DELAY")
+    histogram = get_latency_histogram(model)
+
+    for attempt in range(max_retries + 1):
+        try:
+            hedge_delay = _hedge_delay(histogram, Config) if hedge else None
+            if hedge_delay is None:
+                return await _timed(call, histogram, admit=admit)
+            return await _hedged(call, histogram, hedge_delay, model, admit=admit)
+        except Exception as e:
+            if attempt == max_retries or not is_retryable(e) or (can_retry is not None and not can_retry()):
+                raise
+            delay = backoff_delay(e, attempt, base_delay, max_delay)
+            logger.warning(f"{model} request failed ({type(e).__name__}: {e}), "
+                           f"retry {attempt + 1}/{max_retries} in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+
+def _hedge_delay(histogram: LatencyHistogram, config_cls) -> float | None:
+    if histogram.count < config_cls.get_setting("LLM_HEDGE_MIN_SAMPLES"):
+        return None
+    return histogram.quantile(config_cls.get_setting("LLM_HEDGE_QUANTILE"))
@@ -0,0 +1,283 @@
+"""
+Process-wide admission control for LLM calls.
+
+Each (provider, model) gets one scheduler with a concurrency cap and
+requests-per-minute / tokens-per-minute token buckets, configured by
+LLM_RATE_LIMITS. Waiting calls are admitted by priority class (report writing,
+then summaries, then planning) and, within a class, round-robin across research
+jobs, so one large job cannot starve the others.
+
+Scheduler state is guarded by a thread lock and waiters are woken on their own
+event loop, so researchers running on different loops share the same budget.
+"""
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager, contextmanager
+from enum import IntEnum
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class LLMPriority(IntEnum):
+    """Admission order for queued LLM calls, highest first."""
+    REPORT = 0
+    SUMMARY = 1
+    PLANNING = 2
+
+
+_research_job: contextvars.ContextVar[str] = contextvars.ContextVar("llm_research_job", default="default")
+
+
+@contextmanager
+def research_job(job_id: str | None = None):
+    """Tag LLM calls made inside the block (and tasks it spawns) with a research job id."""
+    job_id = job_id or uuid.uuid4().hex[:12]
+    token = _research_job.set(job_id)
+    try:
+        yield job_id
+    finally:
+        _research_job.reset(token)
+
+
+def estimate_tokens(messages, max_tokens: int | None = None) -> int:
+    """Rough prompt size (~4 characters per token) plus the completion budget, as providers count it for TPM."""
+    if isinstance(messages, str):
+        characters = len(messages)
+    else:
+        characters = sum(len(str(m.get("content", "")) if isinstance(m, dict) else str(m)) for m in messages)
+    return characters // 4 + 1 + (max_tokens or 0)
+
+
+class _TokenBucket:
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until `amount` is available; amounts above capacity only need a full bucket."""
+        missing = min(amount, self.capacity) - self.level
+        return max(missing / self.rate, 0.0)
+
+    def take(self, amount: float) -> None:
+        self.level -= min(amount, self.capacity)
+
+
+class _Waiter:
+    __slots__ = ("loop", "future", "tokens", "job", "priority", "enqueued", "granted")
+
+    def __init__(self, loop, tokens: int, job: str, priority: int):
+        self.loop = loop
+        self.future = loop.create_future()
+        self.tokens = tokens
+        self.job = job
+        self.priority = priority
+        self.enqueued = time.monotonic()
+        self.granted = False
+
+
+def _wake(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class LLMScheduler:
+    """Concurrency cap plus RPM/TPM budgets for one (provider, model), with fair priority queuing."""
+
+    def __init__(self, name: str, rpm: float = 0, tpm: float = 0, max_concurrency: int = 0):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self._requests = _TokenBucket(rpm) if rpm else None
+        self._tokens = _TokenBucket(tpm) if tpm else None
+        self._lock = threading.Lock()
+        # priority -> job -> waiters; jobs rotate to the back once served
+        self._queues: dict[int, OrderedDict[str, deque[_Waiter]]] = {p: OrderedDict() for p in LLMPriority}
+        self._wakeup_at: float | None = None
+        self.in_flight = 0
+        self.admitted = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _queue_depths(self) -> dict[str, int]:
+        return {
+            LLMPriority(p).name.lower(): sum(len(waiters) for waiters in jobs.values())
+            for p, jobs in self._queues.items()
+        }
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "in_flight": self.in_flight,
+                "queued": self._queue_depths(),
+                "admitted": self.admitted,
+                "avg_wait": self.total_wait / self.admitted if self.admitted else 0.0,
+                "max_wait": self.max_wait,
+            }
+
+    def _has_waiters(self) -> bool:
+        return any(self._queues.values())
+
+    def _next_waiter(self) -> _Waiter | None:
+        for priority in LLMPriority:
+            jobs = self._queues[priority]
+            if jobs:
+                return jobs[next(iter(jobs))][0]
+        return None
+
+    def _pop_waiter(self, waiter: _Waiter) -> None:
+        jobs = self._queues[waiter.priority]
+        waiters = jobs[waiter.job]
+        waiters.popleft()
+        if waiters:
+            jobs.move_to_end(waiter.job)
+        else:
+            del jobs[waiter.job]
+
+    def _remove_waiter(self, waiter: _Waiter) -> None:
+        jobs = self._queues[waiter.priority]
+        waiters = jobs.get(waiter.job)
+        if waiters is not None and waiter in waiters:
+            waiters.remove(waiter)
+            if not waiters:
+                del jobs[waiter.job]
+
+    def _admit_delay(self, tokens: int, now: float) -> float | None:
+        """None if a call can't start until a slot frees up, else seconds until the budgets allow it."""
+        if self.max_concurrency and self.in_flight >= self.max_concurrency:
+            return None
+        delay = 0.0
+        for bucket, amount in ((self._requests, 1), (self._tokens, tokens)):
+            if bucket is not None:
+                bucket.refill(now)
+                delay = max(delay, bucket.wait_time(amount))
+        return delay
+
+    def _admit(self, tokens: int, enqueued: float, now: float) -> None:
+        if self._requests is not None:
+            self._requests.take(1)
+        if self._tokens is not None:
+            self._tokens.take(tokens)
+        self.in_flight += 1
+        self.admitted += 1
+        wait = now - enqueued
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+    def _dispatch(self) -> None:
+        """Admit queued calls in order until one has to wait; schedule a wake-up for budget refills."""
+        with self._lock:
+            self._wakeup_at = None
+            while True:
+                waiter = self._next_waiter()
+                if waiter is None:
+                    return
+                now = time.monotonic()
+                delay = self._admit_delay(waiter.tokens, now)
+                if delay is None:
+                    return
+                if delay > 0:
+                    self._wakeup_at = now + delay
+                    waiter.loop.call_soon_threadsafe(waiter.loop.call_later, delay, self._dispatch)
+                    return
+                self._pop_waiter(waiter)
+                self._admit(waiter.tokens, waiter.enqueued, now)
+                waiter.granted = True
+                waiter.loop.call_soon_threadsafe(_wake, waiter.future)
+
+    async def acquire(self, tokens: int, priority: LLMPriority = LLMPriority.SUMMARY) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if not self._has_waiters() and self._admit_delay(tokens, now) == 0:
+                self._admit(tokens, now, now)
+                return
+            waiter = _Waiter(asyncio.get_running_loop(), tokens, _research_job.get(), int(priority))
+            self._queues[waiter.priority].setdefault(waiter.job, deque()).append(waiter)
+            schedule = self._wakeup_at is None
+
+        if schedule:
+            self._dispatch()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            with self._lock:
+                granted = waiter.granted
+                if not granted:
+                    self._remove_waiter(waiter)
+            if granted:
+                self.release()
+            raise
+
+    def release(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            schedule = self._wakeup_at is None
+        if schedule:
+            self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, tokens: int, priority: LLMPriority = LLMPriority.SUMMARY):
+        await self.acquire(tokens, priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+
+_schedulers: dict[str, LLMScheduler | None] = {}
+_schedulers_lock = threading.Lock()
+
+
+def _limits_for(provider: str, model: str) -> dict[str, float]:
+    from ..config.config import Config
+
+    limits = Config.get_setting("LLM_RATE_LIMITS") or {}
+    for key in (f"{provider}:{model}", provider, "default"):
+        if key in limits:
+            return limits[key] or {}
+    return {}
+
+
+def get_scheduler(provider: str, model: str) -> LLMScheduler | None:
+    """
+    Get the shared scheduler for a provider and model.
+
+    Returns:
+        LLMScheduler | None: The scheduler, or None when no limits are configured for it.
+    """
+    name = f"{provider}:{model}"
+    with _schedulers_lock:
+        if name not in _schedulers:
+            limits = _limits_for(provider, model)
+            rpm, tpm = limits.get("rpm", 0), limits.get("tpm", 0)
+            concurrency = limits.get("concurrency", 0)
+            _schedulers[name] = LLMScheduler(name, rpm, tpm, concurrency) if rpm or tpm or concurrency else None
+        return _schedulers[name]
+
+
+@asynccontextmanager
+async def llm_slot(provider: str, model: str, tokens: int, priority: LLMPriority = LLMPriority.SUMMARY):
+    """Wait for admission of one LLM call under the (provider, model) budgets."""
+    scheduler = get_scheduler(provider, model)
+    if scheduler is None:
+        yield
+        return
+    async with scheduler.slot(tokens, priority):
+        yield
+
+
+def get_scheduler_stats() -> dict[str, dict[str, Any]]:
+    """In-flight calls, queue depth per priority class and admission wait times per (provider, model)."""
+    with _schedulers_lock:
+        schedulers = [s for s in _schedulers.values() if s is not None]
+    return {scheduler.name: scheduler.stats() for scheduler in schedulers}
@@ -142,6 +142,7 @@ class MCPToolSelector:
             
         try:
             from ..utils.llm import create_chat_completion
+            from ..llm_provider.scheduler import LLMPriority
             
             # Create messages for the LLM
             messages = [{"role": "user", "content": prompt}]
@@ -152,6 +153,7 @@ class MCPToolSelector:
                 messages=messages,
                 temperature=0.0,  # Low temperature for consistent tool selection
                 llm_provider=self.cfg.strategic_llm_provider,
+                priority=LLMPriority.PLANNING,
                 llm_kwargs=self.cfg.llm_kwargs,
                 cost_callback=self.researcher.add_costs if self.researcher and hasattr(self.researcher, 'add_costs') else None,
             )
@@ -1 +1,2 @@
 from .embeddings import Memory
+from .embedding_cache import CachedEmbeddings, get_embedding_cache
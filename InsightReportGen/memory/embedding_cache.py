@@ -0,0 +1,146 @@
+"""
+Content-hash keyed cache for chunk embeddings.
+
+The same pages are split and embedded again for every sub-query. Wrapping the
+embeddings in `CachedEmbeddings` makes each distinct chunk hit the embedding API
+at most once per cache: per GPTResearcher with the memory backend, or across runs
+with the sqlite backend.
+"""
+import asyncio
+import threading
+from typing import Callable
+
+from langchain.embeddings.base import Embeddings
+
+from ..utils.cache import CacheBackend, MemoryCache, get_cache_backend, make_cache_key
+
+
+def get_embedding_cache(cfg) -> CacheBackend | None:
+    """
+    Create the embedding cache for one GPTResearcher.
+
+    The memory backend is private to the researcher; the sqlite backend is shared
+    by every researcher using the same file.
+    """
+    if cfg.embedding_cache == "memory":
+        return MemoryCache(max_entries=cfg.embedding_cache_max_entries)
+    return get_cache_backend(
+        cfg.embedding_cache,
+        namespace="embeddings",
+        path=cfg.embedding_cache_path,
+        max_entries=cfg.embedding_cache_max_entries,
+    )
+
+
+def _embeddings_id(embeddings: Embeddings) -> str:
+    """Identify the embedding model, so vectors of different models never mix."""
+    model = getattr(embeddings, "model", None) or getattr(embeddings, "model_name", None)
+    return f"{type(embeddings).__name__}:{model}"
+
+
+class _InFlight:
+    """Texts currently being embedded, so concurrent callers wait instead of embedding twice."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.events: dict[str, threading.Event] = {}
+
+
+class CachedEmbeddings(Embeddings):
+    """Embeddings wrapper that looks every text up by content hash before calling the model."""
+
+    def __init__(
+        self,
+        base: Embeddings,
+        cache: CacheBackend,
+        on_embed: Callable[[list[str]], None] | None = None,
+        _in_flight: _InFlight | None = None,
+    ):
+        self.base = base
+        self.cache = cache
+        self.on_embed = on_embed
+        self.namespace = _embeddings_id(base)
+        self._in_flight = _in_flight or _InFlight()
+
+    def bind(self, on_embed: Callable[[list[str]], None]) -> "CachedEmbeddings":
+        """
+        Get a view sharing this cache that reports the texts it actually sent to the model.
+
+        Used to charge embedding costs only for cache misses.
+        """
+        return CachedEmbeddings(self.base, self.cache, on_embed=on_embed, _in_flight=self._in_flight)
+
+    def _key(self, kind: str, text: str) -> str:
+        return make_cache_key(self.namespace, kind, text)
+
+    def embed_query(self, text: str) -> list[float]:
+        key = self._key("query", text)
+        vector = self.cache.get(key)
+        if vector is None:
+            vector = self.base.embed_query(text)
+            self.cache.set(key, vector)
+        return vector
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        keys = [self._key("document", text) for text in texts]
+        vectors: dict[str, list[float]] = {}
+        owned: dict[str, str] = {}
+        waiting: dict[str, tuple[str, threading.Event]] = {}
+
+        for key, text in zip(keys, texts):
+            if key in vectors or key in owned or key in waiting:
+                continue
+            vector = self.cache.get(key)
+            if vector is not None:
+                vectors[key] = vector
+                continue
+            with self._in_flight.lock:
+                event = self._in_flight.events.get(key)
+                if event is not None:
+                    waiting[key] = (text, event)
+                    continue
+                # Another caller may have finished between the lookup and taking the lock
+                vector = self.cache.get(key)
+                if vector is not None:
+                    vectors[key] = vector
+                    continue
+                self._in_flight.events[key] = threading.Event()
+                owned[key] = text
+
+        if owned:
+            try:
+                new_vectors = self.base.embed_documents(list(owned.values()))
+                for key, vector in zip(owned, new_vectors):
+                    self.cache.set(key, vector)
+                    vectors[key] = vector
+                if self.on_embed:
+                    self.on_embed(list(owned.values()))
+            finally:
+                with self._in_flight.lock:
+                    for key in owned:
+                        self._in_flight.events.pop(key).set()
+
+        missing = []
+        for key, (text, event) in waiting.items():
+            event.wait()
+            vector = self.cache.get(key)
+            if vector is None:
+                # The other caller failed, or the entry was already evicted
+                missing.append((key, text))
+            else:
+                vectors[key] = vector
+        if missing:
+            new_vectors = self.base.embed_documents([text for _, text in missing])
+            for (key, text), vector in zip(missing, new_vectors):
+                self.cache.set(key, vector)
+                vectors[key] = vector
+            if self.on_embed:
+                self.on_embed([text for _, text in missing])
+
+        return [vectors[key] for key in keys]
+
+    async def aembed_query(self, text: str) -> list[float]:
+        return await asyncio.to_thread(self.embed_query, text)
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        return await asyncio.to_thread(self.embed_documents, texts)
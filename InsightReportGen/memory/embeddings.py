@@ -1,6 +1,9 @@
 import os
 from typing import Any
 
+from ..utils.cache import CacheBackend
+from .embedding_cache import CachedEmbeddings
+
 OPENAI_EMBEDDING_MODEL = os.environ.get(
     "OPENAI_EMBEDDING_MODEL", "text-embedding-3-small"
 )
@@ -27,7 +30,8 @@ _SUPPORTED_PROVIDERS = {
 
 
 class Memory:
-    def __init__(self, embedding_provider: str, model: str, **embdding_kwargs: Any):
+    def __init__(self, embedding_provider: str, model: str, embedding_cache: CacheBackend | None = None,
+                 **embdding_kwargs: Any):
         _embeddings = None
         match embedding_provider:
             case "custom":
@@ -130,6 +134,10 @@ class Memory:
             case _:
                 raise Exception("Embedding not found.")
 
+        # Chunk embeddings are looked up by content hash before calling the provider
+        if embedding_cache is not None:
+            _embeddings = CachedEmbeddings(_embeddings, embedding_cache)
+
         self._embeddings = _embeddings
 
     def get_embeddings(self):
@@ -6,6 +6,8 @@ import requests
 import json
 import logging
 
+from ...utils.http_client import get_http_client
+
 
 class BingSearch():
     """
@@ -36,16 +38,10 @@ class BingSearch():
                 "Bing API key not found. Please set the BING_API_KEY environment variable.")
         return api_key
 
-    def search(self, max_results=7) -> list[dict[str]]:
+    def _build_request(self, max_results: int) -> tuple[str, dict, dict]:
         """
-        Searches the query
-        Returns:
-
+        Builds the url, headers and params of a Bing search request
         """
-        print("Searching with query {0}...".format(self.query))
-        """Useful for general internet search queries using the Bing API."""
-
-        # Search the query
         url = "https://api.bing.microsoft.com/v7.0/search"
 
         headers = {
@@ -62,14 +58,14 @@ class BingSearch():
             "textFormat": "HTML",
             "safeSearch": "Strict"
         }
+        return url, headers, params
 
-        resp = requests.get(url, headers=headers, params=params)
-
-        # Preprocess the results
-        if resp is None:
-            return []
+    def _parse_response(self, text: str) -> list[dict[str]]:
+        """
+        Normalizes a Bing response body to the format of the other search APIs
+        """
         try:
-            search_results = json.loads(resp.text)
+            search_results = json.loads(text)
             results = search_results["webPages"]["value"]
         except Exception as e:
             self.logger.error(
@@ -93,3 +89,34 @@ class BingSearch():
             search_results.append(search_result)
 
         return search_results
+
+    def search(self, max_results=7) -> list[dict[str]]:
+        """
+        Searches the query
+        Returns:
+
+        """
+        print("Searching with query {0}...".format(self.query))
+        """Useful for general internet search queries using the Bing API."""
+        url, headers, params = self._build_request(max_results)
+
+        resp = requests.get(url, headers=headers, params=params)
+
+        # Preprocess the results
+        if resp is None:
+            return []
+        return self._parse_response(resp.text)
+
+    async def asearch(self, max_results=7) -> list[dict[str]]:
+        """
+        Searches the query through the shared pooled HTTP client
+        Returns:
+
+        """
+        print("Searching with query {0}...".format(self.query))
+        url, headers, params = self._build_request(max_results)
+        # requests encodes booleans as "True"/"False" while httpx lowercases them; keep the wire format
+        params = {k: str(v) if isinstance(v, bool) else v for k, v in params.items()}
+
+        resp = await get_http_client().get(url, headers=headers, params=params)
+        return self._parse_response(resp.text)
@@ -0,0 +1,153 @@
+"""
+Search-result cache wrapped around retriever classes.
+
+`with_search_cache` returns a subclass of a retriever whose `search`/`asearch`
+first look the request up in a shared cache backend. Entries are keyed by
+(retriever, query, query domains, max_results, other constructor options), and
+expire after a per-retriever TTL.
+
+Each wrapped class counts its own hits and misses, so a GPTResearcher (which gets
+fresh classes from `get_retrievers`) can report the counters for its own run.
+"""
+import inspect
+import logging
+from typing import Any
+
+from ..utils.cache import CacheBackend, get_cache_backend, make_cache_key
+
+logger = logging.getLogger(__name__)
+
+# Constructor arguments that never change the results (or hold credentials)
+_IGNORED_INIT_ARGS = {"self", "query", "query_domains", "headers"}
+
+
+def _cache_settings(cfg, name: str) -> tuple[CacheBackend | None, float | None]:
+    """Resolve the backend and TTL for a retriever from the config."""
+    backend = get_cache_backend(
+        cfg.search_cache,
+        namespace="search_results",
+        path=cfg.search_cache_path,
+        max_entries=cfg.search_cache_max_entries,
+    )
+    ttl_config = cfg.search_cache_ttl or {}
+    ttl = ttl_config.get(name, ttl_config.get("default"))
+    return backend, ttl
+
+
+def with_search_cache(retriever_class, name: str, cfg):
+    """
+    Wrap a retriever class with the search-result cache.
+
+    Args:
+        retriever_class: The retriever class to wrap.
+        name (str): The retriever name as used in the config (e.g. "tavily").
+        cfg: The configuration object.
+
+    Returns:
+        The wrapped class, or the original class when caching is disabled.
+    """
+    backend, ttl = _cache_settings(cfg, name)
+    if backend is None or ttl == 0:
+        return retriever_class
+
+    init_signature = inspect.signature(retriever_class.__init__)
+    search_signature = inspect.signature(retriever_class.search)
+
+    def __init__(self, *args, **kwargs):
+        retriever_class.__init__(self, *args, **kwargs)
+        try:
+            bound = init_signature.bind(self, *args, **kwargs)
+        except TypeError:
+            self._cache_identity = None
+            return
+        domains = bound.arguments.get("query_domains") or []
+        options = {
+            k: v for k, v in bound.arguments.items()
+            if k not in _IGNORED_INIT_ARGS and v is not None
+        }
+        self._cache_identity = (name, bound.arguments.get("query"), sorted(domains), options)
+
+    def _cache_key(self, args, kwargs) -> str | None:
+        if self._cache_identity is None:
+            return None
+        try:
+            bound = search_signature.bind(self, *args, **kwargs)
+        except TypeError:
+            return None
+        bound.apply_defaults()
+        return make_cache_key(*self._cache_identity, bound.arguments.get("max_results"))
+
+    def _count(self, results) -> Any | None:
+        """Count a lookup as a hit or a miss and pass its results through."""
+        cls = type(self)
+        if results is None:
+            cls.cache_misses += 1
+            return None
+        cls.cache_hits += 1
+        logger.debug(f"Search cache hit for {name}: {self._cache_identity[1]}")
+        return results
+
+    # Empty results usually mean a failed request, so they are not cached
+
+    def search(self, *args, **kwargs):
+        key = self._cache_key(args, kwargs)
+        if key is not None:
+            results = self._count(backend.get(key))
+            if results is not None:
+                return results
+        results = retriever_class.search(self, *args, **kwargs)
+        if key is not None and results:
+            backend.set(key, results, ttl=ttl)
+        return results
+
+    namespace = {
+        "__init__": __init__,
+        "__module__": retriever_class.__module__,
+        "__doc__": retriever_class.__doc__,
+        "_cache_key": _cache_key,
+        "_count": _count,
+        "search": search,
+        "cache_hits": 0,
+        "cache_misses": 0,
+        "retriever_name": name,
+    }
+
+    # Only expose asearch when the wrapped retriever has one, callers probe for it
+    if hasattr(retriever_class, "asearch"):
+        async def asearch(self, *args, **kwargs):
+            key = self._cache_key(args, kwargs)
+            if key is not None:
+                results = self._count(await backend.aget(key))
+                if results is not None:
+                    return results
+            results = await retriever_class.asearch(self, *args, **kwargs)
+            if key is not None and results:
+                await backend.aset(key, results, ttl=ttl)
+            return results
+
+        namespace["asearch"] = asearch
+
+    cached_class = type(retriever_class.__name__, (retriever_class,), namespace)
+    cached_class.__qualname__ = retriever_class.__qualname__
+    return cached_class
+
+
+def get_search_cache_stats(retrievers) -> dict:
+    """
+    Collect the hit/miss counters of wrapped retriever classes.
+
+    Args:
+        retrievers (list): Retriever classes as returned by `get_retrievers`.
+
+    Returns:
+        dict: Total hits and misses plus a per-retriever breakdown.
+    """
+    stats = {"hits": 0, "misses": 0, "retrievers": {}}
+    for retriever_class in retrievers:
+        if not hasattr(retriever_class, "cache_hits"):
+            continue
+        hits, misses = retriever_class.cache_hits, retriever_class.cache_misses
+        stats["hits"] += hits
+        stats["misses"] += misses
+        stats["retrievers"][retriever_class.retriever_name] = {"hits": hits, "misses": misses}
+    return stats
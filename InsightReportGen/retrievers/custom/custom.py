@@ -1,7 +1,10 @@
 from typing import Any, Dict, List, Optional
 import requests
+import httpx
 import os
 
+from ...utils.http_client import get_http_client
+
 
 class CustomRetriever:
     """
@@ -49,4 +52,19 @@ class CustomRetriever:
             return response.json()
         except requests.RequestException as e:
             print(f"Failed to retrieve search results: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    async def asearch(self, max_results: int = 5) -> Optional[List[Dict[str, Any]]]:
+        """
+        Performs the search through the shared pooled HTTP client.
+
+        :param max_results: Maximum number of results to return (not currently used)
+        :return: Same format as `search`
+        """
+        try:
+            response = await get_http_client().get(self.endpoint, params={**self.params, 'query': self.query})
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPError as e:
+            print(f"Failed to retrieve search results: {e}")
+            return None
@@ -1,5 +1,6 @@
 import os
 from ..utils import check_pkg
+from ...utils.http_client import get_http_client
 
 
 class ExaSearch:
@@ -65,6 +66,43 @@ class ExaSearch:
         ]
         return search_response
 
+    async def asearch(
+        self, max_results=10, use_autoprompt=False, search_type="neural", **filters
+    ):
+        """
+        Searches the query using the Exa REST API through the shared pooled HTTP client.
+        Args:
+            max_results: The maximum number of results to return.
+            use_autoprompt: Whether to use autoprompting.
+            search_type: The type of search (e.g., "neural", "keyword").
+            **filters: Additional filters, in the REST API's camelCase form.
+        Returns:
+            A list of search results.
+        """
+        payload = {
+            "query": self.query,
+            "type": search_type,
+            "useAutoprompt": use_autoprompt,
+            "numResults": max_results,
+            "contents": {"text": True},
+            **filters,
+        }
+        if self.query_domains:
+            payload["includeDomains"] = self.query_domains
+
+        response = await get_http_client().post(
+            "https://api.exa.ai/search",
+            json=payload,
+            headers={"x-api-key": self.api_key, "Content-Type": "application/json"},
+        )
+        response.raise_for_status()
+
+        search_response = [
+            {"href": result.get("url"), "body": result.get("text")}
+            for result in response.json().get("results", [])
+        ]
+        return search_response
+
     def find_similar(self, url, exclude_source_domain=False, **filters):
         """
         Finds similar documents to the provided URL using the Exa API.
@@ -5,6 +5,8 @@ import os
 import requests
 import json
 
+from ...utils.http_client import get_http_client
+
 
 class GoogleSearch:
     """
@@ -50,13 +52,10 @@ class GoogleSearch:
                             "You can get a key at https://developers.google.com/custom-search/v1/overview")
         return api_key
 
-    def search(self, max_results=7):
+    def _build_url(self) -> str:
         """
-        Searches the query using Google Custom Search API, optionally restricting to specific domains
-        Returns:
-            list: List of search results with title, href and body
+        Builds the Custom Search url, restricting to specific domains if requested
         """
-        # Build query with domain restrictions if specified
         search_query = self.query
         if self.query_domains and len(self.query_domains) > 0:
             domain_query = " OR ".join([f"site:{domain}" for domain in self.query_domains])
@@ -64,16 +63,15 @@ class GoogleSearch:
 
         print("Searching with query {0}...".format(search_query))
 
-        url = f"https://www.googleapis.com/customsearch/v1?key={self.api_key}&cx={self.cx_key}&q={search_query}&start=1"
-        resp = requests.get(url)
+        return f"https://www.googleapis.com/customsearch/v1?key={self.api_key}&cx={self.cx_key}&q={search_query}&start=1"
 
-        if resp.status_code < 200 or resp.status_code >= 300:
-            print("Google search: unexpected response status: ", resp.status_code)
-
-        if resp is None:
-            return
+    @staticmethod
+    def _parse_response(text: str, max_results: int):
+        """
+        Normalizes a Custom Search response body to the format of the other search APIs
+        """
         try:
-            search_results = json.loads(resp.text)
+            search_results = json.loads(text)
         except Exception:
             return
         if search_results is None:
@@ -98,3 +96,31 @@ class GoogleSearch:
             search_results.append(search_result)
 
         return search_results[:max_results]
+
+    def search(self, max_results=7):
+        """
+        Searches the query using Google Custom Search API, optionally restricting to specific domains
+        Returns:
+            list: List of search results with title, href and body
+        """
+        resp = requests.get(self._build_url())
+
+        if resp.status_code < 200 or resp.status_code >= 300:
+            print("Google search: unexpected response status: ", resp.status_code)
+
+        if resp is None:
+            return
+        return self._parse_response(resp.text, max_results)
+
+    async def asearch(self, max_results=7):
+        """
+        Searches the query through the shared pooled HTTP client
+        Returns:
+            list: List of search results with title, href and body
+        """
+        resp = await get_http_client().get(self._build_url())
+
+        if resp.status_code < 200 or resp.status_code >= 300:
+            print("Google search: unexpected response status: ", resp.status_code)
+
+        return self._parse_response(resp.text, max_results)
@@ -198,6 +198,18 @@ class MCPRetriever:
             except Exception as e:
                 logger.error(f"Error during client cleanup: {e}")
 
+    async def asearch(self, max_results: int = 10) -> List[Dict[str, str]]:
+        """
+        Native async search entry point shared by all retrievers.
+
+        Args:
+            max_results: Maximum number of results to return.
+
+        Returns:
+            List[Dict[str, str]]: The search results.
+        """
+        return await self.search_async(max_results)
+
     def search(self, max_results: int = 10) -> List[Dict[str, str]]:
         """
         Perform a search using MCP tools with intelligent two-stage approach.
@@ -1,8 +1,11 @@
+import asyncio
 import os
 import xml.etree.ElementTree as ET
 
 import requests
 
+from ...utils.http_client import get_http_client
+
 
 class PubMedCentralSearch:
     """
@@ -35,16 +38,11 @@ class PubMedCentralSearch:
             )
         return api_key
 
-    def search(self, max_results=10):
+    def _search_params(self, max_results):
         """
-        Searches the query using the PubMed Central API.
-        Args:
-            max_results: The maximum number of results to return.
-        Returns:
-            A list of search results.
+        Builds the esearch request params for the query.
         """
-        base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
-        params = {
+        return {
             "db": "pmc",
             "term": f"{self.query} AND free fulltext[filter]",
             "retmax": max_results,
@@ -53,6 +51,42 @@ class PubMedCentralSearch:
             "retmode": "json",
             "sort": "relevance"
         }
+
+    def _fetch_params(self, ids):
+        """
+        Builds the efetch request params for the given article IDs.
+        """
+        return {
+            "db": "pmc",
+            "id": ",".join(ids),
+            "retmode": "xml",
+            "api_key": self.api_key,
+        }
+
+    def _to_search_result(self, article_id, xml_content):
+        """
+        Converts a fetched article to a search result, or None if it has no body content.
+        """
+        if not self.has_body_content(xml_content):
+            return None
+        article_data = self.parse_xml(xml_content)
+        if not article_data:
+            return None
+        return {
+            "href": f"https://www.ncbi.nlm.nih.gov/pmc/articles/PMC{article_id}/",
+            "body": f"{article_data['title']}\n\n{article_data['abstract']}\n\n{article_data['body'][:500]}...",
+        }
+
+    def search(self, max_results=10):
+        """
+        Searches the query using the PubMed Central API.
+        Args:
+            max_results: The maximum number of results to return.
+        Returns:
+            A list of search results.
+        """
+        base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
+        params = self._search_params(max_results)
         response = requests.get(base_url, params=params)
 
         if response.status_code != 200:
@@ -66,15 +100,40 @@ class PubMedCentralSearch:
         search_response = []
         for article_id in ids:
             xml_content = self.fetch([article_id])
-            if self.has_body_content(xml_content):
-                article_data = self.parse_xml(xml_content)
-                if article_data:
-                    search_response.append(
-                        {
-                            "href": f"https://www.ncbi.nlm.nih.gov/pmc/articles/PMC{article_id}/",
-                            "body": f"{article_data['title']}\n\n{article_data['abstract']}\n\n{article_data['body'][:500]}...",
-                        }
-                    )
+            search_result = self._to_search_result(article_id, xml_content)
+            if search_result:
+                search_response.append(search_result)
+
+            if len(search_response) >= max_results:
+                break
+
+        return search_response
+
+    async def asearch(self, max_results=10):
+        """
+        Searches the query using the PubMed Central API through the shared pooled HTTP client.
+        Articles are fetched concurrently.
+        Args:
+            max_results: The maximum number of results to return.
+        Returns:
+            A list of search results.
+        """
+        base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
+        response = await get_http_client().get(base_url, params=self._search_params(max_results))
+
+        if response.status_code != 200:
+            raise Exception(
+                f"Failed to retrieve data: {response.status_code} - {response.text}"
+            )
+
+        ids = response.json()["esearchresult"]["idlist"]
+        xml_contents = await asyncio.gather(*(self.afetch([article_id]) for article_id in ids))
+
+        search_response = []
+        for article_id, xml_content in zip(ids, xml_contents):
+            search_result = self._to_search_result(article_id, xml_content)
+            if search_result:
+                search_response.append(search_result)
 
             if len(search_response) >= max_results:
                 break
@@ -90,13 +149,25 @@ class PubMedCentralSearch:
             XML content of the articles.
         """
         base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
-        params = {
-            "db": "pmc",
-            "id": ",".join(ids),
-            "retmode": "xml",
-            "api_key": self.api_key,
-        }
-        response = requests.get(base_url, params=params)
+        response = requests.get(base_url, params=self._fetch_params(ids))
+
+        if response.status_code != 200:
+            raise Exception(
+                f"Failed to retrieve data: {response.status_code} - {response.text}"
+            )
+
+        return response.text
+
+    async def afetch(self, ids):
+        """
+        Async variant of `fetch` using the shared pooled HTTP client.
+        Args:
+            ids: List of article IDs.
+        Returns:
+            XML content of the articles.
+        """
+        base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
+        response = await get_http_client().get(base_url, params=self._fetch_params(ids))
 
         if response.status_code != 200:
             raise Exception(
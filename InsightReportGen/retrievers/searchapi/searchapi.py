@@ -5,6 +5,8 @@ import os
 import requests
 import urllib.parse
 
+from ...utils.http_client import get_http_client
+
 
 class SearchApiSearch():
     """
@@ -32,16 +34,10 @@ class SearchApiSearch():
                             "You can get a key at https://www.searchapi.io/")
         return api_key
 
-    def search(self, max_results=7):
+    def _build_request(self) -> tuple[str, dict]:
         """
-        Searches the query
-        Returns:
-
+        Builds the encoded url and headers of a SearchApi request
         """
-        print("SearchApiSearch: Searching with query {0}...".format(self.query))
-        """Useful for general internet search queries using SearchApi."""
-
-
         url = "https://www.searchapi.io/api/v1/search"
         params = {
             "q": self.query,
@@ -54,29 +50,67 @@ class SearchApiSearch():
             'X-SearchApi-Source': 'gpt-researcher'
         }
 
-        encoded_url = url + "?" + urllib.parse.urlencode(params)
+        return url + "?" + urllib.parse.urlencode(params), headers
+
+    @staticmethod
+    def _parse_results(search_results: dict, max_results: int) -> list:
+        """
+        Normalizes SearchApi organic results to the format of the other search APIs
+        """
+        search_response = []
+        if search_results:
+            results = search_results["organic_results"]
+            results_processed = 0
+            for result in results:
+                # skip youtube results
+                if "youtube.com" in result["link"]:
+                    continue
+                if results_processed >= max_results:
+                    break
+                search_result = {
+                    "title": result["title"],
+                    "href": result["link"],
+                    "body": result["snippet"],
+                }
+                search_response.append(search_result)
+                results_processed += 1
+        return search_response
+
+    def search(self, max_results=7):
+        """
+        Searches the query
+        Returns:
+
+        """
+        print("SearchApiSearch: Searching with query {0}...".format(self.query))
+        """Useful for general internet search queries using SearchApi."""
+        encoded_url, headers = self._build_request()
         search_response = []
 
         try:
             response = requests.get(encoded_url, headers=headers, timeout=20)
             if response.status_code == 200:
-                search_results = response.json()
-                if search_results:
-                    results = search_results["organic_results"]
-                    results_processed = 0
-                    for result in results:
-                        # skip youtube results
-                        if "youtube.com" in result["link"]:
-                            continue
-                        if results_processed >= max_results:
-                            break
-                        search_result = {
-                            "title": result["title"],
-                            "href": result["link"],
-                            "body": result["snippet"],
-                        }
-                        search_response.append(search_result)
-                        results_processed += 1
+                search_response = self._parse_results(response.json(), max_results)
+        except Exception as e:
+            print(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
+            search_response = []
+
+        return search_response
+
+    async def asearch(self, max_results=7):
+        """
+        Searches the query through the shared pooled HTTP client
+        Returns:
+
+        """
+        print("SearchApiSearch: Searching with query {0}...".format(self.query))
+        encoded_url, headers = self._build_request()
+        search_response = []
+
+        try:
+            response = await get_http_client().get(encoded_url, headers=headers, timeout=20)
+            if response.status_code == 200:
+                search_response = self._parse_results(response.json(), max_results)
         except Exception as e:
             print(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
             search_response = []
@@ -4,6 +4,10 @@ import requests
 from typing import List, Dict
 from urllib.parse import urljoin
 
+import httpx
+
+from ...utils.http_client import get_http_client
+
 
 class SearxSearch():
     """
@@ -36,13 +40,9 @@ class SearxSearch():
                 "You can find public instances at https://searx.space/"
             )
 
-    def search(self, max_results: int = 10) -> List[Dict[str, str]]:
+    def _build_request(self) -> tuple[str, dict]:
         """
-        Searches the query using SearxNG API
-        Args:
-            max_results: Maximum number of results to return
-        Returns:
-            List of dictionaries containing search results
+        Builds the search url and params for the SearxNG API
         """
         search_url = urljoin(self.base_url, "search")
         # TODO: Add support for query domains
@@ -52,6 +52,30 @@ class SearxSearch():
             # Output format of results. Format needs to be activated in searxng config.
             'format': 'json'
         }
+        return search_url, params
+
+    @staticmethod
+    def _parse_results(results: dict, max_results: int) -> List[Dict[str, str]]:
+        """
+        Normalizes results to match the expected format
+        """
+        search_response = []
+        for result in results.get('results', [])[:max_results]:
+            search_response.append({
+                "href": result.get('url', ''),
+                "body": result.get('content', '')
+            })
+        return search_response
+
+    def search(self, max_results: int = 10) -> List[Dict[str, str]]:
+        """
+        Searches the query using SearxNG API
+        Args:
+            max_results: Maximum number of results to return
+        Returns:
+            List of dictionaries containing search results
+        """
+        search_url, params = self._build_request()
 
         try:
             response = requests.get(
@@ -60,19 +84,33 @@ class SearxSearch():
                 headers={'Accept': 'application/json'}
             )
             response.raise_for_status()
-            results = response.json()
+            return self._parse_results(response.json(), max_results)
 
-            # Normalize results to match the expected format
-            search_response = []
-            for result in results.get('results', [])[:max_results]:
-                search_response.append({
-                    "href": result.get('url', ''),
-                    "body": result.get('content', '')
-                })
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"Error querying SearxNG: {str(e)}")
+        except json.JSONDecodeError:
+            raise Exception("Error parsing SearxNG response")
 
-            return search_response
+    async def asearch(self, max_results: int = 10) -> List[Dict[str, str]]:
+        """
+        Searches the query using SearxNG API through the shared pooled HTTP client
+        Args:
+            max_results: Maximum number of results to return
+        Returns:
+            List of dictionaries containing search results
+        """
+        search_url, params = self._build_request()
 
-        except requests.exceptions.RequestException as e:
+        try:
+            response = await get_http_client().get(
+                search_url,
+                params=params,
+                headers={'Accept': 'application/json'}
+            )
+            response.raise_for_status()
+            return self._parse_results(response.json(), max_results)
+
+        except httpx.HTTPError as e:
             raise Exception(f"Error querying SearxNG: {str(e)}")
         except json.JSONDecodeError:
             raise Exception("Error parsing SearxNG response")
@@ -5,6 +5,8 @@ import os
 import requests
 import urllib.parse
 
+from ...utils.http_client import get_http_client
+
 
 class SerpApiSearch():
     """
@@ -33,15 +35,10 @@ class SerpApiSearch():
                             "You can get a key at https://serpapi.com/")
         return api_key
 
-    def search(self, max_results=7):
+    def _build_url(self) -> str:
         """
-        Searches the query
-        Returns:
-
+        Builds the SerpApi request url for the query
         """
-        print("SerpApiSearch: Searching with query {0}...".format(self.query))
-        """Useful for general internet search queries using SerpApi."""
-
         url = "https://serpapi.com/search.json"
 
         search_query = self.query
@@ -53,28 +50,63 @@ class SerpApiSearch():
             "q": search_query,
             "api_key": self.api_key
         }
-        encoded_url = url + "?" + urllib.parse.urlencode(params)
+        return url + "?" + urllib.parse.urlencode(params)
+
+    @staticmethod
+    def _parse_results(search_results: dict, max_results: int) -> list:
+        """
+        Normalizes SerpApi organic results to the format of the other search APIs
+        """
+        search_response = []
+        if search_results:
+            results = search_results["organic_results"]
+            results_processed = 0
+            for result in results:
+                # skip youtube results
+                if "youtube.com" in result["link"]:
+                    continue
+                if results_processed >= max_results:
+                    break
+                search_result = {
+                    "title": result["title"],
+                    "href": result["link"],
+                    "body": result["snippet"],
+                }
+                search_response.append(search_result)
+                results_processed += 1
+        return search_response
+
+    def search(self, max_results=7):
+        """
+        Searches the query
+        Returns:
+
+        """
+        print("SerpApiSearch: Searching with query {0}...".format(self.query))
+        """Useful for general internet search queries using SerpApi."""
+        search_response = []
+        try:
+            response = requests.get(self._build_url(), timeout=10)
+            if response.status_code == 200:
+                search_response = self._parse_results(response.json(), max_results)
+        except Exception as e:
+            print(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
+            search_response = []
+
+        return search_response
+
+    async def asearch(self, max_results=7):
+        """
+        Searches the query through the shared pooled HTTP client
+        Returns:
+
+        """
+        print("SerpApiSearch: Searching with query {0}...".format(self.query))
         search_response = []
         try:
-            response = requests.get(encoded_url, timeout=10)
+            response = await get_http_client().get(self._build_url(), timeout=10)
             if response.status_code == 200:
-                search_results = response.json()
-                if search_results:
-                    results = search_results["organic_results"]
-                    results_processed = 0
-                    for result in results:
-                        # skip youtube results
-                        if "youtube.com" in result["link"]:
-                            continue
-                        if results_processed >= max_results:
-                            break
-                        search_result = {
-                            "title": result["title"],
-                            "href": result["link"],
-                            "body": result["snippet"],
-                        }
-                        search_response.append(search_result)
-                        results_processed += 1
+                search_response = self._parse_results(response.json(), max_results)
         except Exception as e:
             print(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
             search_response = []
@@ -5,6 +5,8 @@ import os
 import requests
 import json
 
+from ...utils.http_client import get_http_client
+
 
 class SerperSearch():
     """
@@ -54,15 +56,10 @@ class SerperSearch():
                             "You can get a key at https://serper.dev/")
         return api_key
 
-    def search(self, max_results=7):
+    def _build_request(self, max_results: int) -> tuple[str, dict, str]:
         """
-        Searches the query with optional country, language, and time filtering
-        Returns:
-            list: List of search results with title, href, and body
+        Builds the url, headers and body of a Serper search request
         """
-        print("Searching with query {0}...".format(self.query))
-        """Useful for general internet search queries using the Serper API."""
-
         # Search the query (see https://serper.dev/playground for the format)
         url = "https://google.serper.dev/search"
 
@@ -100,15 +97,15 @@ class SerperSearch():
         if self.time_range:
             search_params["tbs"] = self.time_range  # Time-based search
 
-        data = json.dumps(search_params)
-
-        resp = requests.request("POST", url, timeout=10, headers=headers, data=data)
+        return url, headers, json.dumps(search_params)
 
-        # Preprocess the results
-        if resp is None:
-            return
+    @staticmethod
+    def _parse_response(text: str):
+        """
+        Normalizes a Serper response body to the format of the other search APIs
+        """
         try:
-            search_results = json.loads(resp.text)
+            search_results = json.loads(text)
         except Exception:
             return
         if search_results is None:
@@ -128,3 +125,32 @@ class SerperSearch():
             search_results.append(search_result)
 
         return search_results
+
+    def search(self, max_results=7):
+        """
+        Searches the query with optional country, language, and time filtering
+        Returns:
+            list: List of search results with title, href, and body
+        """
+        print("Searching with query {0}...".format(self.query))
+        """Useful for general internet search queries using the Serper API."""
+        url, headers, data = self._build_request(max_results)
+
+        resp = requests.request("POST", url, timeout=10, headers=headers, data=data)
+
+        # Preprocess the results
+        if resp is None:
+            return
+        return self._parse_response(resp.text)
+
+    async def asearch(self, max_results=7):
+        """
+        Searches the query through the shared pooled HTTP client
+        Returns:
+            list: List of search results with title, href, and body
+        """
+        print("Searching with query {0}...".format(self.query))
+        url, headers, data = self._build_request(max_results)
+
+        resp = await get_http_client().post(url, timeout=10, headers=headers, content=data)
+        return self._parse_response(resp.text)
@@ -6,6 +6,7 @@ from typing import Literal, Sequence, Optional
 import requests
 import json
 from config.variables.default import DEFAULT_CONFIG
+from ...utils.http_client import get_http_client
 
 
 class TavilySearch:
@@ -51,7 +52,7 @@ class TavilySearch:
         return api_key
 
 
-    def _search(
+    def _build_payload(
         self,
         query: str,
         search_depth: Literal["basic", "advanced"] = "basic",
@@ -66,10 +67,9 @@ class TavilySearch:
         use_cache: bool = True,
     ) -> dict:
         """
-        Internal search method to send the request to the API.
+        Builds the request body for the Tavily search API.
         """
-
-        data = {
+        return {
             "query": query,
             "search_depth": search_depth,
             "topic": topic,
@@ -84,6 +84,12 @@ class TavilySearch:
             "use_cache": use_cache,
         }
 
+    def _search(self, query: str, **kwargs) -> dict:
+        """
+        Internal search method to send the request to the API.
+        """
+        data = self._build_payload(query, **kwargs)
+
         response = requests.post(
             self.base_url, data=json.dumps(data), headers=self.headers, timeout=100
         )
@@ -94,6 +100,25 @@ class TavilySearch:
             # Raises a HTTPError if the HTTP request returned an unsuccessful status code
             response.raise_for_status()
 
+    async def _asearch(self, query: str, **kwargs) -> dict:
+        """
+        Async variant of `_search` that goes through the shared pooled HTTP client.
+        """
+        data = self._build_payload(query, **kwargs)
+
+        response = await get_http_client().post(
+            self.base_url, content=json.dumps(data), headers=self.headers, timeout=100
+        )
+        response.raise_for_status()
+        return response.json()
+
+    @staticmethod
+    def _parse_results(results: dict) -> list:
+        sources = results.get("results", [])
+        if not sources:
+            raise Exception("No results found with Tavily API search.")
+        return [{"href": obj["url"], "body": obj["content"]} for obj in sources]
+
     def search(self, max_results=DEFAULT_CONFIG.get("MAX_RESEARCH_RESULTS", 5)):
         """
         Searches the query
@@ -109,13 +134,28 @@ class TavilySearch:
                 topic=self.topic,
                 include_domains=self.query_domains,
             )
-            sources = results.get("results", [])
-            if not sources:
-                raise Exception("No results found with Tavily API search.")
             # Return the results
-            search_response = [
-                {"href": obj["url"], "body": obj["content"]} for obj in sources
-            ]
+            search_response = self._parse_results(results)
+        except Exception as e:
+            print(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
+            search_response = []
+        return search_response
+
+    async def asearch(self, max_results=DEFAULT_CONFIG.get("MAX_RESEARCH_RESULTS", 5)):
+        """
+        Searches the query without blocking the event loop
+        Returns:
+
+        """
+        try:
+            results = await self._asearch(
+                self.query,
+                search_depth="basic",
+                max_results=max_results,
+                topic=self.topic,
+                include_domains=self.query_domains,
+            )
+            search_response = self._parse_results(results)
         except Exception as e:
             print(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
             search_response = []
@@ -1,4 +1,5 @@
 from .beautiful_soup.beautiful_soup import BeautifulSoupScraper
+from .lxml_scraper.lxml_scraper import LxmlScraper
 from .web_base_loader.web_base_loader import WebBaseLoaderScraper
 from .arxiv.arxiv import ArxivScraper
 from .pymupdf.pymupdf import PyMuPDFScraper
@@ -10,6 +11,7 @@ from .scraper import Scraper
 
 __all__ = [
     "BeautifulSoupScraper",
+    "LxmlScraper",
     "WebBaseLoaderScraper",
     "ArxivScraper",
     "PyMuPDFScraper",
@@ -2,6 +2,7 @@ from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 
 from ..utils import get_relevant_images, extract_title, get_text_from_soup, clean_soup
+from ..fetch import FetchedPage, fetch_page
 
 class BeautifulSoupScraper:
 
@@ -22,21 +23,31 @@ class BeautifulSoupScraper:
         """
         try:
             response = self.session.get(self.link, timeout=4)
-            soup = BeautifulSoup(
-                response.content, "lxml", from_encoding=response.encoding
-            )
+            return self._extract(response.content, response.encoding)
 
-            soup = clean_soup(soup)
+        except Exception as e:
+            print("Error! : " + str(e))
+            return "", [], ""
 
-            content = get_text_from_soup(soup)
+    async def fetch(self, user_agent: str, headers: dict[str, str] | None = None,
+                    timeout: float | None = None, max_bytes: int | None = None) -> FetchedPage:
+        """Download the page with the pooled async HTTP client (the network stage of `Scraper`)."""
+        return await fetch_page(self.link, user_agent, timeout=timeout, max_bytes=max_bytes, headers=headers)
 
-            image_urls = get_relevant_images(soup, self.link)
-            
-            # Extract the title using the utility function
-            title = extract_title(soup)
+    def parse(self, page: FetchedPage):
+        """Extract content, images and title from a fetched page (the CPU stage of `Scraper`)."""
+        return self._extract(page.content, page.encoding)
 
-            return content, image_urls, title
+    def _extract(self, html: bytes, encoding: str | None):
+        soup = BeautifulSoup(html, "lxml", from_encoding=encoding)
 
-        except Exception as e:
-            print("Error! : " + str(e))
-            return "", [], ""
\ No newline at end of file
+        soup = clean_soup(soup)
+
+        content = get_text_from_soup(soup)
+
+        image_urls = get_relevant_images(soup, self.link)
+
+        # Extract the title using the utility function
+        title = extract_title(soup)
+
+        return content, image_urls, title
\ No newline at end of file
@@ -0,0 +1,87 @@
+"""
+Async fetch stage for scrapers that parse raw HTML.
+
+Pages are downloaded through the process-wide pooled `httpx` client (keep-alive,
+per-host connection limits, HTTP/2 when `h2` is installed, gzip/brotli/zstd
+decoding when `brotli`/`zstandard` are installed) and streamed, so a body larger
+than SCRAPER_MAX_BODY_BYTES is cut off instead of being read into memory whole.
+Parsing happens separately, off the event loop.
+"""
+from dataclasses import dataclass, field
+
+import httpx
+
+from gpt_researcher.utils.http_client import get_http_client
+
+
+@dataclass
+class FetchedPage:
+    """A downloaded page, ready to be parsed."""
+    url: str
+    final_url: str
+    status_code: int
+    content: bytes
+    encoding: str | None = None
+    headers: dict[str, str] = field(default_factory=dict)
+    truncated: bool = False
+
+    @property
+    def not_modified(self) -> bool:
+        """The server answered a conditional request with 304: the cached copy is still current."""
+        return self.status_code == 304
+
+
+async def fetch_page(url: str, user_agent: str, timeout: float | None = None,
+                     max_bytes: int | None = None, headers: dict[str, str] | None = None) -> FetchedPage:
+    """
+    Download a page with the pooled HTTP client.
+
+    Args:
+        url (str): The page URL.
+        user_agent (str): User-Agent header to send.
+        timeout (float, optional): Connect/read/write timeout in seconds. Defaults to SCRAPER_TIMEOUT.
+        max_bytes (int, optional): Stop reading the body after this many decoded bytes.
+            Defaults to SCRAPER_MAX_BODY_BYTES (0 = no limit).
+        headers (dict, optional): Extra request headers.
+
+    Returns:
+        FetchedPage: The page, with an empty body for a 304 Not Modified. Error responses
+            (4xx/5xx) raise `httpx.HTTPStatusError`.
+    """
+    from gpt_researcher.config.config import Config
+
+    if timeout is None:
+        timeout = Config.get_setting("SCRAPER_TIMEOUT")
+    if max_bytes is None:
+        max_bytes = Config.get_setting("SCRAPER_MAX_BODY_BYTES")
+
+    request_headers = {"User-Agent": user_agent, **(headers or {})}
+    client = get_http_client()
+    # Waiting for a free pooled connection is not a network stall, so it has no timeout
+    async with client.stream("GET", url, headers=request_headers,
+                             timeout=httpx.Timeout(timeout, pool=None)) as response:
+        if response.status_code == 304:
+            return FetchedPage(url=url, final_url=str(response.url), status_code=304, content=b"",
+                               headers=dict(response.headers))
+        response.raise_for_status()
+
+        chunks = []
+        size = 0
+        truncated = False
+        async for chunk in response.aiter_bytes():
+            chunks.append(chunk)
+            size += len(chunk)
+            if max_bytes and size >= max_bytes:
+                truncated = True
+                break
+
+        content = b"".join(chunks)
+        return FetchedPage(
+            url=url,
+            final_url=str(response.url),
+            status_code=response.status_code,
+            content=content[:max_bytes] if truncated else content,
+            encoding=response.charset_encoding,
+            headers=dict(response.headers),
+            truncated=truncated,
+        )
@@ -0,0 +1,123 @@
+import re
+from urllib.parse import urljoin
+
+import lxml.etree
+import lxml.html
+
+from ..utils import score_image, top_images
+from ..fetch import FetchedPage, fetch_page
+
+# Same boilerplate rules as `clean_soup`
+DROPPED_TAGS = frozenset({"script", "style", "footer", "header", "nav", "menu", "sidebar", "svg"})
+DROPPED_CLASSES = frozenset({"nav", "menu", "sidebar", "footer"})
+# Tags whose strings BeautifulSoup's get_text leaves out
+SILENT_TAGS = frozenset({"template", "rt", "rp"})
+
+_WHITESPACE_RUN = re.compile(r"\s{2,}")
+
+
+class LxmlScraper:
+    """
+    Extracts the same (content, image_urls, title) as `BeautifulSoupScraper`, but walks the lxml
+    tree once instead of building a BeautifulSoup tree and searching it several times.
+    """
+
+    def __init__(self, link, session=None):
+        self.link = link
+        self.session = session
+
+    def scrape(self):
+        try:
+            response = self.session.get(self.link, timeout=4)
+            return self._extract(response.content, response.encoding)
+
+        except Exception as e:
+            print("Error! : " + str(e))
+            return "", [], ""
+
+    async def fetch(self, user_agent: str, headers: dict[str, str] | None = None,
+                    timeout: float | None = None, max_bytes: int | None = None) -> FetchedPage:
+        """Download the page with the pooled async HTTP client (the network stage of `Scraper`)."""
+        return await fetch_page(self.link, user_agent, timeout=timeout, max_bytes=max_bytes, headers=headers)
+
+    def parse(self, page: FetchedPage):
+        """Extract content, images and title from a fetched page (the CPU stage of `Scraper`)."""
+        return self._extract(page.content, page.encoding)
+
+    def _extract(self, html: bytes, encoding: str | None):
+        root = _parse_html(html, encoding)
+        if root is None:
+            return "", [], ""
+
+        strings, images, title = [], [], None
+        # Pending work in document order: (element, silent) pairs, or the tail text after an element
+        stack = [(root, False)]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                item = item.strip()
+                if item:
+                    strings.append(item)
+                continue
+
+            element, silent = item
+            tag = element.tag
+            if not isinstance(tag, str):
+                continue  # Comments and processing instructions
+            if tag in DROPPED_TAGS:
+                continue
+            classes = element.get("class")
+            if classes:
+                classes = classes.split()
+                if not DROPPED_CLASSES.isdisjoint(classes):
+                    continue
+
+            if tag == "img":
+                image = self._score_image(element, classes or [])
+                if image is not None:
+                    images.append(image)
+            elif tag == "title" and title is None:
+                title = element.text if len(element) == 0 else None
+
+            silent = silent or tag in SILENT_TAGS
+            if element.text and not silent:
+                text = element.text.strip()
+                if text:
+                    strings.append(text)
+            for child in reversed(element):
+                if child.tail and not silent:
+                    stack.append(child.tail)
+                stack.append((child, silent))
+
+        content = _WHITESPACE_RUN.sub(" ", "\n".join(strings))
+        return content, top_images(images), title if title is not None else ""
+
+    def _score_image(self, element, classes: list) -> dict | None:
+        src = element.get("src")
+        if src is None:
+            return None
+        img_src = urljoin(self.link, src)
+        if not img_src.startswith(("http://", "https://")):
+            return None
+        score = score_image(classes, element.get("width"), element.get("height"))
+        if score is None:
+            return None  # Skip small images
+        return {"url": img_src, "score": score}
+
+
+def _parse_html(html: bytes, encoding: str | None):
+    """Parse a page into an lxml tree, or None if it has no markup."""
+    try:
+        parser = lxml.html.HTMLParser(encoding=encoding) if encoding else None
+    except LookupError:
+        parser = None  # Unknown charset name
+    try:
+        if parser is None:
+            # Without a declared charset prefer UTF-8, otherwise let libxml2 read <meta charset>
+            try:
+                return lxml.html.document_fromstring(html.decode("utf-8"))
+            except (UnicodeDecodeError, ValueError):
+                pass
+        return lxml.html.document_fromstring(html, parser=parser)
+    except lxml.etree.ParserError:
+        return None
@@ -0,0 +1,182 @@
+"""
+Cache of scraped pages, keyed by canonical URL and the scraper that extracted them.
+
+An entry holds what a scraper extracted from a page (content, image URLs, title)
+plus the page's ETag/Last-Modified validators. Entries younger than
+PAGE_CACHE_TTL are served without touching the network. Older entries with
+validators are revalidated with a conditional request, and a 304 reuses the
+extracted content without downloading or parsing the page again. Entries without
+validators expire after PAGE_CACHE_TTL.
+
+Backends are shared process-wide (see `utils.cache`) and are called through
+their async API, so SQLite I/O stays off the event loop. Each PageCache instance
+counts its own hits so a research run can report them.
+"""
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from gpt_researcher.utils.cache import CacheBackend, get_cache_backend, make_cache_key
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that only track the visitor and never change the page
+_TRACKING_PARAMS = {"fbclid", "gclid", "msclkid", "mc_cid", "mc_eid", "ref", "ref_src", "spm"}
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def canonical_url(url: str) -> str:
+    """
+    Normalize a URL for cache lookups: lowercase scheme and host, no default port,
+    fragment or tracking parameters, and sorted query parameters.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in _TRACKING_PARAMS
+    )
+    return urlunsplit((scheme, host, parts.path or "/", urlencode(query), ""))
+
+
+@dataclass
+class CachedPage:
+    url: str
+    raw_content: str
+    scraper: str = ""
+    image_urls: list[dict[str, Any]] = field(default_factory=list)
+    title: str = ""
+    etag: str | None = None
+    last_modified: str | None = None
+    fetched_at: float = 0.0
+
+    @property
+    def result(self) -> tuple[str, list[dict[str, Any]], str]:
+        return self.raw_content, self.image_urls, self.title
+
+    def is_fresh(self, ttl: float) -> bool:
+        return bool(ttl) and time.time() - self.fetched_at < ttl
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Request headers that let the server answer 304 Not Modified."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class PageCache:
+    """Scraped-page cache with conditional revalidation, on top of a shared cache backend."""
+
+    def __init__(self, backend: CacheBackend, ttl: float = 0):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, cfg) -> "PageCache | None":
+        """The page cache configured by PAGE_CACHE*, or None when it is disabled."""
+        backend = get_cache_backend(
+            cfg.page_cache,
+            namespace="scraped_pages",
+            path=cfg.page_cache_path,
+            max_entries=cfg.page_cache_max_entries,
+        )
+        return cls(backend, ttl=cfg.page_cache_ttl) if backend is not None else None
+
+    @staticmethod
+    def _key(url: str, scraper: str) -> str:
+        # Scrapers extract different content from the same page, so each has its own entries
+        return make_cache_key(canonical_url(url), scraper)
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    async def get(self, url: str, scraper: str) -> CachedPage | None:
+        """The page `scraper` extracted from a URL, fresh or stale, or None."""
+        entry = await self.backend.aget(self._key(url, scraper))
+        if entry is None:
+            return None
+        try:
+            return CachedPage(**entry)
+        except TypeError:
+            return None
+
+    async def lookup(self, url: str, scraper: str) -> tuple[CachedPage | None, bool]:
+        """
+        Look a URL up and count the outcome.
+
+        Args:
+            url (str): The page URL.
+            scraper (str): Name of the scraper that will extract it.
+
+        Returns:
+            tuple[CachedPage | None, bool]: The cached page and whether it is fresh
+                enough to use without revalidation.
+        """
+        page = await self.get(url, scraper)
+        if page is not None and page.is_fresh(self.ttl):
+            self._count("hits")
+            return page, True
+        if page is None or not page.conditional_headers():
+            self._count("misses")
+        return page, False
+
+    async def put(self, url: str, scraper: str, result: tuple, headers: dict[str, str] | None = None) -> None:
+        """Store what `scraper` extracted from a URL, with the validators from its response headers."""
+        content, image_urls, title = result
+        headers = {key.lower(): value for key, value in (headers or {}).items()}
+        page = CachedPage(
+            url=canonical_url(url),
+            raw_content=content,
+            scraper=scraper,
+            image_urls=image_urls,
+            title=title or "",
+            etag=headers.get("etag"),
+            last_modified=headers.get("last-modified"),
+            fetched_at=time.time(),
+        )
+        await self._store(page)
+
+    async def revalidate(self, page: CachedPage, headers: dict[str, str] | None = None) -> tuple:
+        """Mark a stale page as fresh again after a 304, taking any updated validators, and return its content."""
+        headers = {key.lower(): value for key, value in (headers or {}).items()}
+        page.etag = headers.get("etag", page.etag)
+        page.last_modified = headers.get("last-modified", page.last_modified)
+        page.fetched_at = time.time()
+        await self._store(page)
+        self._count("revalidated")
+        return page.result
+
+    def miss(self) -> None:
+        """Count a revalidation that came back with a changed page."""
+        self._count("misses")
+
+    async def _store(self, page: CachedPage) -> None:
+        # Pages without validators cannot be revalidated, so they simply expire
+        if page.conditional_headers():
+            await self.backend.aset(self._key(page.url, page.scraper), asdict(page))
+        elif self.ttl:
+            await self.backend.aset(self._key(page.url, page.scraper), asdict(page), ttl=self.ttl)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.revalidated + self.misses
+            return {
+                "hits": self.hits,
+                "revalidated": self.revalidated,
+                "misses": self.misses,
+                "hit_ratio": (self.hits + self.revalidated) / lookups if lookups else 0.0,
+            }
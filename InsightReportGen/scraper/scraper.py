@@ -6,6 +6,7 @@ import subprocess
 import sys
 import importlib
 import logging
+import time
 
 logging.basicConfig(
     level=logging.INFO,
@@ -22,9 +23,12 @@ logging.basicConfig(
 
 from gpt_researcher.utils.workers import WorkerPool
 
+from .page_cache import CachedPage, PageCache
+
 from . import (
     ArxivScraper,
     BeautifulSoupScraper,
+    LxmlScraper,
     PyMuPDFScraper,
     WebBaseLoaderScraper,
     BrowserScraper,
@@ -39,15 +43,18 @@ class Scraper:
     Scraper class to extract the content from the links
     """
 
-    def __init__(self, urls, user_agent, scraper, worker_pool: WorkerPool):
+    def __init__(self, urls, user_agent, scraper, worker_pool: WorkerPool, page_cache: PageCache | None = None,
+                 cfg=None):
         """
         Initialize the Scraper class.
         Args:
             urls:
+            cfg: The researcher's Config; SCRAPER_* settings are read from it when given.
         """
         self.urls = urls
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": user_agent})
+        self.cfg = cfg
+        self.user_agent = user_agent
+        self._session = None
         self.scraper = scraper
         if self.scraper == "tavily_extract":
             self._check_pkg(self.scraper)
@@ -55,14 +62,42 @@ class Scraper:
             self._check_pkg(self.scraper)
         self.logger = logging.getLogger(__name__)
         self.worker_pool = worker_pool
+        self.page_cache = page_cache
+        # Downloads in flight for scrapers with an async fetch stage; parsing is bounded by the worker pool
+        self._fetch_slots = asyncio.Semaphore(self._get_setting("SCRAPER_MAX_IN_FLIGHT"))
+        self._parse_queue: asyncio.Queue | None = None
+
+    def _get_setting(self, key: str):
+        from gpt_researcher.config.config import Config
+
+        return Config.get_setting(key, self.cfg)
+
+    @property
+    def session(self) -> requests.Session:
+        """requests session for scrapers without an async fetch stage, created on first use."""
+        if self._session is None:
+            self._session = requests.Session()
+            self._session.headers.update({"User-Agent": self.user_agent})
+        return self._session
 
     async def run(self):
         """
         Extracts the content from the links
         """
-        contents = await asyncio.gather(
-            *(self.extract_data_from_url(url, self.session) for url in self.urls)
-        )
+        # Fetched pages wait here for a parse worker; a full queue stalls further downloads
+        self._parse_queue = asyncio.Queue(maxsize=self._get_setting("SCRAPER_PARSE_QUEUE_SIZE"))
+        parsers = [
+            asyncio.create_task(self._parse_worker(self._parse_queue))
+            for _ in range(self.worker_pool.parse_workers)
+        ]
+        try:
+            contents = await asyncio.gather(
+                *(self.extract_data_from_url(url) for url in self.urls)
+            )
+        finally:
+            for parser in parsers:
+                parser.cancel()
+            self._parse_queue = None
 
         res = [content for content in contents if content["raw_content"] is not None]
         return res
@@ -100,68 +135,148 @@ class Scraper:
                     f"`pip install -U {pkg_inst_name}`"
                 )
 
-    async def extract_data_from_url(self, link, session):
+    async def _parse_worker(self, queue: asyncio.Queue):
+        """Parse stage: take fetched pages off the queue and parse them in the worker pool."""
+        while True:
+            scraper, page, result = await queue.get()
+            try:
+                if not result.cancelled():
+                    result.set_result(await self._parse(scraper, page))
+            except Exception as e:
+                if not result.cancelled():
+                    result.set_exception(e)
+            finally:
+                queue.task_done()
+
+    async def _parse(self, scraper, page):
+        metrics = self.worker_pool.metrics.parse
+        started = metrics.start()
+        ok = False
+        try:
+            parsed = await self.worker_pool.run_parse(scraper.parse, page)
+            ok = True
+            return parsed
+        finally:
+            metrics.finish(started, len(page.content), ok)
+
+    async def _fetch(self, scraper, cached: CachedPage | None = None):
+        """Fetch stage: download a page (revalidating a stale cached copy) and hand it to the parse stage."""
+        metrics = self.worker_pool.metrics
+        validators = cached.conditional_headers() if cached is not None else {}
+        async with self._fetch_slots:
+            started = metrics.fetch.start()
+            page = None
+            try:
+                page = await scraper.fetch(
+                    self.user_agent,
+                    headers=validators or None,
+                    timeout=self._get_setting("SCRAPER_TIMEOUT"),
+                    max_bytes=self._get_setting("SCRAPER_MAX_BODY_BYTES"),
+                )
+            finally:
+                metrics.fetch.finish(started, len(page.content) if page else 0, page is not None)
+
+            if validators:
+                if page.not_modified:
+                    return await self.page_cache.revalidate(cached, page.headers)
+                self.page_cache.miss()
+
+            queue = self._parse_queue
+            if queue is not None:
+                # The fetch slot is held while the queue is full, so backpressure throttles downloads
+                result = asyncio.get_running_loop().create_future()
+                waited_from = time.perf_counter()
+                await queue.put((scraper, page, result))
+                metrics.record_put(queue.qsize(), time.perf_counter() - waited_from)
+
+        parsed = await result if queue is not None else await self._parse(scraper, page)
+        # A body cut off at SCRAPER_MAX_BODY_BYTES must not be served later as the whole page
+        if not page.truncated:
+            await self._cache_result(scraper, parsed, page.headers)
+        return parsed
+
+    async def _cache_result(self, scraper, result, headers=None) -> None:
+        if self.page_cache is not None and result[0]:
+            await self.page_cache.put(scraper.link, type(scraper).__name__, result, headers)
+
+    async def _scrape(self, scraper):
         """
-        Extracts the data from the link with logging
+        Run a scraper, unless the page cache has a fresh copy. Scrapers with a `fetch` stage go
+        through the fetch -> parse pipeline and can revalidate stale copies.
         """
+        cached, fresh = (
+            await self.page_cache.lookup(scraper.link, type(scraper).__name__)
+            if self.page_cache is not None else (None, False)
+        )
+        if fresh:
+            return cached.result
+
+        if hasattr(scraper, "fetch"):
+            return await self._fetch(scraper, cached)
+
+        if cached is not None and cached.conditional_headers():
+            self.page_cache.miss()  # Can't be revalidated without a fetch stage
         async with self.worker_pool.throttle():
-            try:
-                Scraper = self.get_scraper(link)
-                scraper = Scraper(link, session)
-
-                # Get scraper name
-                scraper_name = scraper.__class__.__name__
-                self.logger.info(f"\n=== Using {scraper_name} ===")
-
-                # Get content
-                if hasattr(scraper, "scrape_async"):
-                    content, image_urls, title = await scraper.scrape_async()
-                else:
-                    (
-                        content,
-                        image_urls,
-                        title,
-                    ) = await asyncio.get_running_loop().run_in_executor(
-                        self.worker_pool.executor, scraper.scrape
-                    )
-
-                if len(content) < 100:
-                    self.logger.warning(f"Content too short or empty for {link}")
-                    return {
-                        "url": link,
-                        "raw_content": None,
-                        "image_urls": [],
-                        "title": title,
-                    }
-
-                # Log results
-                self.logger.info(f"\nTitle: {title}")
-                self.logger.info(
-                    f"Content length: {len(content) if content else 0} characters"
-                )
-                self.logger.info(f"Number of images: {len(image_urls)}")
-                self.logger.info(f"URL: {link}")
-                self.logger.info("=" * 50)
-
-                if not content or len(content) < 100:
-                    self.logger.warning(f"Content too short or empty for {link}")
-                    return {
-                        "url": link,
-                        "raw_content": None,
-                        "image_urls": [],
-                        "title": title,
-                    }
+            if hasattr(scraper, "scrape_async"):
+                result = await scraper.scrape_async()
+            else:
+                result = await asyncio.get_running_loop().run_in_executor(self.worker_pool.executor, scraper.scrape)
+        await self._cache_result(scraper, result)
+        return result
+
+    async def extract_data_from_url(self, link, session=None):
+        """
+        Extracts the data from the link with logging
+        """
+        try:
+            Scraper = self.get_scraper(link)
+            # Only scrapers without an async fetch stage get the (not thread-safe) requests session
+            scraper = Scraper(link, None if hasattr(Scraper, "fetch") else session or self.session)
+
+            # Get scraper name
+            scraper_name = scraper.__class__.__name__
+            self.logger.info(f"\n=== Using {scraper_name} ===")
 
+            # Get content
+            content, image_urls, title = await self._scrape(scraper)
+
+            if len(content) < 100:
+                self.logger.warning(f"Content too short or empty for {link}")
                 return {
                     "url": link,
-                    "raw_content": content,
-                    "image_urls": image_urls,
+                    "raw_content": None,
+                    "image_urls": [],
                     "title": title,
                 }
 
-            except Exception as e:
-                self.logger.error(f"Error processing {link}: {str(e)}")
-                return {"url": link, "raw_content": None, "image_urls": [], "title": ""}
+            # Log results
+            self.logger.info(f"\nTitle: {title}")
+            self.logger.info(
+                f"Content length: {len(content) if content else 0} characters"
+            )
+            self.logger.info(f"Number of images: {len(image_urls)}")
+            self.logger.info(f"URL: {link}")
+            self.logger.info("=" * 50)
+
+            if not content or len(content) < 100:
+                self.logger.warning(f"Content too short or empty for {link}")
+                return {
+                    "url": link,
+                    "raw_content": None,
+                    "image_urls": [],
+                    "title": title,
+                }
+
+            return {
+                "url": link,
+                "raw_content": content,
+                "image_urls": image_urls,
+                "title": title,
+            }
+
+        except Exception as e:
+            self.logger.error(f"Error processing {link}: {str(e)}")
+            return {"url": link, "raw_content": None, "image_urls": [], "title": ""}
 
     def get_scraper(self, link):
         """
@@ -184,6 +299,7 @@ class Scraper:
             "pdf": PyMuPDFScraper,
             "arxiv": ArxivScraper,
             "bs": BeautifulSoupScraper,
+            "lxml": LxmlScraper,
             "web_base_loader": WebBaseLoaderScraper,
             "browser": BrowserScraper,
             "nodriver": NoDriverScraper,
@@ -16,37 +16,46 @@ def get_relevant_images(soup: BeautifulSoup, url: str) -> list:
         for img in all_images:
             img_src = urljoin(url, img['src'])
             if img_src.startswith(('http://', 'https://')):
-                score = 0
-                # Check for relevant classes
-                if any(cls in img.get('class', []) for cls in ['header', 'featured', 'hero', 'thumbnail', 'main', 'content']):
-                    score = 4  # Higher score
-                # Check for size attributes
-                elif img.get('width') and img.get('height'):
-                    width = parse_dimension(img['width'])
-                    height = parse_dimension(img['height'])
-                    if width and height:
-                        if width >= 2000 and height >= 1000:
-                            score = 3  # Medium score (very large images)
-                        elif width >= 1600 or height >= 800:
-                            score = 2  # Lower score
-                        elif width >= 800 or height >= 500:
-                            score = 1  # Lowest score
-                        elif width >= 500 or height >= 300:
-                            score = 0  # Lowest score
-                        else:
-                            continue  # Skip small images
+                score = score_image(img.get('class', []), img.get('width'), img.get('height'))
+                if score is None:
+                    continue  # Skip small images
                 
                 image_urls.append({'url': img_src, 'score': score})
         
-        # Sort images by score (highest first)
-        sorted_images = sorted(image_urls, key=lambda x: x['score'], reverse=True)
-        
-        return sorted_images[:10]  # Ensure we don't return more than 10 images in total
+        return top_images(image_urls)
     
     except Exception as e:
         logging.error(f"Error in get_relevant_images: {e}")
         return []
 
+def score_image(classes: list, width: str | None, height: str | None) -> int | None:
+    """Score an image by its classes and size attributes, or None for an image too small to keep"""
+    score = 0
+    # Check for relevant classes
+    if any(cls in classes for cls in ['header', 'featured', 'hero', 'thumbnail', 'main', 'content']):
+        score = 4  # Higher score
+    # Check for size attributes
+    elif width and height:
+        width = parse_dimension(width)
+        height = parse_dimension(height)
+        if width and height:
+            if width >= 2000 and height >= 1000:
+                score = 3  # Medium score (very large images)
+            elif width >= 1600 or height >= 800:
+                score = 2  # Lower score
+            elif width >= 800 or height >= 500:
+                score = 1  # Lowest score
+            elif width >= 500 or height >= 300:
+                score = 0  # Lowest score
+            else:
+                return None
+    return score
+
+def top_images(image_urls: list) -> list:
+    """Sort images by score (highest first), keeping at most 10"""
+    sorted_images = sorted(image_urls, key=lambda x: x['score'], reverse=True)
+    return sorted_images[:10]
+
 def parse_dimension(value: str) -> int:
     """Parse dimension value, handling px units"""
     if value.lower().endswith('px'):
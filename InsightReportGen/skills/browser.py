@@ -2,15 +2,19 @@ from gpt_researcher.utils.workers import WorkerPool
 
 from ..actions.utils import stream_output
 from ..actions.web_scraping import scrape_urls
+from ..scraper.page_cache import PageCache
 from ..scraper.utils import get_image_hash
 
 
 class BrowserManager:
     """Manages context for the researcher agent."""
 
-    def __init__(self, researcher):
+    def __init__(self, researcher, worker_pool: WorkerPool | None = None, page_cache: PageCache | None = None):
         self.researcher = researcher
-        self.worker_pool = WorkerPool(researcher.cfg.max_scraper_workers)
+        self.worker_pool = worker_pool or WorkerPool(
+            researcher.cfg.max_scraper_workers, researcher.cfg.scraper_parse_processes
+        )
+        self.page_cache = page_cache or PageCache.from_config(researcher.cfg)
 
     async def browse_urls(self, urls: list[str]) -> list[dict]:
         """
@@ -31,7 +35,7 @@ class BrowserManager:
             )
 
         scraped_content, images = await scrape_urls(
-            urls, self.researcher.cfg, self.worker_pool
+            urls, self.researcher.cfg, self.worker_pool, self.page_cache
         )
         self.researcher.add_research_sources(scraped_content)
         new_images = self.select_top_images(images, k=4)  # Select top 4 images
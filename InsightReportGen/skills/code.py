@@ -1,23 +1,44 @@
 from __future__ import annotations
 
+import asyncio
+import copy
+import json
+import re
 from typing import List, Dict, Set, Optional, Any, Tuple, TypedDict, Literal, Union
 from pathlib import Path
 from dataclasses import dataclass, field
+import nbformat
 from gpt_researcher.utils.notebook import NotebookSerializer
+from gpt_researcher.utils.kernel_session import KernelError, KernelSession
+from gpt_researcher.utils.step_cache import StepCache
 from utils.llm import code_llm, fix_llm, revise_llm
 from actions.utils import stream_output
-from nbclient import NotebookClient
-import nbformat
 from langgraph.graph import StateGraph, END
 from utils.validators import PipelinePlanResponse
 
 
+# 视为文件路径的输入后缀（如 .csv / .parquet / .png）
+_FILE_SUFFIX = re.compile(r"\.[A-Za-z][A-Za-z0-9]{0,7}")
+
+
+@dataclass
+class StepRun:
+    """单个步骤的运行态；并行执行时每个步骤各持一份。"""
+    idx: int
+    kernel: KernelSession
+    isolated: bool = False
+    last_error: Optional[str] = None
+    checkpointed: bool = False
+    key: Optional[str] = None  # 步骤缓存键（见 utils/step_cache.py）
+    restored: bool = False  # 本次由缓存恢复、未实际执行
+
+
 # ---------- LangGraph 状态定义 ----------
 class CGState(TypedDict, total=False):
     cg: "CodeGenerator"
     plan: PipelinePlanResponse
+    run: StepRun
     phase: Literal["init", "build", "execute", "verify", "fix_or_revise", "collect"]
-    route_hint: Literal["build", "end"]  # collect 后的路由提示（回到 build 或结束）
 
 
 class CodeGenerator:
@@ -27,8 +48,10 @@ class CodeGenerator:
         *,
         kernel: str = "python3",
         timeout_sec: int = 1200,
+        progress_interval_sec: float = 15.0,
         max_attempts_per_step: int = 3,
         max_revisions: int = 2,
+        max_parallel_steps: Optional[int] = None,
     ):
         # ===== 基础配置 =====
         self.researcher = researcher
@@ -47,8 +70,12 @@ class CodeGenerator:
         self.output_dir: str = self.researcher.cfg.output_dir
         self.kernel = kernel
         self.timeout_sec = timeout_sec
+        self.progress_interval_sec = progress_interval_sec
         self.code_libs = self.researcher.cfg.code_libs
         self.config = config
+        if max_parallel_steps is None:
+            max_parallel_steps = getattr(config, "code_max_parallel_steps", 1)
+        self.max_parallel_steps = max(1, int(max_parallel_steps or 1))
 
         # ===== 运行期依赖 =====
         self.code_llm = code_llm
@@ -58,16 +85,29 @@ class CodeGenerator:
         # ===== Notebook & 运行态 =====
         self.nb: Optional["NotebookSerializer"] = None
         self.nb_path: Optional[Path] = None
+        # 内核在内存中的工作 notebook 上执行；并行步骤的单元在其中交错，
+        # 每个步骤归集后再按流水线顺序抄入 analysis.ipynb（self.nb）
+        self.work_nb: Optional["NotebookSerializer"] = None
+        self.step_cells: Dict[int, List[int]] = {}  # 步骤下标 -> 其在工作 notebook 中的单元
+        self._collected: Set[int] = set()
+        self._next_commit: int = 0
         self.cell_index: Dict[str, int] = {}
-        self.idx: int = 0
         self.attempts: Dict[str, int] = {}
         self.max_attempts_per_step = max_attempts_per_step
         self.max_revisions = max_revisions
         self.revisions_done: int = 0
 
         # ===== 执行状态 =====
-        self.executed_up_to: Optional[str] = None
-        self.last_error: Optional[str] = None
+        # 每次 run 一个常驻主内核：只执行新单元，修补失败时回滚到步骤开始前的命名空间快照。
+        # 只通过文件衔接的步骤放到各自的独立内核中并行执行（见 _step_dependencies）。
+        self.kernel_session: Optional[KernelSession] = None
+        self._idle_kernels: List[KernelSession] = []
+        self.step_deps: Dict[int, Set[int]] = {}
+
+        # ===== 步骤缓存 =====
+        # 代码、上游步骤、数据文件与随机种子均未变化的步骤直接恢复产物，不再执行
+        self.step_cache: Optional[StepCache] = StepCache.from_config(config) if config is not None else None
+        self.step_hashes: Dict[str, str] = {}
         self.logs: List[str] = []
         self.assets: Dict[str, Dict[str, List[str]]] = {}
 
@@ -91,22 +131,6 @@ class CodeGenerator:
             "nb": root / "notebooks",
         }
 
-    @staticmethod
-    def _execute_until_cell(notebook_path: Union[str, Path], upto: int, kernel: str = "python3", timeout: int = 1200) -> Tuple[bool, Optional[str]]:
-        """
-        执行 notebook 到指定 cell 索引（包含）。
-        """
-        nb = nbformat.read(notebook_path, as_version=4)
-        client = NotebookClient(nb, kernel_name=kernel, timeout=timeout)
-        try:
-            for i, cell in enumerate(nb.cells[: upto + 1]):
-                client.execute_cell(cell, i, store_history=True)
-            with open(notebook_path, "w", encoding="utf-8") as f:
-                nbformat.write(nb, f)
-            return True, None
-        except Exception as e:
-            return False, repr(e)
-
     @staticmethod
     def _as_list(v) -> List[str]:
         if v is None:
@@ -185,6 +209,138 @@ class CodeGenerator:
 
         return True, []
 
+    @staticmethod
+    def _artifact_paths(step) -> List[str]:
+        arts = getattr(step, "artifacts", None)
+        paths: List[str] = []
+        for cat in ("tables", "figures", "metrics"):
+            value = arts.get(cat) if isinstance(arts, dict) else getattr(arts, cat, None)
+            paths.extend(CodeGenerator._as_list(value))
+        return paths
+
+    @staticmethod
+    def _step_dependencies(plan: PipelinePlanResponse, data_files: Optional[List[str]] = None) -> Tuple[Dict[int, Set[int]], Set[int]]:
+        """
+        由各步骤的 inputs / artifacts 推断依赖图。data_files 为数据源之外、运行前已存在的数据文件（如 DATA_PATH）。
+        返回 (deps, isolated)：deps[j] 为步骤 j 需等待完成的步骤下标；
+        isolated 为只通过文件衔接、可在独立内核中并行执行的步骤。
+        判定规则（宁可保守串行，也不误判并行）：
+          - 输入是前序步骤声明的产物文件 → 文件依赖
+          - 输入提到前序步骤 id（如 "cleaned dataframe from step_01"）→ 内存依赖，须在同一内核
+          - 数据源文件 → 无依赖
+          - 无 inputs、描述无法识别、引用后续步骤、来源不明的文件（可能由前序步骤写出却未声明）
+            → 依赖不明：等待此前所有步骤，并在主内核执行
+        主内核中的步骤按原顺序逐个执行。
+        """
+        steps = plan.pipeline
+        ids = {st.id: i for i, st in enumerate(steps)}
+        produced: Dict[str, int] = {}  # 产物文件名 -> 生成它的步骤
+        sources = {
+            Path(CodeGenerator._norm(p)).name
+            for p in [*(getattr(plan.settings, "data_sources", None) or []), *(data_files or [])] if p
+        }
+        file_deps: List[Set[int]] = [set() for _ in steps]
+        mem_deps: List[Set[int]] = [set() for _ in steps]
+
+        for j, st in enumerate(steps):
+            inputs = CodeGenerator._as_list(getattr(st, "inputs", None))
+            if not inputs:
+                mem_deps[j].update(range(j))
+            for raw in inputs:
+                text = CodeGenerator._norm(raw).strip()
+                name = Path(text).name
+                mentioned = {
+                    i for sid, i in ids.items()
+                    if i != j and re.search(rf"(?<![A-Za-z0-9]){re.escape(sid)}(?![A-Za-z0-9])", text)
+                }
+                is_file = " " not in text and bool(_FILE_SUFFIX.fullmatch(Path(text).suffix))
+                if name in produced:
+                    file_deps[j].add(produced[name])
+                elif any(i > j for i in mentioned):
+                    mem_deps[j].update(range(j))
+                elif mentioned:
+                    (file_deps if is_file else mem_deps)[j].update(mentioned)
+                elif not is_file or name not in sources:
+                    mem_deps[j].update(range(j))
+            for path in CodeGenerator._artifact_paths(st):
+                name = Path(CodeGenerator._norm(path)).name
+                if name in produced:
+                    file_deps[j].add(produced[name])  # 同名产物按原顺序写出
+                produced[name] = j
+
+        main = {j for j, d in enumerate(mem_deps) if d}.union(*mem_deps)
+        deps: Dict[int, Set[int]] = {}
+        prev_main: Optional[int] = None
+        for j in range(len(steps)):
+            deps[j] = file_deps[j] | mem_deps[j]
+            if j in main:
+                if prev_main is not None:
+                    deps[j].add(prev_main)
+                prev_main = j
+        return deps, set(range(len(steps))) - main
+
+    def _step_key(self, cg: "CodeGenerator", plan: PipelinePlanResponse, idx: int, cell: int) -> Optional[str]:
+        """步骤缓存键：单元代码 + 上游步骤的键 + 数据文件内容 + 随机种子；上游未知时不缓存。"""
+        if cg.step_cache is None:
+            return None
+        upstream = []
+        for d in sorted(cg.step_deps.get(idx, ())):
+            key = cg.step_hashes.get(plan.pipeline[d].id)
+            if key is None:
+                return None
+            upstream.append(key)
+        step = plan.pipeline[idx]
+        files = [self._norm(p) for p in (getattr(plan.settings, "data_sources", None) or [])]
+        files += [self._norm(p) for p in self._as_list(getattr(step, "inputs", None))]
+        data_path = getattr(cg.config, "data_path", None)
+        if data_path:
+            files.append(data_path)
+        seed = getattr(plan.settings, "random_seed", None) or 42
+        return cg.step_cache.step_key(cg.work_nb.nb["cells"][cell]["source"], upstream, files, seed)
+
+    async def _restore_step(self, cg: "CodeGenerator", run: StepRun, sid: str, cell: int) -> bool:
+        """命中步骤缓存时恢复产物与单元输出；主内核中的步骤再恢复变量（或推迟到后续步骤需要时重放）。"""
+        entry = await asyncio.to_thread(cg.step_cache.lookup, run.key)
+        if entry is None:
+            return False
+        try:
+            if run.checkpointed:
+                await run.kernel.rollback()
+            files = await asyncio.to_thread(cg.step_cache.restore, entry, cg.output_dir)
+            cg.work_nb.nb["cells"][cell]["outputs"] = [nbformat.from_dict(o) for o in entry["outputs"]]
+            if not run.isolated:
+                try:
+                    if not entry.get("namespace"):
+                        raise KernelError("no pickled namespace")
+                    await run.kernel.load_namespace(cg.step_cache.namespace_path(run.key))
+                except KernelError:
+                    run.kernel.defer(cell)
+        except Exception as e:
+            await self._log(cg, "execute", f"⚠️ [{sid}] 步骤缓存恢复失败，改为执行：{e!r}")
+            return False
+        run.last_error = None
+        run.restored = True
+        await self._log(cg, "execute", f"♻️ [{sid}] 命中步骤缓存（{run.key[:12]}），已恢复 {len(files)} 个产物，跳过执行。")
+        return True
+
+    async def _store_step(self, cg: "CodeGenerator", run: StepRun, sid: str, files: List[str]) -> None:
+        namespace = False
+        if cg.step_cache.namespace and not run.isolated and run.checkpointed:
+            try:
+                await run.kernel.dump_changes(cg.step_cache.namespace_path(run.key))
+                namespace = True
+            except KernelError as e:
+                await self._log(cg, "collect", f"ℹ️ [{sid}] 变量未能保存，缓存命中时将按需重放：{e}")
+        root = Path(cg.output_dir)
+        declared = [p.replace("{output_dir}", str(root)) for p in self._artifact_paths(cg.plan.pipeline[run.idx])]
+        outputs = json.loads(json.dumps(cg.work_nb.nb["cells"][cg.cell_index[sid]].get("outputs", [])))
+        try:
+            await asyncio.to_thread(
+                cg.step_cache.put, run.key, sorted(set(files + declared)), cg.output_dir, outputs, namespace
+            )
+        except Exception as e:
+            await self._log(cg, "collect", f"⚠️ [{sid}] 写入步骤缓存失败：{e!r}")
+
     # ========= 统一日志出口 ========= #
     async def _log(self, cg: "CodeGenerator", phase: str, msg: str) -> None:
         cg.logs.append(msg)
@@ -194,13 +350,69 @@ class CodeGenerator:
         except Exception:
             pass  # 日志失败不影响主流程
 
+    # ========= Notebook 单元 ========= #
+    def _add_cell(self, cg: "CodeGenerator", run: StepRun, content: str, code: bool = False,
+                  title: Optional[str] = None) -> int:
+        """向工作 notebook 追加属于该步骤的单元，返回其下标。"""
+        if code:
+            cg.work_nb.add_code_cell_to_notebook(content)
+        else:
+            cg.work_nb.add_markdown_to_notebook(content, title)
+        index = len(cg.work_nb.nb["cells"]) - 1
+        cg.step_cells.setdefault(run.idx, []).append(index)
+        return index
+
+    @staticmethod
+    def _commit_cells(cg: "CodeGenerator", final: bool = False) -> None:
+        """
+        把已归集步骤的单元按流水线顺序抄入 analysis.ipynb：某步骤之前的步骤全部写入后才写入它。
+        final=True（运行结束或出错）时写入所有剩余步骤，包括未完成的。
+        """
+        while cg._next_commit < len(cg.plan.pipeline) and (final or cg._next_commit in cg._collected):
+            for index in cg.step_cells.pop(cg._next_commit, []):
+                cg.nb.add_cell_to_notebook(copy.deepcopy(cg.work_nb.nb["cells"][index]))
+            cg._next_commit += 1
+
+    # ========= 单元执行实时输出 ========= #
+    async def _stream_cell_output(self, cg: "CodeGenerator", sid: str, output: Dict[str, Any]) -> None:
+        """把运行中单元的 stdout / 结果 / 报错 / 图像实时推送到 WebSocket。"""
+        websocket = getattr(cg.researcher, "websocket", None)
+        kind = output.get("output_type")
+        data = output.get("data", {}) if kind in ("display_data", "execute_result") else {}
+
+        if "image/png" in data:
+            uri = f"data:image/png;base64,{data['image/png']}"
+            await stream_output("images", "code_figure", json.dumps([uri]), websocket, True, {"step": sid})
+            return
+
+        if kind == "stream":
+            text = output.get("text", "")
+        elif kind == "error":
+            text = f"{output.get('ename')}: {output.get('evalue')}"
+        else:
+            text = data.get("text/plain", "")
+        text = text.rstrip()
+        if text and getattr(cg.researcher, "verbose", False):
+            await stream_output("logs", "code_output", f"[{sid}] {text}", websocket)
+
+    async def _stream_cell_progress(self, cg: "CodeGenerator", sid: str, elapsed: float) -> None:
+        await self._log(cg, "execute", f"⏳ [{sid}] 单元仍在运行（已用时 {elapsed:.0f}s）")
+
     # ========= LangGraph 节点（接收 CGState，返回 partial dict） ========= #
     async def n_init(self, state: CGState) -> Dict:
         cg = state["cg"]
         dirs = self._prep_output_dirs(cg.output_dir)
         nb_dir = dirs["nb"]
-        cg.nb = NotebookSerializer(work_dir=str(nb_dir), notebook_name="analysis.ipynb")
+        cg.nb = NotebookSerializer(
+            work_dir=str(nb_dir),
+            notebook_name="analysis.ipynb",
+            flush_interval=getattr(cg.config, "notebook_flush_interval", None),
+        )
         cg.nb_path = nb_dir / "analysis.ipynb"
+        cg.work_nb = NotebookSerializer()
+        cg.step_cells = {}
+        cg._collected = set()
+        cg._next_commit = 0
 
         s = state["plan"].settings
         ds = "\n".join(self._norm(p) for p in (getattr(s, "data_sources", None) or [])[:5])
@@ -214,9 +426,8 @@ class CodeGenerator:
             f"- 关键列: `{kc}`\n"
             f"- 输出目录: `{self._norm(cg.output_dir)}`"
         )
-        cg.idx = 0
         cg.attempts = {}
-        cg.last_error = None
+        cg.assets = {}
 
         await self._log(cg, "init", "🚀 初始化完成：Notebook 已创建，写入元信息。")
         return {"phase": "init"}
@@ -224,16 +435,17 @@ class CodeGenerator:
     async def n_build(self, state: CGState) -> Dict:
         cg = state["cg"]
         plan = state["plan"]
+        run = state["run"]
 
-        if cg.idx < 0 or cg.idx >= len(plan.pipeline):
-            msg = f"❌ BUILD 索引越界：idx={cg.idx}"
-            cg.last_error = msg
+        if run.idx < 0 or run.idx >= len(plan.pipeline):
+            msg = f"❌ BUILD 索引越界：idx={run.idx}"
+            run.last_error = msg
             await self._log(cg, "build", msg)
             return {"phase": "build"}
 
-        step = plan.pipeline[cg.idx]
+        step = plan.pipeline[run.idx]
         sid = step.id
-        cg.nb.add_markdown_segmentation_to_notebook(f"## {sid} · {step.name}\n\n**目标**：{step.objective}", sid)
+        self._add_cell(cg, run, f"## {sid} · {step.name}\n\n**目标**：{step.objective}", title=sid)
         await self._log(cg, "build", f"🧱 开始构建步骤：{sid}（{step.name}）")
 
         seed = getattr(plan.settings, "random_seed", None) or 42
@@ -264,69 +476,93 @@ class CodeGenerator:
             )
             await self._log(cg, "build", f"ℹ️ [{sid}] 已插入占位代码单元。")
 
-        cg.nb.add_code_cell_to_notebook(code)
-        cg.cell_index[sid] = len(cg.nb.nb["cells"]) - 1
-        cg.last_error = None
+        cg.cell_index[sid] = self._add_cell(cg, run, code, code=True)
+        run.last_error = None
         await self._log(cg, "build", f"✅ [{sid}] 构建完成，代码单元索引 {cg.cell_index[sid]}")
         return {"phase": "build"}
 
     async def n_execute(self, state: CGState) -> Dict:
         cg = state["cg"]
         plan = state["plan"]
-        step = plan.pipeline[cg.idx]
+        run = state["run"]
+        step = plan.pipeline[run.idx]
         sid = step.id
 
         if not cg.nb_path:
-            cg.last_error = "Notebook path is not initialized."
-            await self._log(cg, "execute", f"❌ [{sid}] 执行失败：{cg.last_error}")
+            run.last_error = "Notebook path is not initialized."
+            await self._log(cg, "execute", f"❌ [{sid}] 执行失败：{run.last_error}")
             return {"phase": "execute"}
 
         upto = cg.cell_index.get(sid)
         if upto is None:
-            cg.last_error = f"No cell index for step {sid}."
-            await self._log(cg, "execute", f"❌ [{sid}] 执行失败：{cg.last_error}")
+            run.last_error = f"No cell index for step {sid}."
+            await self._log(cg, "execute", f"❌ [{sid}] 执行失败：{run.last_error}")
+            return {"phase": "execute"}
+
+        # 缓存读写、数据文件哈希与产物复制都是阻塞 I/O，放到线程中执行
+        run.key = await asyncio.to_thread(self._step_key, cg, plan, run.idx, upto)
+        run.restored = False
+        if run.key and await self._restore_step(cg, run, sid, upto):
+            return {"phase": "execute"}
+
+        try:
+            if run.checkpointed:
+                # 同一步骤的修补/修订：回滚到该步骤开始前的状态，无需重放前面的单元
+                await run.kernel.rollback()
+                await self._log(cg, "execute", f"⏪ [{sid}] 已回滚到步骤开始前的内核状态。")
+            else:
+                # 变量缓存需要按内容比较步骤前后的变量，检查点时记录各变量的哈希
+                track = bool(cg.step_cache and cg.step_cache.namespace and not run.isolated)
+                await run.kernel.checkpoint(track_changes=track)
+                run.checkpointed = True
+        except Exception as e:
+            run.last_error = f"Kernel checkpoint failed: {e!r}"
+            await self._log(cg, "execute", f"❌ [{sid}] 执行错误：{run.last_error}")
             return {"phase": "execute"}
 
-        await self._log(cg, "execute", f"▶️ [{sid}] 开始执行至单元 {upto}")
-        ok, err = self._execute_until_cell(cg.nb_path, upto, cg.kernel, cg.timeout_sec)
+        await self._log(cg, "execute", f"▶️ [{sid}] 开始执行单元 {upto}")
+        ok, err = await run.kernel.execute_cell(
+            upto,
+            on_output=lambda output: self._stream_cell_output(cg, sid, output),
+            on_progress=lambda elapsed: self._stream_cell_progress(cg, sid, elapsed),
+            progress_interval=cg.progress_interval_sec,
+        )
         if ok:
-            cg.executed_up_to = sid
-            cg.last_error = None
+            run.last_error = None
             await self._log(cg, "execute", f"✅ [{sid}] 执行成功。")
         else:
-            cg.executed_up_to = None
-            cg.last_error = err or "Unknown execution error."
-            await self._log(cg, "execute", f"❌ [{sid}] 执行错误：{cg.last_error}")
+            run.last_error = err or "Unknown execution error."
+            await self._log(cg, "execute", f"❌ [{sid}] 执行错误：{run.last_error}")
         return {"phase": "execute"}
 
     @staticmethod
     def cond_after_execute(state: CGState) -> str:
-        cg = state["cg"]
-        return "ok" if cg.last_error is None else "fail"
+        return "ok" if state["run"].last_error is None else "fail"
 
     async def n_verify(self, state: CGState) -> Dict:
         cg = state["cg"]
         plan = state["plan"]
-        step = plan.pipeline[cg.idx]
+        run = state["run"]
+        step = plan.pipeline[run.idx]
         sid = step.id
         ok, missing = self._check_artifacts(step, cg.output_dir)
         if ok:
-            cg.last_error = None
+            run.last_error = None
             await self._log(cg, "verify", f"✅ [{sid}] 产物校验通过。")
         else:
-            cg.last_error = f"Missing artifacts: {missing}"
-            await self._log(cg, "verify", f"❌ [{sid}] 校验失败：{cg.last_error}")
+            run.last_error = f"Missing artifacts: {missing}"
+            await self._log(cg, "verify", f"❌ [{sid}] 校验失败：{run.last_error}")
         return {"phase": "verify"}
 
     @staticmethod
     def cond_after_verify(state: CGState) -> str:
-        cg = state["cg"]
-        return "ok" if cg.last_error is None else "need_fix"
+        return "ok" if state["run"].last_error is None else "need_fix"
 
     async def n_fix_or_revise(self, state: CGState) -> Dict:
         cg = state["cg"]
         plan = state["plan"]
-        step = plan.pipeline[cg.idx]
+        run = state["run"]
+        step = plan.pipeline[run.idx]
         sid = step.id
 
         att = cg.attempts.get(sid, 0) + 1
@@ -336,7 +572,7 @@ class CodeGenerator:
         prev_idx = cg.cell_index.get(sid, None)
         prev_code = None
         if prev_idx is not None:
-            prev_code = cg.nb.nb["cells"][prev_idx]["source"]
+            prev_code = cg.work_nb.nb["cells"][prev_idx]["source"]
 
         # 尝试修补
         if att <= cg.max_attempts_per_step:
@@ -346,7 +582,7 @@ class CodeGenerator:
                 try:
                     resp = await cg.fix_llm(
                         step=step,
-                        error_text=cg.last_error or "",
+                        error_text=run.last_error or "",
                         prev_code=prev_code or "",
                         out_dir=cg.output_dir,
                         seed=seed,
@@ -361,9 +597,8 @@ class CodeGenerator:
                     await self._log(cg, "fix", f"❌ [{sid}] fix_llm 异常：{e!r}")
 
             if new_code:
-                cg.nb.add_markdown_to_notebook(f"> ♻️ 第 {sid} 步修补尝试（第 {att} 次）")
-                cg.nb.add_code_cell_to_notebook(new_code)
-                cg.cell_index[sid] = len(cg.nb.nb["cells"]) - 1
+                self._add_cell(cg, run, f"> ♻️ 第 {sid} 步修补尝试（第 {att} 次）")
+                cg.cell_index[sid] = self._add_cell(cg, run, new_code, code=True)
                 await self._log(cg, "fix", f"✅ [{sid}] 修补代码已写入，转入执行。")
                 return {"phase": "fix_or_revise"}
 
@@ -384,7 +619,7 @@ class CodeGenerator:
             try:
                 resp = await cg.revise_llm(
                     step=step,
-                    error_text=cg.last_error or "",
+                    error_text=run.last_error or "",
                     prev_code=prev_code or "",
                     out_dir=cg.output_dir,
                     seed=seed,
@@ -397,32 +632,30 @@ class CodeGenerator:
                 if isinstance(resp, dict):
                     kind = resp.get("kind")
                     if kind == "step" and resp.get("step"):
-                        plan.pipeline[cg.idx] = resp["step"]
-                        cg.nb.add_markdown_to_notebook(f"> 🔁 已修订当前步骤：{sid}")
+                        plan.pipeline[run.idx] = resp["step"]
+                        self._add_cell(cg, run, f"> 🔁 已修订当前步骤：{sid}")
                         await self._log(cg, "revise", f"✅ [{sid}] 已替换为新的 step。")
                         revised = True
                     elif kind == "plan" and resp.get("plan"):
                         state["plan"] = resp["plan"]  # 用新的 plan 更新到 state
-                        cg.nb.add_markdown_to_notebook("> 🔁 已修订整体计划")
+                        self._add_cell(cg, run, "> 🔁 已修订整体计划")
                         await self._log(cg, "revise", f"✅ [{sid}] 已替换为新的 plan。")
                         revised = True
                     elif kind == "code" and isinstance(resp.get("code"), str) and resp.get("code").strip():
-                        cg.nb.add_markdown_to_notebook(f"> 🔁 修订直接给出新代码：{sid}")
-                        cg.nb.add_code_cell_to_notebook(resp["code"].strip())
-                        cg.cell_index[sid] = len(cg.nb.nb["cells"]) - 1
+                        self._add_cell(cg, run, f"> 🔁 修订直接给出新代码：{sid}")
+                        cg.cell_index[sid] = self._add_cell(cg, run, resp["code"].strip(), code=True)
                         await self._log(cg, "revise", f"✅ [{sid}] 修订代码已写入。")
                         revised = True
                     else:
-                        cg.nb.add_markdown_to_notebook("> ⚠️ revise 未返回可用对象，保留原计划")
+                        self._add_cell(cg, run, "> ⚠️ revise 未返回可用对象，保留原计划")
                         await self._log(cg, "revise", f"⚠️ [{sid}] revise 未返回可用对象。")
                 elif isinstance(resp, str) and resp.strip():
-                    cg.nb.add_markdown_to_notebook(f"> 🔁 修订直接给出新代码：{sid}")
-                    cg.nb.add_code_cell_to_notebook(resp.strip())
-                    cg.cell_index[sid] = len(cg.nb.nb["cells"]) - 1
+                    self._add_cell(cg, run, f"> 🔁 修订直接给出新代码：{sid}")
+                    cg.cell_index[sid] = self._add_cell(cg, run, resp.strip(), code=True)
                     await self._log(cg, "revise", f"✅ [{sid}] 修订代码已写入（字符串）。")
                     revised = True
                 else:
-                    cg.nb.add_markdown_to_notebook("> ⚠️ revise 未返回内容")
+                    self._add_cell(cg, run, "> ⚠️ revise 未返回内容")
                     await self._log(cg, "revise", f"⚠️ [{sid}] revise 未返回内容。")
             except Exception as e:
                 await self._log(cg, "revise", f"❌ [{sid}] revise_llm 异常：{e!r}")
@@ -436,38 +669,89 @@ class CodeGenerator:
     async def n_collect(self, state: CGState) -> Dict:
         cg = state["cg"]
         plan = state["plan"]
+        run = state["run"]
+        sid = plan.pipeline[run.idx].id
         root = Path(cg.output_dir)
-        out: Dict[str, Dict[str, List[str]]] = {}
-        for st in plan.pipeline:
-            sid = st.id
-            figs = sorted(str(p.as_posix()) for p in (root / "figures").glob(f"{sid}__*.png"))
-            tabs = sorted(str(p.as_posix()) for p in (root / "tables").glob(f"{sid}__*.csv"))
-            mets = sorted(str(p.as_posix()) for p in (root / "metrics").glob(f"{sid}__*.jsonl"))
-            out[sid] = {"figures": figs, "tables": tabs, "metrics": mets}
-        cg.assets = out
-        cg.last_error = None
-        await self._log(cg, "collect", "📦 产物归集完成。")
-
-        # 路由：还有下一步则回到 build，否则结束
-        if cg.idx < len(plan.pipeline) - 1:
-            cg.idx += 1
-            return {"phase": "collect", "route_hint": "build"}
-        return {"phase": "collect", "route_hint": "end"}
-
-    @staticmethod
-    def after_collect(state: CGState) -> str:
-        return state.get("route_hint", "end")
+        figs = sorted(str(p.as_posix()) for p in (root / "figures").glob(f"{sid}__*.png"))
+        tabs = sorted(str(p.as_posix()) for p in (root / "tables").glob(f"{sid}__*.csv"))
+        mets = sorted(str(p.as_posix()) for p in (root / "metrics").glob(f"{sid}__*.jsonl"))
+        cg.assets[sid] = {"figures": figs, "tables": tabs, "metrics": mets}
+        run.last_error = None
+        if run.key:
+            if not run.restored:
+                await self._store_step(cg, run, sid, figs + tabs + mets)
+            cg.step_hashes[sid] = run.key
+        if run.checkpointed:
+            await run.kernel.discard_checkpoint()
+            run.checkpointed = False
+        cg._collected.add(run.idx)
+        self._commit_cells(cg)
+        await self._log(cg, "collect", f"📦 [{sid}] 产物归集完成。")
+        return {"phase": "collect"}
+
+    # ========= 步骤调度 ========= #
+    async def _run_step(self, app: Any, plan: PipelinePlanResponse, idx: int, isolated: bool) -> None:
+        """在主内核（或独立内核）中跑完单个步骤的 build → execute → verify/fix → collect。"""
+        if not isolated:
+            await app.ainvoke({"cg": self, "plan": plan, "run": StepRun(idx=idx, kernel=self.kernel_session)})
+            return
+
+        # 独立内核用完后清空命名空间放回空闲池，后续步骤复用（免去内核启动与库导入）
+        if self._idle_kernels:
+            kernel = self._idle_kernels.pop()
+        else:
+            kernel = KernelSession(self.work_nb.nb, kernel=self.kernel, timeout=self.timeout_sec)
+        try:
+            await app.ainvoke({"cg": self, "plan": plan, "run": StepRun(idx=idx, kernel=kernel, isolated=True)})
+            await kernel.reset()
+        except BaseException:
+            await kernel.shutdown()
+            raise
+        self._idle_kernels.append(kernel)
+
+    async def _run_pipeline(self, app: Any, plan: PipelinePlanResponse) -> None:
+        """按依赖图执行各步骤：无依赖关系的步骤最多 max_parallel_steps 个同时执行。"""
+        n = len(plan.pipeline)
+        data_path = getattr(self.config, "data_path", None)
+        analysis = self._step_dependencies(plan, [data_path] if data_path else None)
+        self.step_deps = analysis[0]
+        if self.max_parallel_steps > 1:
+            deps, isolated = analysis
+        else:
+            deps, isolated = {j: ({j - 1} if j else set()) for j in range(n)}, set()
+        if isolated:
+            names = ", ".join(plan.pipeline[j].id for j in sorted(isolated))
+            await self._log(self, "init", f"🔀 以下步骤只通过文件衔接，将在独立内核中并行执行：{names}")
+
+        done = [asyncio.Event() for _ in range(n)]
+        slots = asyncio.Semaphore(self.max_parallel_steps)
+
+        async def run_one(j: int) -> None:
+            for d in deps[j]:
+                await done[d].wait()
+            async with slots:
+                await self._run_step(app, plan, j, j in isolated)
+            done[j].set()
+
+        tasks = [asyncio.create_task(run_one(j)) for j in range(n)]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # 任一步骤失败即停止其余步骤，并等待其内核关闭
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
 
     # ========= 对外运行入口 ========= #
     async def run(self, plan: PipelinePlanResponse) -> "CodeGenerator":
         # 将 plan 也存到实例上（保留你原有的行为）
         self.plan = plan
 
-        # 1) 用 StateGraph 声明 **状态 schema**（不是业务类）
+        # 1) 用 StateGraph 声明 **状态 schema**（不是业务类）；图只负责单个步骤
         g = StateGraph(CGState)
 
         # 2) 注册节点（节点函数均返回 dict 增量）
-        g.add_node("init", self.n_init)
         g.add_node("build", self.n_build)
         g.add_node("execute", self.n_execute)
         g.add_node("verify", self.n_verify)
@@ -475,8 +759,7 @@ class CodeGenerator:
         g.add_node("collect", self.n_collect)
 
         # 3) 连接边
-        g.set_entry_point("init")
-        g.add_edge("init", "build")
+        g.set_entry_point("build")
         g.add_edge("build", "execute")
         g.add_conditional_edges("execute", CodeGenerator.cond_after_execute, {
             "ok": "verify",
@@ -487,18 +770,28 @@ class CodeGenerator:
             "need_fix": "fix_or_revise",
         })
         g.add_edge("fix_or_revise", "execute")
-        g.add_conditional_edges("collect", CodeGenerator.after_collect, {
-            "build": "build",
-            "end": END,
-        })
+        g.add_edge("collect", END)
 
         app = g.compile()
 
-        # 4) 以 **初始 state（dict）** 运行，而不是把 self 当作 state
-        final_state: CGState = await app.ainvoke({
-            "cg": self,
-            "plan": plan,
-        })
+        # 4) 初始化 Notebook 后按依赖图调度各步骤（各步骤以独立的初始 state 运行）
+        await self.n_init({"cg": self, "plan": plan})
+        self.step_hashes = {}
+        self.kernel_session = KernelSession(self.work_nb.nb, kernel=self.kernel, timeout=self.timeout_sec)
+        try:
+            await self._run_pipeline(app, plan)
+        finally:
+            for kernel in [self.kernel_session, *self._idle_kernels]:
+                await kernel.shutdown()
+            self.kernel_session = None
+            self._idle_kernels = []
+            self._commit_cells(self, final=True)
+            self.nb.flush()
+        self.assets = {st.id: self.assets[st.id] for st in plan.pipeline if st.id in self.assets}
+        if self.step_cache is not None:
+            stats = self.step_cache.stats()
+            await self._log(self, "collect", f"♻️ 步骤缓存：命中 {stats['hits']} 次，未命中 {stats['misses']} 次。")
+            await asyncio.to_thread(self.step_cache.prune)
 
         # 5) 需要的结果直接返回实例（实例中的 nb/assets/logs 等都已更新）
         return self
@@ -24,12 +24,34 @@ class ContextManager:
             documents=pages,
             embeddings=self.researcher.memory.get_embeddings(),
             prompt_family=self.researcher.prompt_family,
+            cfg=self.researcher.cfg,
             **self.researcher.kwargs
         )
         return await context_compressor.async_get_context(
             query=query, max_results=10, cost_callback=self.researcher.add_costs
         )
 
+    async def get_similar_content_by_queries(self, queries: List[str], pages) -> List[str]:
+        """Get the relevant content of several queries at once, one context string per query."""
+        if self.researcher.verbose:
+            await stream_output(
+                "logs",
+                "fetching_query_content",
+                f"📚 Getting relevant content based on {len(queries)} queries: {queries}...",
+                self.researcher.websocket,
+            )
+
+        context_compressor = ContextCompressor(
+            documents=pages,
+            embeddings=self.researcher.memory.get_embeddings(),
+            prompt_family=self.researcher.prompt_family,
+            cfg=self.researcher.cfg,
+            **self.researcher.kwargs
+        )
+        return await context_compressor.async_get_contexts(
+            queries=queries, max_results=10, cost_callback=self.researcher.add_costs
+        )
+
     async def get_similar_content_by_query_with_vectorstore(self, query, filter):
         if self.researcher.verbose:
             await stream_output(
@@ -80,6 +102,7 @@ class ContextManager:
             documents=written_contents,
             embeddings=self.researcher.memory.get_embeddings(),
             similarity_threshold=similarity_threshold,
+            cfg=self.researcher.cfg,
             **self.researcher.kwargs
         )
         return await written_content_compressor.async_get_context(
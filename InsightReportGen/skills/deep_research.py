@@ -6,6 +6,7 @@ from datetime import datetime, timedelta
 
 from gpt_researcher.llm_provider.generic.base import ReasoningEfforts
 from ..utils.llm import create_chat_completion
+from ..llm_provider.scheduler import LLMPriority
 from ..utils.enum import ReportType, ReportSource, Tone
 from ..actions.query_processing import get_search_results
 
@@ -43,6 +44,21 @@ class ResearchProgress:
         self.current_query: Optional[str] = None
         self.total_queries = 0
         self.completed_queries = 0
+        self.active_queries = 0  # Queries being researched right now
+        self.stopped_reason: Optional[str] = None  # "time_budget" or "cost_budget" when stopped early
+
+
+class _WorkItem:
+    """A unit of deep research work: expanding a prompt into search queries, or researching one query."""
+
+    def __init__(self, kind: str, depth_level: int, breadth: int, depth: int,
+                 query: Optional[str] = None, serp_query: Optional[Dict[str, str]] = None):
+        self.kind = kind  # "expand" or "research"
+        self.depth_level = depth_level  # 1 for the top level
+        self.breadth = breadth
+        self.depth = depth  # Levels left, including this one
+        self.query = query
+        self.serp_query = serp_query
 
 
 class DeepResearchSkill:
@@ -51,6 +67,8 @@ class DeepResearchSkill:
         self.breadth = getattr(researcher.cfg, 'deep_research_breadth', 4)
         self.depth = getattr(researcher.cfg, 'deep_research_depth', 2)
         self.concurrency_limit = getattr(researcher.cfg, 'deep_research_concurrency', 2)
+        self.time_budget = getattr(researcher.cfg, 'deep_research_time_budget', 0)
+        self.cost_budget = getattr(researcher.cfg, 'deep_research_cost_budget', 0)
         self.websocket = researcher.websocket
         self.tone = researcher.tone
         self.config_path = researcher.cfg.config_path if hasattr(researcher.cfg, 'config_path') else None
@@ -71,7 +89,9 @@ class DeepResearchSkill:
         response = await create_chat_completion(
             messages=messages,
             llm_provider=self.researcher.cfg.strategic_llm_provider,
+            priority=LLMPriority.PLANNING,
             model=self.researcher.cfg.strategic_llm_model,
+            cost_callback=self.researcher.add_costs,
             reasoning_effort=self.researcher.cfg.reasoning_effort,
             temperature=0.4
         )
@@ -121,7 +141,9 @@ Format each question on a new line starting with 'Question: '"""}
         response = await create_chat_completion(
             messages=messages,
             llm_provider=self.researcher.cfg.strategic_llm_provider,
+            priority=LLMPriority.PLANNING,
             model=self.researcher.cfg.strategic_llm_model,
+            cost_callback=self.researcher.add_costs,
             reasoning_effort=ReasoningEfforts.High.value,
             temperature=0.4
         )
@@ -142,7 +164,9 @@ Format each question on a new line starting with 'Question: '"""}
         response = await create_chat_completion(
             messages=messages,
             llm_provider=self.researcher.cfg.strategic_llm_provider,
+            priority=LLMPriority.PLANNING,
             model=self.researcher.cfg.strategic_llm_model,
+            cost_callback=self.researcher.add_costs,
             temperature=0.4,
             reasoning_effort=ReasoningEfforts.High.value,
             max_tokens=1000
@@ -183,6 +207,52 @@ Format each question on a new line starting with 'Question: '"""}
             'citations': citations
         }
 
+    async def process_query(self, serp_query: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        """Research one search query and extract its learnings and follow-up questions."""
+        try:
+            # Children share the parent's clients, worker pool and caches, and add their costs to it.
+            # Branches skip URLs another branch already scraped.
+            researcher = self.researcher.spawn_child(
+                query=serp_query['query'],
+                report_type=ReportType.ResearchReport.value,
+                report_source=ReportSource.Web.value,
+                shared_visited_urls=self.visited_urls
+            )
+
+            # Conduct research
+            context = await researcher.conduct_research()
+
+            # Get results and visited URLs
+            visited = researcher.visited_urls
+            sources = researcher.research_sources
+
+            # Process results to extract learnings and citations
+            results = await self.process_research_results(
+                query=serp_query['query'],
+                context=context
+            )
+
+            return {
+                'learnings': results['learnings'],
+                'visited_urls': list(visited),
+                'followUpQuestions': results['followUpQuestions'],
+                'researchGoal': serp_query.get('researchGoal', ''),
+                'citations': results['citations'],
+                'context': context if context else "",
+                'sources': sources if sources else []
+            }
+
+        except Exception as e:
+            logger.error(f"Error processing query '{serp_query['query']}': {str(e)}")
+            return None
+
+    def _budget_exceeded(self, start_time: float, start_costs: float) -> Optional[str]:
+        if self.time_budget and time.time() - start_time >= self.time_budget:
+            return "time_budget"
+        if self.cost_budget and self.researcher.get_costs() - start_costs >= self.cost_budget:
+            return "cost_budget"
+        return None
+
     async def deep_research(
             self,
             query: str,
@@ -193,7 +263,14 @@ Format each question on a new line starting with 'Question: '"""}
             visited_urls: Set[str] = None,
             on_progress=None
     ) -> Dict[str, Any]:
-        """Conduct deep iterative research"""
+        """
+        Conduct deep iterative research.
+
+        All levels share one work queue served by `concurrency_limit` workers in
+        breadth-first order: the follow-up branch of a query is queued as soon as that
+        query finishes and runs alongside the other branches. Queued work is dropped
+        once the DEEP_RESEARCH_TIME_BUDGET or DEEP_RESEARCH_COST_BUDGET is spent.
+        """
         if learnings is None:
             learnings = []
         if citations is None:
@@ -202,13 +279,87 @@ Format each question on a new line starting with 'Question: '"""}
             visited_urls = set()
 
         progress = ResearchProgress(depth, breadth)
+        start_time = time.time()
+        start_costs = self.researcher.get_costs()
+
+        def report_progress():
+            if on_progress:
+                on_progress(progress)
+
+        report_progress()
+
+        # Shallower levels first; FIFO within a level
+        queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        sequence = 0
+        results: List[tuple] = []
+        completed_per_level: Dict[int, int] = {}
+
+        def enqueue(item: _WorkItem) -> None:
+            nonlocal sequence
+            sequence += 1
+            queue.put_nowait((item.depth_level, sequence, item))
+
+        async def expand(item: _WorkItem) -> None:
+            serp_queries = await self.generate_search_queries(item.query, num_queries=item.breadth)
+            progress.total_queries += len(serp_queries)
+            report_progress()
+            for serp_query in serp_queries:
+                enqueue(_WorkItem("research", item.depth_level, item.breadth, item.depth, serp_query=serp_query))
+
+        async def research(item: _WorkItem, order: int) -> None:
+            progress.current_query = item.serp_query['query']
+            progress.current_depth = max(progress.current_depth, item.depth_level)
+            progress.active_queries += 1
+            report_progress()
+            try:
+                result = await self.process_query(item.serp_query)
+            finally:
+                progress.active_queries -= 1
+
+            progress.completed_queries += 1
+            if result is not None:
+                results.append((item.depth_level, order, result))
+                completed_per_level[item.depth_level] = completed_per_level.get(item.depth_level, 0) + 1
+                progress.current_breadth = completed_per_level[item.depth_level]
+
+                # Queue the follow-up branch right away instead of waiting for the whole level
+                if item.depth > 1 and not progress.stopped_reason:
+                    next_query = f"""
+                Previous research goal: {result['researchGoal']}
+                Follow-up questions: {' '.join(result['followUpQuestions'])}
+                """
+                    enqueue(_WorkItem("expand", item.depth_level + 1, max(2, item.breadth // 2), item.depth - 1,
+                                      query=next_query))
+            report_progress()
 
-        if on_progress:
-            on_progress(progress)
-
-        # Generate search queries
-        serp_queries = await self.generate_search_queries(query, num_queries=breadth)
-        progress.total_queries = len(serp_queries)
+        async def worker() -> None:
+            while True:
+                _, order, item = await queue.get()
+                try:
+                    if not progress.stopped_reason:
+                        progress.stopped_reason = self._budget_exceeded(start_time, start_costs)
+                        if progress.stopped_reason:
+                            logger.info(f"Deep research stopped early: {progress.stopped_reason} reached")
+                            report_progress()
+                    if progress.stopped_reason:
+                        continue
+                    if item.kind == "expand":
+                        await expand(item)
+                    else:
+                        await research(item, order)
+                except Exception as e:
+                    logger.error(f"Error in deep research work item: {e}")
+                finally:
+                    queue.task_done()
+
+        enqueue(_WorkItem("expand", 1, breadth, depth, query=query))
+        workers = [asyncio.create_task(worker()) for _ in range(max(1, self.concurrency_limit))]
+        try:
+            await queue.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
 
         all_learnings = learnings.copy()
         all_citations = citations.copy()
@@ -216,73 +367,8 @@ Format each question on a new line starting with 'Question: '"""}
         all_context = []
         all_sources = []
 
-        # Process queries with concurrency limit
-        semaphore = asyncio.Semaphore(self.concurrency_limit)
-
-        async def process_query(serp_query: Dict[str, str]) -> Optional[Dict[str, Any]]:
-            async with semaphore:
-                try:
-                    progress.current_query = serp_query['query']
-                    if on_progress:
-                        on_progress(progress)
-
-                    from .. import GPTResearcher
-                    researcher = GPTResearcher(
-                        query=serp_query['query'],
-                        report_type=ReportType.ResearchReport.value,
-                        report_source=ReportSource.Web.value,
-                        tone=self.tone,
-                        websocket=self.websocket,
-                        config_path=self.config_path,
-                        headers=self.headers,
-                        visited_urls=self.visited_urls
-                    )
-
-                    # Conduct research
-                    context = await researcher.conduct_research()
-
-                    # Get results and visited URLs
-                    visited = researcher.visited_urls
-                    sources = researcher.research_sources
-
-                    # Process results to extract learnings and citations
-                    results = await self.process_research_results(
-                        query=serp_query['query'],
-                        context=context
-                    )
-
-                    # Update progress
-                    progress.completed_queries += 1
-                    progress.current_breadth += 1
-                    if on_progress:
-                        on_progress(progress)
-
-                    return {
-                        'learnings': results['learnings'],
-                        'visited_urls': list(visited),
-                        'followUpQuestions': results['followUpQuestions'],
-                        'researchGoal': serp_query['researchGoal'],
-                        'citations': results['citations'],
-                        'context': context if context else "",
-                        'sources': sources if sources else []
-                    }
-
-                except Exception as e:
-                    logger.error(f"Error processing query '{serp_query['query']}': {str(e)}")
-                    return None
-
-        # Process queries concurrently with limit
-        tasks = [process_query(query) for query in serp_queries]
-        results = await asyncio.gather(*tasks)
-        results = [r for r in results if r is not None]
-
-        # Update breadth progress based on successful queries
-        progress.current_breadth = len(results)
-        if on_progress:
-            on_progress(progress)
-
-        # Collect all results
-        for result in results:
+        # Collect results in breadth-first order
+        for _, _, result in sorted(results, key=lambda entry: entry[:2]):
             all_learnings.extend(result['learnings'])
             all_visited_urls.update(result['visited_urls'])
             all_citations.update(result['citations'])
@@ -291,37 +377,6 @@ Format each question on a new line starting with 'Question: '"""}
             if result['sources']:
                 all_sources.extend(result['sources'])
 
-            # Continue deeper if needed
-            if depth > 1:
-                new_breadth = max(2, breadth // 2)
-                new_depth = depth - 1
-                progress.current_depth += 1
-
-                # Create next query from research goal and follow-up questions
-                next_query = f"""
-                Previous research goal: {result['researchGoal']}
-                Follow-up questions: {' '.join(result['followUpQuestions'])}
-                """
-
-                # Recursive research
-                deeper_results = await self.deep_research(
-                    query=next_query,
-                    breadth=new_breadth,
-                    depth=new_depth,
-                    learnings=all_learnings,
-                    citations=all_citations,
-                    visited_urls=all_visited_urls,
-                    on_progress=on_progress
-                )
-
-                all_learnings = deeper_results['learnings']
-                all_visited_urls.update(deeper_results['visited_urls'])
-                all_citations.update(deeper_results['citations'])
-                if deeper_results.get('context'):
-                    all_context.extend(deeper_results['context'])
-                if deeper_results.get('sources'):
-                    all_sources.extend(deeper_results['sources'])
-
         # Update class tracking
         self.context.extend(all_context)
         self.research_sources.extend(all_sources)
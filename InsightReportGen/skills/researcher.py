@@ -1185,10 +1185,13 @@
 
 import asyncio
 import random
+import time
 import logging
 import os
 from ..actions.utils import stream_output
-from ..actions.query_processing import plan_research_outline, get_search_results
+from ..actions.query_processing import plan_research_outline, get_search_results, run_retriever_search
+from ..retrievers.cache import get_search_cache_stats
+from ..llm_provider.scheduler import get_scheduler_stats
 from ..document import DocumentLoader, OnlineDocumentLoader, LangChainDocumentLoader
 from ..utils.enum import ReportSource, ReportType
 from ..utils.logging_config import get_json_handler
@@ -1443,6 +1446,10 @@ class ResearchConductor:
                 self.json_handler.update_content("costs", self.researcher.get_costs())
                 self.json_handler.update_content("context", self.researcher.context)
 
+        self._log_search_cache_stats()
+        self._log_llm_scheduler_stats()
+        self._log_scrape_metrics()
+        self._log_page_cache_stats()
         self.logger.info(f"Research completed. Context size: {len(str(self.researcher.context))}")
         return self.researcher.context
 
@@ -1601,12 +1608,15 @@ class ResearchConductor:
 
         # Using asyncio.gather to process the sub_queries asynchronously
         try:
-            contexts = await asyncio.gather(
-                *[
-                    self._process_sub_query(sub_query, scraped_data, query_domains)
-                    for sub_query in sub_queries
-                ]
-            )
+            if self.researcher.cfg.context_batch_queries:
+                contexts = await self._process_sub_queries_batched(sub_queries, scraped_data, query_domains)
+            else:
+                contexts = await asyncio.gather(
+                    *[
+                        self._process_sub_query(sub_query, scraped_data, query_domains)
+                        for sub_query in sub_queries
+                    ]
+                )
             self.logger.info(f"Gathered context from {len(contexts)} sub-queries")
 
             # Filter out empty results
@@ -1728,6 +1738,80 @@ class ResearchConductor:
 
     async def _process_sub_query(self, sub_query: str, scraped_data: list = [], query_domains: list = []):
         """Takes in a sub query and scrapes urls based on it and gathers context."""
+        try:
+            mcp_context, scraped_data = await self._collect_sub_query_sources(sub_query, scraped_data, query_domains)
+
+            # Get similar content based on scraped data
+            web_context = ""
+            if scraped_data:
+                web_context = await self.researcher.context_manager.get_similar_content_by_query(sub_query, scraped_data)
+                self.logger.info(f"Web content found for sub-query: {len(str(web_context)) if web_context else 0} chars")
+
+            return await self._combine_sub_query_context(sub_query, mcp_context, web_context)
+
+        except Exception as e:
+            self.logger.error(f"Error processing sub-query {sub_query}: {e}", exc_info=True)
+            if self.researcher.verbose:
+                await stream_output(
+                    "logs",
+                    "subquery_error",
+                    f"❌ Error processing '{sub_query}': {str(e)}",
+                    self.researcher.websocket,
+                )
+            return ""
+
+    async def _process_sub_queries_batched(self, sub_queries: list[str], scraped_data: list = [],
+                                           query_domains: list = []) -> list[str]:
+        """
+        Gathers context for all sub queries at once.
+
+        Sources are collected for every sub query concurrently, then all sub queries are
+        scored together against the union of their scraped chunks, so the queries are
+        embedded in one call and the chunks are scored in one pass.
+        """
+        async def collect(sub_query):
+            try:
+                return await self._collect_sub_query_sources(sub_query, scraped_data, query_domains)
+            except Exception as e:
+                self.logger.error(f"Error processing sub-query {sub_query}: {e}", exc_info=True)
+                if self.researcher.verbose:
+                    await stream_output(
+                        "logs",
+                        "subquery_error",
+                        f"❌ Error processing '{sub_query}': {str(e)}",
+                        self.researcher.websocket,
+                    )
+                return None
+
+        sources = await asyncio.gather(*[collect(sub_query) for sub_query in sub_queries])
+
+        # Union of the scraped pages, each page only once
+        pages, seen = [], set()
+        for source in sources:
+            for page in (source[1] if source else []):
+                key = (page.get("url"), page.get("raw_content"))
+                if key not in seen:
+                    seen.add(key)
+                    pages.append(page)
+
+        web_contexts = [""] * len(sub_queries)
+        if pages:
+            try:
+                web_contexts = await self.researcher.context_manager.get_similar_content_by_queries(sub_queries, pages)
+            except Exception as e:
+                self.logger.error(f"Error getting batched context for sub-queries: {e}", exc_info=True)
+
+        contexts = []
+        for sub_query, source, web_context in zip(sub_queries, sources, web_contexts):
+            if source is None:
+                contexts.append("")
+                continue
+            self.logger.info(f"Web content found for sub-query: {len(str(web_context)) if web_context else 0} chars")
+            contexts.append(await self._combine_sub_query_context(sub_query, source[0], web_context))
+        return contexts
+
+    async def _collect_sub_query_sources(self, sub_query: str, scraped_data: list, query_domains: list) -> tuple[list, list]:
+        """Gets the MCP context and the scraped pages for a sub query."""
         if self.json_handler:
             self.json_handler.log_event("sub_query", {
                 "query": sub_query,
@@ -1742,116 +1826,105 @@ class ResearchConductor:
                 self.researcher.websocket,
             )
 
-        try:
-            # Identify MCP retrievers
-            mcp_retrievers = [r for r in self.researcher.retrievers if "mcpretriever" in r.__name__.lower()]
-            non_mcp_retrievers = [r for r in self.researcher.retrievers if "mcpretriever" not in r.__name__.lower()]
-
-            # Initialize context components
-            mcp_context = []
-            web_context = ""
-
-            # Get MCP strategy configuration
-            mcp_strategy = self._get_mcp_strategy()
-
-            # **CONFIGURABLE MCP PROCESSING**
-            if mcp_retrievers:
-                if mcp_strategy == "disabled":
-                    self.logger.info(f"MCP disabled for sub-query: {sub_query}")
-                elif mcp_strategy == "fast" and self._mcp_results_cache is not None:
-                    mcp_context = self._mcp_results_cache.copy()
-
-                    if self.researcher.verbose:
-                        await stream_output(
-                            "logs",
-                            "mcp_cache_reuse",
-                            f"♻️ Reusing cached MCP results ({len(mcp_context)} sources) for: {sub_query}",
-                            self.researcher.websocket,
-                        )
-
-                    self.logger.info(f"Reused {len(mcp_context)} cached MCP results for sub-query: {sub_query}")
-                elif mcp_strategy == "deep":
-                    self.logger.info(f"Running deep MCP research for: {sub_query}")
-                    if self.researcher.verbose:
-                        await stream_output(
-                            "logs",
-                            "mcp_comprehensive_run",
-                            f"🔍 Running deep MCP research for: {sub_query}",
-                            self.researcher.websocket,
-                        )
-
-                    mcp_context = await self._execute_mcp_research_for_queries([sub_query], mcp_retrievers)
-                else:
-                    self.logger.warning("MCP cache not available, falling back to per-sub-query execution")
-                    if self.researcher.verbose:
-                        await stream_output(
-                            "logs",
-                            "mcp_fallback",
-                            f"🔌 MCP cache unavailable, running MCP research for: {sub_query}",
-                            self.researcher.websocket,
-                        )
-
-                    mcp_context = await self._execute_mcp_research_for_queries([sub_query], mcp_retrievers)
+        # Identify MCP retrievers
+        mcp_retrievers = [r for r in self.researcher.retrievers if "mcpretriever" in r.__name__.lower()]
+        non_mcp_retrievers = [r for r in self.researcher.retrievers if "mcpretriever" not in r.__name__.lower()]
 
-            # Get web search context using non-MCP retrievers (if no scraped data provided)
-            if not scraped_data:
-                scraped_data = await self._scrape_data_by_urls(sub_query, query_domains)
-                self.logger.info(f"Scraped data size: {len(scraped_data)}")
+        # Initialize context components
+        mcp_context = []
 
-            # Get similar content based on scraped data
-            if scraped_data:
-                web_context = await self.researcher.context_manager.get_similar_content_by_query(sub_query, scraped_data)
-                self.logger.info(f"Web content found for sub-query: {len(str(web_context)) if web_context else 0} chars")
+        # Get MCP strategy configuration
+        mcp_strategy = self._get_mcp_strategy()
 
-            # Combine MCP context with web context intelligently
-            combined_context = self._combine_mcp_and_web_context(mcp_context, web_context, sub_query)
+        # **CONFIGURABLE MCP PROCESSING**
+        if mcp_retrievers:
+            if mcp_strategy == "disabled":
+                self.logger.info(f"MCP disabled for sub-query: {sub_query}")
+            elif mcp_strategy == "fast" and self._mcp_results_cache is not None:
+                mcp_context = self._mcp_results_cache.copy()
 
-            # Log context combination results
-            if combined_context:
-                context_length = len(str(combined_context))
-                self.logger.info(f"Combined context for '{sub_query}': {context_length} chars")
+                if self.researcher.verbose:
+                    await stream_output(
+                        "logs",
+                        "mcp_cache_reuse",
+                        f"♻️ Reusing cached MCP results ({len(mcp_context)} sources) for: {sub_query}",
+                        self.researcher.websocket,
+                    )
 
+                self.logger.info(f"Reused {len(mcp_context)} cached MCP results for sub-query: {sub_query}")
+            elif mcp_strategy == "deep":
+                self.logger.info(f"Running deep MCP research for: {sub_query}")
                 if self.researcher.verbose:
-                    mcp_count = len(mcp_context)
-                    web_available = bool(web_context)
-                    cache_used = self._mcp_results_cache is not None and mcp_retrievers and mcp_strategy != "deep"
-                    cache_status = " (cached)" if cache_used else ""
                     await stream_output(
                         "logs",
-                        "context_combined",
-                        f"📚 Combined research context: {mcp_count} MCP sources{cache_status}, {'web content' if web_available else 'no web content'}",
+                        "mcp_comprehensive_run",
+                        f"🔍 Running deep MCP research for: {sub_query}",
                         self.researcher.websocket,
                     )
+
+                mcp_context = await self._execute_mcp_research_for_queries([sub_query], mcp_retrievers)
             else:
-                self.logger.warning(f"No combined context found for sub-query: {sub_query}")
+                self.logger.warning("MCP cache not available, falling back to per-sub-query execution")
                 if self.researcher.verbose:
                     await stream_output(
                         "logs",
-                        "subquery_context_not_found",
-                        f"🤷 No content found for '{sub_query}'...",
+                        "mcp_fallback",
+                        f"🔌 MCP cache unavailable, running MCP research for: {sub_query}",
                         self.researcher.websocket,
                     )
 
-            if combined_context and self.json_handler:
-                self.json_handler.log_event("content_found", {
-                    "sub_query": sub_query,
-                    "content_size": len(str(combined_context)),
-                    "mcp_sources": len(mcp_context),
-                    "web_content": bool(web_context)
-                })
+                mcp_context = await self._execute_mcp_research_for_queries([sub_query], mcp_retrievers)
 
-            return combined_context
+        # Get web search context using non-MCP retrievers (if no scraped data provided)
+        if not scraped_data:
+            scraped_data = await self._scrape_data_by_urls(sub_query, query_domains)
+            self.logger.info(f"Scraped data size: {len(scraped_data)}")
+
+        return mcp_context, scraped_data
+
+    async def _combine_sub_query_context(self, sub_query: str, mcp_context: list, web_context: str):
+        """Combines the MCP and web context of a sub query and logs the result."""
+        mcp_retrievers = [r for r in self.researcher.retrievers if "mcpretriever" in r.__name__.lower()]
+        mcp_strategy = self._get_mcp_strategy()
+
+        # Combine MCP context with web context intelligently
+        combined_context = self._combine_mcp_and_web_context(mcp_context, web_context, sub_query)
+
+        # Log context combination results
+        if combined_context:
+            context_length = len(str(combined_context))
+            self.logger.info(f"Combined context for '{sub_query}': {context_length} chars")
 
-        except Exception as e:
-            self.logger.error(f"Error processing sub-query {sub_query}: {e}", exc_info=True)
             if self.researcher.verbose:
+                mcp_count = len(mcp_context)
+                web_available = bool(web_context)
+                cache_used = self._mcp_results_cache is not None and mcp_retrievers and mcp_strategy != "deep"
+                cache_status = " (cached)" if cache_used else ""
                 await stream_output(
                     "logs",
-                    "subquery_error",
-                    f"❌ Error processing '{sub_query}': {str(e)}",
+                    "context_combined",
+                    f"📚 Combined research context: {mcp_count} MCP sources{cache_status}, {'web content' if web_available else 'no web content'}",
+                    self.researcher.websocket,
+                )
+        else:
+            self.logger.warning(f"No combined context found for sub-query: {sub_query}")
+            if self.researcher.verbose:
+                await stream_output(
+                    "logs",
+                    "subquery_context_not_found",
+                    f"🤷 No content found for '{sub_query}'...",
                     self.researcher.websocket,
                 )
-            return ""
+
+        if combined_context and self.json_handler:
+            self.json_handler.log_event("content_found", {
+                "sub_query": sub_query,
+                "content_size": len(str(combined_context)),
+                "mcp_sources": len(mcp_context),
+                "web_content": bool(web_context)
+            })
+
+        return combined_context
 
     async def _execute_mcp_research(self, retriever, query):
         """
@@ -1885,7 +1958,8 @@ class ResearchConductor:
                     self.researcher.websocket,
                 )
 
-            results = retriever_instance.search(
+            results = await run_retriever_search(
+                retriever_instance,
                 max_results=self.researcher.cfg.max_search_results_per_query
             )
 
@@ -1977,22 +2051,35 @@ class ResearchConductor:
 
         return context
 
+    def _claim_new_urls(self, urls) -> list[str]:
+        """
+        Marks the URLs not yet visited by this researcher, or by its siblings when
+        `shared_visited_urls` is set, as visited and returns them.
+        """
+        shared_urls = self.researcher.shared_visited_urls
+        new_urls = []
+        for url in urls:
+            if url in self.researcher.visited_urls or (shared_urls is not None and url in shared_urls):
+                continue
+            self.researcher.visited_urls.add(url)
+            if shared_urls is not None:
+                shared_urls.add(url)
+            new_urls.append(url)
+        return new_urls
+
     async def _get_new_urls(self, url_set_input):
         """Gets the new urls from the given url set."""
-        new_urls = []
-        for url in url_set_input:
-            if url not in self.researcher.visited_urls:
-                self.researcher.visited_urls.add(url)
-                new_urls.append(url)
-                if self.researcher.verbose:
-                    await stream_output(
-                        "logs",
-                        "added_source_url",
-                        f"✅ Added source url to research: {url}\n",
-                        self.researcher.websocket,
-                        True,
-                        url,
-                    )
+        new_urls = self._claim_new_urls(url_set_input)
+        if self.researcher.verbose:
+            for url in new_urls:
+                await stream_output(
+                    "logs",
+                    "added_source_url",
+                    f"✅ Added source url to research: {url}\n",
+                    self.researcher.websocket,
+                    True,
+                    url,
+                )
 
         return new_urls
 
@@ -2001,27 +2088,180 @@ class ResearchConductor:
         if query_domains is None:
             query_domains = []
 
-        for retriever_class in self.researcher.retrievers:
-            if "mcpretriever" in retriever_class.__name__.lower():
-                continue
+        retrievers = [r for r in self.researcher.retrievers if "mcpretriever" not in r.__name__.lower()]
 
-            try:
-                retriever = retriever_class(query, query_domains=query_domains)
+        if getattr(self.researcher.cfg, "retriever_fanout", True) and len(retrievers) > 1:
+            outcomes = await self._fan_out_search(retrievers, query, query_domains)
+        else:
+            outcomes = [await self._timed_search(r, query, query_domains) for r in retrievers]
 
-                search_results = await asyncio.to_thread(
-                    retriever.search, max_results=self.researcher.cfg.max_search_results_per_query
-                )
+        # Merge in retriever order so the result does not depend on which retriever answered first
+        for outcome in outcomes:
+            search_urls = [url.get("href") for url in outcome["results"] if url.get("href")]
+            new_search_urls.extend(search_urls)
 
-                search_urls = [url.get("href") for url in search_results if url.get("href")]
-                new_search_urls.extend(search_urls)
-            except Exception as e:
-                self.logger.error(f"Error searching with {retriever_class.__name__}: {e}")
+        self._log_retriever_latencies(query, outcomes)
 
         new_search_urls = await self._get_new_urls(new_search_urls)
         random.shuffle(new_search_urls)
 
         return new_search_urls
 
+    async def _timed_search(self, retriever_class, query, query_domains: list | None = None) -> dict:
+        """Runs one retriever under the per-retriever timeout and records how long it took."""
+        retriever_name = retriever_class.__name__
+        timeout = getattr(self.researcher.cfg, "retriever_timeout", None) or None
+        start = time.perf_counter()
+        status, results = "ok", []
+
+        try:
+            retriever = retriever_class(query, query_domains=query_domains)
+            max_results = self.researcher.cfg.max_search_results_per_query
+            search = run_retriever_search(retriever, max_results=max_results)
+            results = await asyncio.wait_for(search, timeout=timeout) or []
+        except asyncio.TimeoutError:
+            status = "timeout"
+            self.logger.warning(f"{retriever_name} timed out after {timeout}s for query: {query}")
+        except Exception as e:
+            status = "error"
+            self.logger.error(f"Error searching with {retriever_name}: {e}")
+
+        return {
+            "retriever": retriever_name,
+            "results": results,
+            "latency": time.perf_counter() - start,
+            "status": status,
+        }
+
+    async def _fan_out_search(self, retrievers: list, query, query_domains: list | None = None) -> list[dict]:
+        """
+        Runs all retrievers for a query at the same time.
+
+        Stops waiting once every retriever has answered, RETRIEVER_FANOUT_DEADLINE has passed,
+        or RETRIEVER_FANOUT_MIN_RESULTS results have been collected, whichever comes first.
+        Retrievers still running at that point are cancelled and reported as "skipped".
+
+        Returns:
+            list[dict]: One outcome per retriever, in the same order as `retrievers`.
+        """
+        cfg = self.researcher.cfg
+        deadline = getattr(cfg, "retriever_fanout_deadline", None) or None
+        min_results = getattr(cfg, "retriever_fanout_min_results", 0) or 0
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        stop_at = started + deadline if deadline else None
+
+        tasks = [asyncio.create_task(self._timed_search(r, query, query_domains)) for r in retrievers]
+        pending = set(tasks)
+        collected = 0
+        while pending:
+            remaining = None if stop_at is None else max(0.0, stop_at - loop.time())
+            done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                self.logger.info(f"Retriever fan-out deadline of {deadline}s reached for query: {query}")
+                break
+            collected += sum(len(task.result()["results"]) for task in done)
+            if min_results and collected >= min_results:
+                break
+
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        outcomes = []
+        for retriever_class, task in zip(retrievers, tasks):
+            if task in pending:
+                outcomes.append({
+                    "retriever": retriever_class.__name__,
+                    "results": [],
+                    "latency": loop.time() - started,
+                    "status": "skipped",
+                })
+            else:
+                outcomes.append(task.result())
+        return outcomes
+
+    def _log_search_cache_stats(self) -> None:
+        """Writes the search-result cache hit/miss counters of this research to the log."""
+        stats = get_search_cache_stats(self.researcher.retrievers)
+        if not stats["retrievers"]:
+            return
+
+        self.logger.info(f"[SearchCache] hits={stats['hits']}, misses={stats['misses']}")
+        if self.json_handler:
+            self.json_handler.update_content("search_cache", stats)
+
+    def _log_llm_scheduler_stats(self) -> None:
+        """Writes LLM queue depth and admission waits per provider model to the log."""
+        stats = get_scheduler_stats()
+        if not stats:
+            return
+
+        for name, scheduler_stats in stats.items():
+            self.logger.info(
+                f"[LLMScheduler] {name}: admitted={scheduler_stats['admitted']}, "
+                f"queued={scheduler_stats['queued']}, max_wait={scheduler_stats['max_wait']:.2f}s"
+            )
+        if self.json_handler:
+            self.json_handler.update_content("llm_scheduler", stats)
+
+    def _log_scrape_metrics(self) -> None:
+        """Writes fetch/parse stage throughput and parse-queue backpressure to the log."""
+        metrics = self.researcher.scraper_manager.worker_pool.metrics.snapshot()
+        if not metrics["fetch"]["items"]:
+            return
+
+        for stage in ("fetch", "parse"):
+            stage_metrics = metrics[stage]
+            self.logger.info(
+                f"[ScrapePipeline] {stage}: items={stage_metrics['items']}, failures={stage_metrics['failures']}, "
+                f"{stage_metrics['items_per_second']:.1f}/s, avg={stage_metrics['avg_seconds']:.2f}s"
+            )
+        self.logger.info(
+            f"[ScrapePipeline] parse queue: max_depth={metrics['queue']['max_depth']}, "
+            f"blocked={metrics['queue']['blocked_puts']} ({metrics['queue']['blocked_seconds']:.2f}s)"
+        )
+        if self.json_handler:
+            self.json_handler.update_content("scrape_pipeline", metrics)
+
+    def _log_page_cache_stats(self) -> None:
+        """Writes the scraped-page cache hit ratio of this research to the log."""
+        page_cache = self.researcher.scraper_manager.page_cache
+        if page_cache is None:
+            return
+
+        stats = page_cache.stats()
+        self.logger.info(
+            f"[PageCache] hits={stats['hits']}, revalidated={stats['revalidated']}, "
+            f"misses={stats['misses']}, hit_ratio={stats['hit_ratio']:.2f}"
+        )
+        if self.json_handler:
+            self.json_handler.update_content("page_cache", stats)
+
+    def _log_retriever_latencies(self, query, outcomes: list[dict]) -> None:
+        """Writes per-retriever latency to the research log."""
+        for outcome in outcomes:
+            self.logger.info(
+                f"[RetrieverLatency] {outcome['retriever']}: {outcome['latency']:.2f}s, "
+                f"status={outcome['status']}, results={len(outcome['results'])}"
+            )
+
+        if self.json_handler:
+            self.json_handler.log_event("retriever_latency", {
+                "query": query,
+                "retrievers": [
+                    {
+                        "retriever": outcome["retriever"],
+                        "latency": round(outcome["latency"], 3),
+                        "status": outcome["status"],
+                        "results": len(outcome["results"]),
+                    }
+                    for outcome in outcomes
+                ],
+            })
+
     async def _scrape_data_by_urls(self, sub_query, query_domains: list | None = None,
                                    *,
                                    web_max_chars: int | None = WEB_MAX_CHARS_DEFAULT,
@@ -2085,7 +2325,8 @@ class ResearchConductor:
                 )
 
             if hasattr(retriever_instance, 'search'):
-                results = retriever_instance.search(
+                results = await run_retriever_search(
+                    retriever_instance,
                     max_results=self.researcher.cfg.max_search_results_per_query
                 )
 
@@ -2153,12 +2394,11 @@ class ResearchConductor:
         if not urls:
             return []
 
-        new_urls = [url for url in urls if url not in self.researcher.visited_urls]
+        new_urls = self._claim_new_urls(urls)
         if not new_urls:
             return []
 
         scraped_content = await self.researcher.scraper_manager.browse_urls(new_urls)
-        self.researcher.visited_urls.update(new_urls)
 
         # ✅ 网页内容：长度控制
         scraped_content = _apply_web_len_control(
@@ -0,0 +1,253 @@
+"""
+Small key/value cache backends shared by the research caches.
+
+Two backends are available:
+    - MemoryCache: in-process LRU, lost when the process exits.
+    - SQLiteCache: on-disk store that survives across runs. Values must be JSON serializable.
+
+Both support a per-entry TTL and a maximum number of entries, evicting the least
+recently used entries first. Code running on the event loop uses `aget`/`aset`,
+which keep the SQLite I/O off the loop.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(*parts: Any) -> str:
+    """Build a stable hash key from JSON-serializable parts."""
+    raw = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class CacheBackend(ABC):
+    """Interface of a cache backend."""
+
+    @abstractmethod
+    def get(self, key: str) -> Any | None:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def items(self) -> list[tuple[str, Any]]:
+        """All live (key, value) pairs, without touching their LRU position."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+    async def aget(self, key: str) -> Any | None:
+        """`get` for callers on the event loop; blocking backends run it in a worker thread."""
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """`set` for callers on the event loop; blocking backends run it in a worker thread."""
+        await asyncio.to_thread(self.set, key, value, ttl)
+
+
+class MemoryCache(CacheBackend):
+    """Thread-safe in-memory LRU cache."""
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float | None, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        expires_at = time.time() + ttl if ttl else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while self.max_entries and len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def items(self) -> list[tuple[str, Any]]:
+        now = time.time()
+        with self._lock:
+            return [
+                (key, value) for key, (expires_at, value) in self._entries.items()
+                if expires_at is None or expires_at >= now
+            ]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    # Nothing here blocks, so the async variants skip the thread hop
+    async def aget(self, key: str) -> Any | None:
+        return self.get(key)
+
+    async def aset(self, key: str, value: Any, ttl: float | None = None) -> None:
+        self.set(key, value, ttl)
+
+
+class SQLiteCache(CacheBackend):
+    """
+    On-disk cache stored in a single SQLite table.
+
+    Several caches can share one database file by using different table names.
+    """
+
+    def __init__(self, path: str, table: str = "cache", max_entries: int = 100000):
+        self.path = path
+        self.table = table
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table} ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            f"CREATE INDEX IF NOT EXISTS {self.table}_accessed_at ON {self.table} (accessed_at)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Any | None:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at is not None and expires_at < now:
+                self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            self._conn.execute(f"UPDATE {self.table} SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            logger.warning(f"Dropping unreadable cache entry {key} from {self.path}")
+            self.delete(key)
+            return None
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        now = time.time()
+        try:
+            payload = json.dumps(value, ensure_ascii=False)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Value for cache key {key} is not JSON serializable, skipping: {e}")
+            return
+        expires_at = now + ttl if ttl else None
+        with self._lock:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, payload, expires_at, now),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """Drop expired entries, then the least recently used ones above max_entries."""
+        self._conn.execute(
+            f"DELETE FROM {self.table} WHERE expires_at IS NOT NULL AND expires_at < ?", (time.time(),)
+        )
+        if self.max_entries:
+            self._conn.execute(
+                f"DELETE FROM {self.table} WHERE key IN ("
+                f"SELECT key FROM {self.table} ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def items(self) -> list[tuple[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT key, value FROM {self.table} WHERE expires_at IS NULL OR expires_at >= ?", (time.time(),)
+            ).fetchall()
+        items = []
+        for key, value in rows:
+            try:
+                items.append((key, json.loads(value)))
+            except json.JSONDecodeError:
+                continue
+        return items
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self.table}")
+            self._conn.commit()
+
+
+# Backends are shared process-wide so concurrent researchers hit the same cache
+_backends: dict[tuple, CacheBackend] = {}
+_backends_lock = threading.Lock()
+
+
+def get_cache_backend(kind: str | None, namespace: str, path: str | None = None,
+                      max_entries: int = 10000) -> CacheBackend | None:
+    """
+    Get the shared cache backend for a namespace.
+
+    Args:
+        kind (str): "memory", "sqlite", or "none"/None to disable caching.
+        namespace (str): Name of the cache, used as the SQLite table name.
+        path (str, optional): SQLite database file, required for the "sqlite" backend.
+        max_entries (int): Maximum number of entries kept before LRU eviction.
+
+    Returns:
+        CacheBackend | None: The backend, or None when caching is disabled.
+    """
+    if not kind or kind == "none":
+        return None
+
+    key = (kind, namespace, path)
+    with _backends_lock:
+        backend = _backends.get(key)
+        if backend is None:
+            match kind:
+                case "memory":
+                    backend = MemoryCache(max_entries=max_entries)
+                case "sqlite":
+                    if not path:
+                        raise ValueError("The sqlite cache backend requires a path")
+                    backend = SQLiteCache(path, table=namespace, max_entries=max_entries)
+                case _:
+                    raise ValueError(f"Unsupported cache backend: {kind}. Use 'memory', 'sqlite' or 'none'.")
+            _backends[key] = backend
+        return backend
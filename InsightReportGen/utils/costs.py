@@ -1,3 +1,6 @@
+import asyncio
+from functools import lru_cache
+
 import tiktoken
 
 # Per OpenAI Pricing Page: https://openai.com/api/pricing/
@@ -7,19 +10,111 @@ OUTPUT_COST_PER_TOKEN = 0.000015
 IMAGE_INFERENCE_COST = 0.003825
 EMBEDDING_COST = 0.02 / 1000000 # Assumes new ada-3-small
 
+# List prices in USD per 1M tokens as (input, output), matched by the longest model-name
+# prefix. Entries in the MODEL_PRICES setting override these.
+MODEL_PRICES = {
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4.1-nano": (0.10, 0.40),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1": (2.00, 8.00),
+    "gpt-5-mini": (0.25, 2.00),
+    "gpt-5": (1.25, 10.00),
+    "o3-mini": (1.10, 4.40),
+    "o4-mini": (1.10, 4.40),
+    "o3": (2.00, 8.00),
+    "deepseek-chat": (0.27, 1.10),
+    "deepseek-reasoner": (0.55, 2.19),
+    "qwen-turbo": (0.05, 0.20),
+    "qwen-plus": (0.40, 1.20),
+    "qwen-max": (1.60, 6.40),
+    "qwen3": (0.40, 1.20),
+    "text-embedding-3-small": (0.02, 0.0),
+    "text-embedding-3-large": (0.13, 0.0),
+    "text-embedding-ada-002": (0.10, 0.0),
+    "text-embedding-v": (0.07, 0.0),  # DashScope text-embedding-v1..v4
+}
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(model: str | None = None) -> tiktoken.Encoding:
+    if model:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            pass
+    return tiktoken.get_encoding(ENCODING_MODEL)
+
+
+def count_tokens(text: str, model: str | None = None) -> int:
+    return len(_get_encoding(model).encode(text, disallowed_special=()))
+
+
+@lru_cache(maxsize=256)
+def _lookup_prices(model: str) -> tuple[float, float] | None:
+    from gpt_researcher.config.config import Config
+
+    prices = {**MODEL_PRICES, **(Config.get_setting("MODEL_PRICES") or {})}
+    name = model.lower().split("/")[-1]
+    matches = [prefix for prefix in prices if name.startswith(prefix.lower())]
+    if not matches:
+        return None
+    input_price, output_price = prices[max(matches, key=len)]
+    return input_price / 1000000, output_price / 1000000
+
 
-# Cost estimation is via OpenAI libraries and models. May vary for other models
-def estimate_llm_cost(input_content: str, output_content: str) -> float:
-    encoding = tiktoken.get_encoding(ENCODING_MODEL)
-    input_tokens = encoding.encode(input_content)
-    output_tokens = encoding.encode(output_content)
-    input_costs = len(input_tokens) * INPUT_COST_PER_TOKEN
-    output_costs = len(output_tokens) * OUTPUT_COST_PER_TOKEN
-    return input_costs + output_costs
+def get_model_prices(model: str | None) -> tuple[float, float]:
+    """Per-token (input, output) prices of a model, falling back to the default OpenAI prices."""
+    prices = _lookup_prices(model) if model else None
+    return prices or (INPUT_COST_PER_TOKEN, OUTPUT_COST_PER_TOKEN)
+
+
+def get_token_usage(message) -> dict[str, int] | None:
+    """
+    Read the provider-reported token usage from a LangChain message.
+
+    Returns:
+        dict | None: {"input_tokens", "output_tokens"}, or None if the provider reported nothing.
+    """
+    usage = getattr(message, "usage_metadata", None)
+    if usage and usage.get("input_tokens") is not None:
+        return {"input_tokens": usage["input_tokens"], "output_tokens": usage.get("output_tokens") or 0}
+
+    metadata = getattr(message, "response_metadata", None) or {}
+    usage = metadata.get("token_usage") or metadata.get("usage") or {}
+    input_tokens = usage.get("prompt_tokens", usage.get("input_tokens"))
+    if input_tokens is None:
+        return None
+    return {"input_tokens": input_tokens, "output_tokens": usage.get("completion_tokens", usage.get("output_tokens")) or 0}
+
+
+# Uses the provider-reported usage when given; otherwise tokenizes with tiktoken, which is
+# exact for OpenAI models and an approximation for others
+def estimate_llm_cost(input_content: str, output_content: str, model: str | None = None,
+                      usage: dict[str, int] | None = None) -> float:
+    if usage:
+        input_tokens, output_tokens = usage["input_tokens"], usage["output_tokens"]
+    else:
+        input_tokens = count_tokens(input_content, model)
+        output_tokens = count_tokens(output_content, model)
+    input_price, output_price = get_model_prices(model)
+    return input_tokens * input_price + output_tokens * output_price
+
+
+async def aestimate_llm_cost(input_content: str, output_content: str, model: str | None = None,
+                             usage: dict[str, int] | None = None) -> float:
+    """Like estimate_llm_cost, but tokenizes in a worker thread when the provider reported no usage."""
+    if usage:
+        return estimate_llm_cost(input_content, output_content, model, usage)
+    return await asyncio.to_thread(estimate_llm_cost, input_content, output_content, model)
 
 
 def estimate_embedding_cost(model, docs):
-    encoding = tiktoken.encoding_for_model(model)
-    total_tokens = sum(len(encoding.encode(str(doc))) for doc in docs)
-    return total_tokens * EMBEDDING_COST
+    total_tokens = sum(count_tokens(str(doc), model) for doc in docs)
+    prices = _lookup_prices(model) if model else None
+    return total_tokens * (prices[0] if prices else EMBEDDING_COST)
+
 
+async def aestimate_embedding_cost(model, docs) -> float:
+    """Like estimate_embedding_cost, but tokenizes in a worker thread."""
+    return await asyncio.to_thread(estimate_embedding_cost, model, docs)
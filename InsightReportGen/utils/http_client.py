@@ -0,0 +1,120 @@
+"""
+Process-wide pooled async HTTP client.
+
+Retrievers (and anything else on the hot path of a research run) share one
+`httpx.AsyncClient` per event loop instead of opening a fresh connection for
+every request, so TLS handshakes and connection setup are paid once per host.
+"""
+import asyncio
+import importlib.util
+import logging
+import weakref
+from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class PooledAsyncClient:
+    """
+    Thin wrapper around `httpx.AsyncClient` that adds per-host connection limits.
+
+    httpx only bounds the pool as a whole, so a semaphore per host keeps one slow
+    search API from taking every connection in the pool.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_connections_per_host: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+        timeout: float = 30.0,
+    ):
+        # HTTP/2 needs the optional `h2` package; fall back to HTTP/1.1 without it
+        if http2 and not importlib.util.find_spec("h2"):
+            logger.info("h2 is not installed, pooled HTTP client falls back to HTTP/1.1")
+            http2 = False
+
+        self.max_connections_per_host = max_connections_per_host
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+        self._client = httpx.AsyncClient(
+            http2=http2,
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+        )
+
+    @property
+    def is_closed(self) -> bool:
+        return self._client.is_closed
+
+    @asynccontextmanager
+    async def _host_slot(self, url: str):
+        host = urlsplit(str(url)).netloc
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_connections_per_host)
+            self._host_semaphores[host] = semaphore
+        async with semaphore:
+            yield
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        async with self._host_slot(url):
+            return await self._client.request(method, url, **kwargs)
+
+    @asynccontextmanager
+    async def stream(self, method: str, url: str, **kwargs):
+        """Send a request and yield the response before its body is read. The host slot is held until exit."""
+        async with self._host_slot(url):
+            async with self._client.stream(method, url, **kwargs) as response:
+                yield response
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+# One client per event loop: httpx connections are bound to the loop that opened them
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, PooledAsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def get_http_client() -> PooledAsyncClient:
+    """
+    Get the shared pooled client for the running event loop, creating it on first use.
+
+    Returns:
+        PooledAsyncClient: The pooled client.
+    """
+    from ..config.config import Config
+
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = PooledAsyncClient(
+            max_connections=Config.get_setting("HTTP_MAX_CONNECTIONS"),
+            max_connections_per_host=Config.get_setting("HTTP_MAX_CONNECTIONS_PER_HOST"),
+            keepalive_expiry=Config.get_setting("HTTP_KEEPALIVE_EXPIRY"),
+            http2=Config.get_setting("HTTP2"),
+        )
+        _clients[loop] = client
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close the pooled client of the running event loop. Meant for application shutdown hooks."""
+    loop = asyncio.get_running_loop()
+    client = _clients.pop(loop, None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
@@ -0,0 +1,372 @@
+"""
+A Jupyter kernel kept alive across the steps of a CodeGenerator run.
+
+Cells run one at a time in the same kernel, so each step pays only for its own
+code instead of replaying every earlier cell in a fresh kernel. Before a step,
+the kernel namespace is checkpointed. A failed attempt is rolled back to that
+checkpoint, so the fix runs against the state the step started from without
+replaying the prefix. Only one checkpoint is kept at a time.
+
+Checkpoints deep-copy user variables inside the kernel. Objects that cannot be
+copied (modules, open files, figures, ...) are kept by reference.
+
+A checkpoint can also track changes: it then hashes the pickle of every user
+variable, so the variables a step created, changed (in place or by rebinding) or
+deleted can be saved afterwards. A cell whose effects were restored from
+elsewhere (see `utils.step_cache`) can be deferred: it only runs if a later cell
+is executed in the same kernel.
+
+Execution goes through nbclient's async kernel client, so a long-running cell
+never blocks the event loop. Outputs (stdout, figures, results) can be forwarded
+as they arrive, together with periodic progress ticks.
+"""
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+from nbclient import NotebookClient
+from nbclient.exceptions import DeadKernelError
+from nbformat import NotebookNode
+
+logger = logging.getLogger(__name__)
+
+# Defined in the kernel once it starts. Names starting with "_" (IPython's output
+# history, these helpers) and IPython's own globals are left alone.
+_CHECKPOINT_HELPERS = '''
+def __cg_user_names():
+    return [k for k in globals() if not k.startswith("_") and k not in __cg_reserved]
+
+def __cg_checkpoint(track_changes=False):
+    import copy
+    global __cg_snapshot
+    snapshot = {}
+    for name in __cg_user_names():
+        value = globals()[name]
+        try:
+            snapshot[name] = (True, copy.deepcopy(value))
+        except Exception:
+            snapshot[name] = (False, value)
+    __cg_snapshot = snapshot
+    __cg_remember_state(track_changes)
+
+def __cg_digest(data):
+    import hashlib
+    return hashlib.sha256(data).hexdigest()
+
+def __cg_remember_state(track_changes):
+    # (id, module name or pickle hash) of every variable; the hash is None for unpicklable ones
+    import pickle, types
+    global __cg_snapshot_state
+    if not track_changes:
+        __cg_snapshot_state = None
+        return
+    state = {}
+    for name in __cg_user_names():
+        value = globals()[name]
+        if isinstance(value, types.ModuleType):
+            state[name] = (id(value), value.__name__)
+            continue
+        try:
+            state[name] = (id(value), __cg_digest(pickle.dumps(value)))
+        except Exception:
+            state[name] = (id(value), None)
+    __cg_snapshot_state = state
+
+def __cg_rollback():
+    import copy
+    namespace = globals()
+    for name in __cg_user_names():
+        if name not in __cg_snapshot:
+            del namespace[name]
+    for name, (copied, value) in __cg_snapshot.items():
+        namespace[name] = copy.deepcopy(value) if copied else value
+
+def __cg_discard():
+    global __cg_snapshot
+    __cg_snapshot = {}
+
+def __cg_dump_changes(path):
+    import pickle, types
+    if __cg_snapshot_state is None:
+        raise TypeError("the checkpoint did not track changes")
+    names = __cg_user_names()
+    modules, values, failed = {}, {}, []
+    for name in names:
+        value = globals()[name]
+        before_id, before = __cg_snapshot_state.get(name, (None, None))
+        if isinstance(value, types.ModuleType):
+            if before != value.__name__:
+                modules[name] = value.__name__
+            continue
+        # Functions and classes are not pickled by value; one that was not rebound counts as unchanged
+        if before_id == id(value) and isinstance(value, (types.FunctionType, types.BuiltinFunctionType, type)):
+            continue
+        try:
+            if getattr(value, "__module__", None) == "__main__":
+                raise TypeError("defined in the notebook")
+            data = pickle.dumps(value)
+        except Exception:
+            # Also unpicklable variables that existed before: whether they changed is unknown
+            failed.append(name)
+            continue
+        if before != __cg_digest(data):
+            values[name] = data
+    if failed:
+        raise TypeError(f"cannot pickle {failed}")
+    deleted = [name for name in __cg_snapshot_state if name not in names]
+    with open(path, "wb") as f:
+        pickle.dump({"modules": modules, "values": values, "deleted": deleted}, f)
+
+def __cg_load(path):
+    import importlib, pickle
+    with open(path, "rb") as f:
+        saved = pickle.load(f)
+    loaded = {name: importlib.import_module(module) for name, module in saved["modules"].items()}
+    loaded.update({name: pickle.loads(value) for name, value in saved["values"].items()})
+    for name in saved.get("deleted", []):
+        globals().pop(name, None)
+    globals().update(loaded)
+
+__cg_reserved = {"In", "Out", "exit", "quit", "get_ipython"}
+__cg_snapshot = {}
+__cg_snapshot_state = None
+'''
+
+
+class KernelError(RuntimeError):
+    """Kernel-side checkpoint code failed."""
+
+
+OutputCallback = Callable[[NotebookNode], Awaitable[None]]
+ProgressCallback = Callable[[float], Awaitable[None]]
+
+
+class _StreamingNotebookClient(NotebookClient):
+    """NotebookClient that also hands every new cell output to `output_callback`."""
+
+    output_callback: Optional[Callable[[NotebookNode], None]] = None
+
+    def output(self, outs, msg, display_id, cell_index):
+        out = super().output(outs, msg, display_id, cell_index)
+        if out is not None and self.output_callback is not None:
+            self.output_callback(out)
+        return out
+
+
+class KernelSession:
+    """Executes notebook cells incrementally in one long-lived kernel, with namespace checkpoints."""
+
+    def __init__(self, nb: NotebookNode, kernel: str = "python3", timeout: int = 1200):
+        """
+        Args:
+            nb (NotebookNode): Notebook whose cells are executed; outputs are written into it.
+            kernel (str): Kernel name.
+            timeout (int): Per-cell timeout in seconds.
+        """
+        self.nb = nb
+        self.kernel = kernel
+        self.timeout = timeout
+        self.client: Optional[_StreamingNotebookClient] = None
+        # Indices of cells whose effects are in the kernel, in execution order
+        self.executed: List[int] = []
+        # Cells to run before the next executed cell (see `defer`)
+        self.deferred: List[int] = []
+        self._checkpoint_len: Optional[int] = None
+        self._track_changes = False
+
+    @property
+    def started(self) -> bool:
+        return self.client is not None and self.client.kc is not None
+
+    async def start(self) -> None:
+        if self.started:
+            return
+        self.client = _StreamingNotebookClient(self.nb, kernel_name=self.kernel, timeout=self.timeout)
+        self.client.create_kernel_manager()
+        await self.client.async_start_new_kernel()
+        await self.client.async_start_new_kernel_client()
+        await self._run_hidden(_CHECKPOINT_HELPERS)
+
+    async def shutdown(self) -> None:
+        if self.client is not None and self.client.km is not None:
+            try:
+                await self.client._async_cleanup_kernel()
+            except Exception as e:
+                logger.warning(f"Error shutting down kernel: {e}")
+        self.client = None
+        self.executed = []
+        self.deferred = []
+        self._checkpoint_len = None
+
+    async def __aenter__(self) -> "KernelSession":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.shutdown()
+
+    async def _run_hidden(self, code: str) -> None:
+        """Run code in the kernel without outputs or history."""
+        msg_id = self.client.kc.execute(code, silent=True, store_history=False)
+        reply = await self.client.async_wait_for_reply(msg_id)
+        content = (reply or {}).get("content", {})
+        if content.get("status") != "ok":
+            raise KernelError(f"{content.get('ename', 'Error')}: {content.get('evalue', 'no reply from kernel')}")
+
+    async def execute_cell(
+        self,
+        index: int,
+        on_output: Optional[OutputCallback] = None,
+        on_progress: Optional[ProgressCallback] = None,
+        progress_interval: float = 10.0,
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Execute one notebook cell in the session kernel.
+
+        Args:
+            index (int): Cell index in the notebook.
+            on_output: Awaited with each output (stream, display_data, error, ...) as it arrives.
+            on_progress: Awaited with the elapsed seconds every `progress_interval` while the cell runs.
+            progress_interval (float): Seconds between progress ticks.
+
+        Returns:
+            Tuple[bool, Optional[str]]: Whether it succeeded, and the error otherwise.
+        """
+        try:
+            await self._run_deferred()
+        except Exception as e:
+            return False, repr(e)
+        outputs: asyncio.Queue = asyncio.Queue()
+        forwarder = None
+        if on_output is not None or on_progress is not None:
+            self.client.output_callback = outputs.put_nowait
+            forwarder = asyncio.create_task(
+                self._forward_outputs(outputs, on_output, on_progress, progress_interval)
+            )
+        try:
+            await self.client.async_execute_cell(self.nb.cells[index], index, store_history=True)
+        except DeadKernelError as e:
+            logger.warning(f"Kernel died while executing cell {index}, restarting from the last checkpoint")
+            try:
+                await self._restart()
+            except Exception as restart_error:
+                logger.error(f"Could not restore the kernel state: {restart_error!r}")
+                await self.shutdown()
+            return False, repr(e)
+        except Exception as e:
+            return False, repr(e)
+        finally:
+            if forwarder is not None:
+                if self.client is not None:
+                    self.client.output_callback = None
+                outputs.put_nowait(None)
+                await forwarder
+        self.executed.append(index)
+        return True, None
+
+    @staticmethod
+    async def _forward_outputs(
+        outputs: asyncio.Queue,
+        on_output: Optional[OutputCallback],
+        on_progress: Optional[ProgressCallback],
+        interval: float,
+    ) -> None:
+        """Deliver queued outputs in order, and a progress tick every `interval` seconds until the cell ends."""
+        started = time.monotonic()
+        next_tick = started + interval
+        while True:
+            try:
+                timeout = max(next_tick - time.monotonic(), 0) if on_progress is not None else None
+                output = await asyncio.wait_for(outputs.get(), timeout)
+            except asyncio.TimeoutError:
+                next_tick = time.monotonic() + interval
+                try:
+                    await on_progress(time.monotonic() - started)
+                except Exception as e:
+                    logger.debug(f"Progress callback failed: {e!r}")
+                continue
+            if output is None:
+                return
+            if on_output is not None:
+                try:
+                    await on_output(output)
+                except Exception as e:
+                    logger.debug(f"Output callback failed: {e!r}")
+
+    def defer(self, index: int) -> None:
+        """Count a cell as run without executing it; it is executed only before a later cell or checkpoint."""
+        self.deferred.append(index)
+
+    async def _run_deferred(self) -> None:
+        await self.start()
+        while self.deferred:
+            index = self.deferred[0]
+            try:
+                await self.client.async_execute_cell(self.nb.cells[index], index, store_history=True)
+            except Exception as e:
+                raise KernelError(f"Deferred cell {index} failed: {e!r}") from e
+            self.executed.append(self.deferred.pop(0))
+
+    async def dump_changes(self, path: str) -> None:
+        """
+        Pickle the variables created, changed or deleted since the last checkpoint to `path`.
+        Raises KernelError when the checkpoint did not track changes or a variable cannot be
+        pickled, since its changes cannot be told apart then.
+        """
+        await self._run_hidden(f"__cg_dump_changes({str(path)!r})")
+
+    async def load_namespace(self, path: str) -> None:
+        """Load variables pickled by `dump_changes` into the kernel."""
+        await self.start()
+        await self._run_hidden(f"__cg_load({str(path)!r})")
+
+    async def checkpoint(self, track_changes: bool = False) -> None:
+        """
+        Snapshot the kernel namespace, replacing the previous checkpoint.
+
+        Args:
+            track_changes (bool): Also hash every variable's pickle, so `dump_changes` can
+                save what changed afterwards.
+        """
+        await self._run_deferred()
+        await self._run_hidden(f"__cg_checkpoint({bool(track_changes)!r})")
+        self._checkpoint_len = len(self.executed)
+        self._track_changes = track_changes
+
+    async def rollback(self) -> None:
+        """Restore the namespace to the last checkpoint. The checkpoint is kept for further attempts."""
+        if self._checkpoint_len is None:
+            return
+        await self._run_hidden("__cg_rollback()")
+        del self.executed[self._checkpoint_len:]
+
+    async def discard_checkpoint(self) -> None:
+        """Free the memory held by the last checkpoint."""
+        if self._checkpoint_len is None or not self.started:
+            return
+        await self._run_hidden("__cg_discard()")
+        self._checkpoint_len = None
+
+    async def reset(self) -> None:
+        """Clear the kernel namespace so the session can run unrelated cells; imported modules stay loaded."""
+        self.deferred = []
+        if not self.started:
+            return
+        await self._run_hidden("get_ipython().reset(new_session=False, aggressive=False)")
+        await self._run_hidden(_CHECKPOINT_HELPERS)
+        self.executed = []
+        self.deferred = []
+        self._checkpoint_len = None
+
+    async def _restart(self) -> None:
+        """Start a fresh kernel and replay the cells up to the last checkpoint (the only replay)."""
+        replay = self.executed[: self._checkpoint_len] if self._checkpoint_len is not None else list(self.executed)
+        had_checkpoint = self._checkpoint_len is not None
+        await self.shutdown()
+        await self.start()
+        for index in replay:
+            await self.client.async_execute_cell(self.nb.cells[index], index, store_history=True)
+            self.executed.append(index)
+        if had_checkpoint:
+            await self.checkpoint(self._track_changes)
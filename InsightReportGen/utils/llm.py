@@ -8,9 +8,12 @@ from langchain.output_parsers import PydanticOutputParser
 from langchain.prompts import PromptTemplate
 
 from gpt_researcher.llm_provider.generic.base import NO_SUPPORT_TEMPERATURE_MODELS, SUPPORT_REASONING_EFFORT_MODELS, ReasoningEfforts
+from gpt_researcher.llm_provider.resilience import call_with_retry
+from gpt_researcher.llm_provider.scheduler import LLMPriority, estimate_tokens, llm_slot
 
 from prompts import PromptFamily
-from .costs import estimate_llm_cost
+from .costs import aestimate_llm_cost
+from .llm_cache import LLMResponseCache, get_llm_cache
 from .validators import Subtopics, PipelinePlanResponse
 import os
 
@@ -19,8 +22,9 @@ from langchain.prompts import PromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 
 def get_llm(llm_provider, **kwargs):
-    from gpt_researcher.llm_provider import GenericLLMProvider
-    return GenericLLMProvider.from_provider(llm_provider, **kwargs)
+    """Get the shared provider for these settings, so its client and connection pool are reused."""
+    from gpt_researcher.llm_provider.registry import get_provider
+    return get_provider(llm_provider, **kwargs)
 
 
 async def create_chat_completion(
@@ -34,6 +38,9 @@ async def create_chat_completion(
         llm_kwargs: dict[str, Any] | None = None,
         cost_callback: callable = None,
         reasoning_effort: str | None = ReasoningEfforts.Medium.value,
+        cache: bool = True,
+        hedge: bool | None = None,
+        priority: LLMPriority = LLMPriority.SUMMARY,
         **kwargs
 ) -> str:
     """Create a chat completion using the OpenAI API
@@ -48,6 +55,11 @@ async def create_chat_completion(
         llm_kwargs (dict[str, Any], optional): Additional LLM keyword arguments. Defaults to None.
         cost_callback: Callback function for updating cost.
         reasoning_effort (str, optional): Reasoning effort for OpenAI's reasoning models. Defaults to 'low'.
+        cache (bool): Whether the response cache (LLM_CACHE) may serve this call. Pass False for
+            creative generation. Defaults to True.
+        hedge (bool, optional): Fire a second request when the first is slower than the model's p95
+            latency. Ignored when streaming. Defaults to LLM_HEDGE.
+        priority (LLMPriority): Admission class when the provider's LLM_RATE_LIMITS budget is exhausted.
         **kwargs: Additional keyword arguments.
     Returns:
         str: The response from the chat completion.
@@ -82,21 +94,122 @@ async def create_chat_completion(
             provider_kwargs['openai_api_base'] = base_url
 
     provider = get_llm(llm_provider, **provider_kwargs)
-    response = ""
-    # create response
-    for _ in range(10):  # maximum of 10 attempts
-        response = await provider.get_chat_response(
-            messages, stream, websocket, **kwargs
+
+    # Deterministic prompts are served from the response cache; hits cost nothing
+    llm_cache = get_llm_cache() if cache else None
+    cache_key = None
+    if llm_cache:
+        cache_key = _response_cache_key(llm_cache, llm_provider, provider_kwargs, messages)
+        cache_scope = _response_cache_scope(llm_cache, llm_provider, provider_kwargs)
+        cached_response = await llm_cache.aget(cache_key, cache_scope, messages)
+        if cached_response is not None:
+            if stream:
+                await provider._send_output(cached_response, websocket)
+            return cached_response
+
+    # Transient failures are retried with backoff; streamed calls are never hedged,
+    # since both requests would write to the websocket, and are only retried until
+    # their first chunk has been forwarded
+    # Every attempt, including retries and hedges, waits for its own rate-limit slot; latency is
+    # measured from admission, so queueing neither skews the histograms nor triggers hedges
+    tokens = estimate_tokens(messages, max_tokens)
+    output = _ForwardedOutput(websocket) if stream and websocket is not None else None
+
+    async def request() -> tuple[str, dict | None]:
+        return await provider.get_chat_completion(messages, stream, output or websocket, **kwargs)
+
+    try:
+        response, usage = await call_with_retry(
+            request,
+            # Full streamed answers take far longer than other calls, so they get their own latency histogram
+            model=f"{llm_provider}:{model}:stream" if stream else f"{llm_provider}:{model}",
+            hedge=False if stream else hedge,
+            can_retry=(lambda: not output.sent) if output is not None else None,
+            admit=lambda: llm_slot(llm_provider, model, tokens, priority),
         )
+    except Exception as e:
+        logging.error(f"Failed to get response from {llm_provider} API: {e}")
+        raise RuntimeError(f"Failed to get response from {llm_provider} API") from e
+
+    if cost_callback:
+        llm_costs = await aestimate_llm_cost(str(messages), response, model=model, usage=usage)
+        cost_callback(llm_costs)
+
+    if llm_cache:
+        await llm_cache.aset(cache_key, cache_scope, messages, response)
+
+    return response
+
 
-        if cost_callback:
-            llm_costs = estimate_llm_cost(str(messages), response)
-            cost_callback(llm_costs)
+class _ForwardedOutput:
+    """Wraps a websocket and remembers whether any streamed output has been sent through it."""
 
-        return response
+    def __init__(self, websocket: Any):
+        self.websocket = websocket
+        self.sent = False
 
-    logging.error(f"Failed to get response from {llm_provider} API")
-    raise RuntimeError(f"Failed to get response from {llm_provider} API")
+    async def send_json(self, data: Any) -> None:
+        self.sent = True
+        await self.websocket.send_json(data)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.websocket, name)
+
+
+def _response_cache_key(llm_cache: LLMResponseCache, llm_provider: str | None, provider_kwargs: dict[str, Any],
+                        messages: list[dict[str, str]]) -> str:
+    settings = {k: v for k, v in provider_kwargs.items() if k not in ("model", "temperature")}
+    return llm_cache.make_key(
+        provider_kwargs.get("model"), messages, provider_kwargs.get("temperature"),
+        provider=llm_provider, **settings
+    )
+
+
+def _response_cache_scope(llm_cache: LLMResponseCache, llm_provider: str | None,
+                          provider_kwargs: dict[str, Any]) -> str:
+    settings = {k: v for k, v in provider_kwargs.items() if k not in ("model", "temperature")}
+    return llm_cache.make_scope(
+        provider_kwargs.get("model"), provider_kwargs.get("temperature"), provider=llm_provider, **settings
+    )
+
+
+async def _ainvoke_chain(
+    prompt: PromptTemplate,
+    inputs: dict[str, Any],
+    llm_provider: str,
+    provider_kwargs: dict[str, Any],
+    parser,
+    cache: bool = True,
+    priority: LLMPriority = LLMPriority.PLANNING,
+    **kwargs
+):
+    """
+    Run `prompt | model | parser`, reusing a cached raw model response for the same rendered prompt.
+
+    Only responses the parser accepts are cached.
+    """
+    provider = get_llm(llm_provider, **provider_kwargs)
+    model = provider_kwargs.get("model")
+    messages = [{"role": "user", "content": prompt.format(**inputs)}]
+    tokens = estimate_tokens(messages, provider_kwargs.get("max_tokens"))
+    llm_cache = get_llm_cache() if cache else None
+    if not llm_cache:
+        chain = prompt | provider.llm | parser
+        async with llm_slot(llm_provider, model, tokens, priority):
+            return await chain.ainvoke(inputs, **kwargs)
+
+    cache_key = _response_cache_key(llm_cache, llm_provider, provider_kwargs, messages)
+    cache_scope = _response_cache_scope(llm_cache, llm_provider, provider_kwargs)
+    text = await llm_cache.aget(cache_key, cache_scope, messages)
+    if text is not None:
+        return parser.parse(text)
+
+    chain = prompt | provider.llm | StrOutputParser()
+    async with llm_slot(llm_provider, model, tokens, priority):
+        text = await chain.ainvoke(inputs, **kwargs)
+    output = parser.parse(text)
+    await llm_cache.aset(cache_key, cache_scope, messages, text)
+    return output
 
 
 async def construct_subtopics(
@@ -105,6 +218,7 @@ async def construct_subtopics(
     config,
     subtopics: list = [],
     prompt_family: type[PromptFamily] | PromptFamily = PromptFamily,
+    cache: bool = True,
     **kwargs
 ) -> list:
     """
@@ -116,6 +230,7 @@ async def construct_subtopics(
         config: Configuration settings.
         subtopics (list, optional): Existing subtopics. Defaults to [].
         prompt_family (PromptFamily): Family of prompts
+        cache (bool): Whether the response cache (LLM_CACHE) may serve this call.
         **kwargs: Additional keyword arguments.
 
     Returns:
@@ -142,18 +257,12 @@ async def construct_subtopics(
             provider_kwargs['temperature'] = config.temperature
             provider_kwargs['max_tokens'] = config.smart_token_limit
 
-        provider = get_llm(config.smart_llm_provider, **provider_kwargs)
-
-        model = provider.llm
-
-        chain = prompt | model | parser
-
-        output = await chain.ainvoke({
+        output = await _ainvoke_chain(prompt, {
             "task": task,
             "data": data,
             "subtopics": subtopics,
             "max_subtopics": config.max_subtopics
-        }, **kwargs)
+        }, config.smart_llm_provider, provider_kwargs, parser, cache=cache, **kwargs)
 
         return output
 
@@ -169,6 +278,7 @@ async def generate_pipeline_plan_prompt(
     config,
     output_dir: str,
     prompt_family: type[PromptFamily] | PromptFamily = PromptFamily,
+    cache: bool = True,
     **kwargs
 ) -> str:
     """
@@ -180,6 +290,7 @@ async def generate_pipeline_plan_prompt(
         config: Configuration settings.
         subtopics (list, optional): Existing subtopics. Defaults to [].
         prompt_family (PromptFamily): Family of prompts
+        cache (bool): Whether the response cache (LLM_CACHE) may serve this call.
         **kwargs: Additional keyword arguments.
 
     Returns:
@@ -209,13 +320,7 @@ async def generate_pipeline_plan_prompt(
             provider_kwargs['temperature'] = config.temperature
             provider_kwargs['max_tokens'] = config.smart_token_limit
 
-        provider = get_llm(config.smart_llm_provider, **provider_kwargs)
-
-        model = provider.llm
-
-        chain = prompt | model | parser
-
-        output = await chain.ainvoke({
+        output = await _ainvoke_chain(prompt, {
             "user_requirement": user_requirement,
             "allowed_libs": config.code_libs,
             "language": "python",
@@ -223,7 +328,7 @@ async def generate_pipeline_plan_prompt(
             "figure_standards": config.figure_standards,
             "table_standards": config.table_standards,
             "data_path": config.data_path
-        }, **kwargs)
+        }, config.smart_llm_provider, provider_kwargs, parser, cache=cache, **kwargs)
 
         return output
 
@@ -241,6 +346,7 @@ async def code_llm(
         prompt_family,
         plan,  # PipelinePlanResponse
         config,  # 你的 LLM 配置对象（含 provider、model、温度等）
+        cache: bool = True,
         **kwargs
 ) -> str:
     # 1) 组织上下文
@@ -262,18 +368,13 @@ async def code_llm(
         provider_kwargs['temperature'] = config.temperature
         provider_kwargs['max_tokens'] = config.smart_token_limit
 
-    provider = get_llm(config.smart_llm_provider, **provider_kwargs)
-    model = provider.llm
-    parser = StrOutputParser()
-
-    chain = prompt | model | parser
-    code_text = await chain.ainvoke({
+    code_text = await _ainvoke_chain(prompt, {
         "step_json": step_json,
         "plan_outline": plan_outline,
         "allowed_libs": allowed_libs,
         "output_dir": out_dir,
         "seed": str(seed),
-    }, **kwargs)
+    }, config.smart_llm_provider, provider_kwargs, StrOutputParser(), cache=cache, priority=LLMPriority.REPORT, **kwargs)
 
     # 只返回代码字符串
     return code_text.strip()
@@ -290,6 +391,7 @@ async def fix_llm(
     allowed_libs: str,
     plan,
     config,
+    cache: bool = False,  # 缓存的修复结果会在每次重试时被原样返回，默认关闭
     **kwargs
 ) -> str:
     plan_outline = "\n".join([f"- {s.id} {s.name}: {s.objective}" for s in plan.pipeline])
@@ -309,12 +411,7 @@ async def fix_llm(
         provider_kwargs['temperature'] = config.temperature
         provider_kwargs['max_tokens'] = config.smart_token_limit
 
-    provider = get_llm(config.smart_llm_provider, **provider_kwargs)
-    model = provider.llm
-    parser = StrOutputParser()
-
-    chain = prompt | model | parser
-    code_text = await chain.ainvoke({
+    code_text = await _ainvoke_chain(prompt, {
         "step_json": step_json,
         "plan_outline": plan_outline,
         "allowed_libs": allowed_libs,
@@ -322,7 +419,7 @@ async def fix_llm(
         "seed": str(seed),
         "prev_code": prev_code or "",
         "error_text": error_text or "",
-    }, **kwargs)
+    }, config.smart_llm_provider, provider_kwargs, StrOutputParser(), cache=cache, priority=LLMPriority.REPORT, **kwargs)
 
     return code_text.strip()
 
@@ -338,6 +435,7 @@ async def revise_llm(
     allowed_libs: str,
     plan,
     config,
+    cache: bool = False,
     **kwargs
 ) -> Dict[str, Any]:
     """
@@ -364,12 +462,7 @@ async def revise_llm(
         provider_kwargs['temperature'] = config.temperature
         provider_kwargs['max_tokens'] = config.smart_token_limit
 
-    provider = get_llm(config.smart_llm_provider, **provider_kwargs)
-    model = provider.llm
-    parser = StrOutputParser()
-
-    chain = prompt | model | parser
-    raw = await chain.ainvoke({
+    raw = await _ainvoke_chain(prompt, {
         "step_json": step_json,
         "plan_outline": plan_outline,
         "allowed_libs": allowed_libs,
@@ -377,7 +470,7 @@ async def revise_llm(
         "seed": str(seed),
         "error_text": error_text or "",
         "prev_code": prev_code or "",
-    }, **kwargs)
+    }, config.smart_llm_provider, provider_kwargs, StrOutputParser(), cache=cache, priority=LLMPriority.REPORT, **kwargs)
 
     text = raw.strip()
 
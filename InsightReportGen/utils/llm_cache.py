@@ -0,0 +1,231 @@
+"""
+Response cache for deterministic LLM prompts.
+
+Responses are looked up by an exact hash of (provider, model, messages, temperature
+and other generation settings). Optionally, a prompt whose embedding is at least
+LLM_CACHE_SEMANTIC_THRESHOLD similar to a cached prompt with the same provider,
+model and generation settings reuses that response. The cache is opt-in via
+LLM_CACHE. Backend I/O runs off the event loop.
+"""
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any
+
+import numpy as np
+
+from .cache import CacheBackend, get_cache_backend, make_cache_key
+
+logger = logging.getLogger(__name__)
+
+
+def _prompt_text(messages: list[dict[str, str]]) -> str:
+    return "\n".join(f"{message.get('role')}: {message.get('content')}" for message in messages)
+
+
+class LLMResponseCache:
+    """Exact-match cache of LLM responses, with an optional embedding-similarity fallback."""
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        ttl: float | None = None,
+        semantic_backend: CacheBackend | None = None,
+        semantic_threshold: float = 0.0,
+        embeddings=None,
+        max_index_entries: int = 10000,
+    ):
+        self.backend = backend
+        self.ttl = ttl or None
+        self.semantic_backend = semantic_backend
+        self.semantic_threshold = semantic_threshold
+        self.embeddings = embeddings
+        self.max_index_entries = max_index_entries
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+
+        # Prompt embeddings per scope (see `make_scope`), loaded from the semantic backend on first use,
+        # and the scope of every indexed key, oldest first
+        self._semantic_index: dict[str, tuple[list[str], np.ndarray]] | None = None
+        self._index_order: OrderedDict[str, str] = OrderedDict()
+        self._index_lock = threading.Lock()
+
+    @property
+    def semantic_enabled(self) -> bool:
+        return self.semantic_backend is not None and self.embeddings is not None and self.semantic_threshold > 0
+
+    @staticmethod
+    def make_key(model: str, messages: list[dict[str, str]], temperature: float | None, **settings: Any) -> str:
+        return make_cache_key(model, messages, temperature, settings)
+
+    @staticmethod
+    def make_scope(model: str, temperature: float | None, **settings: Any) -> str:
+        """Everything in `make_key` except the messages: only prompts with the same scope are similarity matches."""
+        return make_cache_key(model, temperature, settings)
+
+    def _load_semantic_index(self) -> dict[str, tuple[list[str], np.ndarray]]:
+        """Blocking: reads the whole semantic backend on first use. Call it from a worker thread."""
+        with self._index_lock:
+            if self._semantic_index is None:
+                entries: dict[str, tuple[list[str], list]] = {}
+                for _, entry in self.semantic_backend.items():
+                    # Entries written before prompts were scoped cannot be matched safely
+                    if "scope" not in entry:
+                        continue
+                    keys, vectors = entries.setdefault(entry["scope"], ([], []))
+                    keys.append(entry["key"])
+                    vectors.append(entry["embedding"])
+                    self._index_order[entry["key"]] = entry["scope"]
+                self._semantic_index = {
+                    scope: (keys, self._normalize(vectors)) for scope, (keys, vectors) in entries.items()
+                }
+                while len(self._index_order) > self.max_index_entries:
+                    self._drop_from_index(next(iter(self._index_order)))
+            return self._semantic_index
+
+    def _drop_from_index(self, key: str) -> None:
+        """Remove a prompt from the in-memory index. Call with `_index_lock` held."""
+        scope = self._index_order.pop(key, None)
+        if scope is None or self._semantic_index is None:
+            return
+        keys, matrix = self._semantic_index[scope]
+        position = keys.index(key)
+        if len(keys) == 1:
+            del self._semantic_index[scope]
+        else:
+            self._semantic_index[scope] = (keys[:position] + keys[position + 1:], np.delete(matrix, position, axis=0))
+
+    async def _forget(self, key: str) -> None:
+        """Drop a prompt whose response has been evicted from the response backend."""
+        with self._index_lock:
+            self._drop_from_index(key)
+        await asyncio.to_thread(self.semantic_backend.delete, key)
+
+    @staticmethod
+    def _normalize(vectors) -> np.ndarray:
+        matrix = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    async def _embed(self, messages: list[dict[str, str]]) -> list[float] | None:
+        try:
+            return await self.embeddings.aembed_query(_prompt_text(messages))
+        except Exception as e:
+            logger.warning(f"Could not embed prompt for the semantic LLM cache: {e}")
+            return None
+
+    async def aget(self, key: str, scope: str, messages: list[dict[str, str]]) -> str | None:
+        """
+        Look a response up by exact key, then by prompt similarity if enabled.
+
+        Args:
+            key (str): From `make_key`.
+            scope (str): From `make_scope`, with the same model and settings as the key.
+            messages (list[dict[str, str]]): The prompt, embedded for the similarity lookup.
+        """
+        response = await self.backend.aget(key)
+        if response is not None:
+            self.hits += 1
+            return response
+
+        if self.semantic_enabled:
+            embedding = await self._embed(messages)
+            if embedding is not None:
+                index = await asyncio.to_thread(self._load_semantic_index)
+                with self._index_lock:
+                    keys, matrix = index.get(scope, ([], None))
+                    if keys:
+                        scores = matrix @ self._normalize(embedding)
+                        best = int(np.argmax(scores))
+                        match = keys[best] if scores[best] >= self.semantic_threshold else None
+                    else:
+                        match = None
+                if match is not None:
+                    response = await self.backend.aget(match)
+                    if response is not None:
+                        self.semantic_hits += 1
+                        logger.debug(f"Semantic LLM cache hit (similarity {scores[best]:.3f})")
+                        return response
+                    await self._forget(match)
+
+        self.misses += 1
+        return None
+
+    async def aset(self, key: str, scope: str, messages: list[dict[str, str]], response: str) -> None:
+        if not response:
+            return
+        await self.backend.aset(key, response, ttl=self.ttl)
+
+        if self.semantic_enabled:
+            embedding = await self._embed(messages)
+            if embedding is None:
+                return
+            await self.semantic_backend.aset(key, {"scope": scope, "key": key, "embedding": embedding}, ttl=self.ttl)
+            index = await asyncio.to_thread(self._load_semantic_index)
+            with self._index_lock:
+                if key in self._index_order:
+                    return
+                keys, matrix = index.get(scope, ([], None))
+                vector = self._normalize([embedding])
+                index[scope] = (keys + [key], vector if matrix is None else np.vstack([matrix, vector]))
+                self._index_order[key] = scope
+                # The backends evict by LRU too; the index keeps at most as many prompts as they do
+                while len(self._index_order) > self.max_index_entries:
+                    self._drop_from_index(next(iter(self._index_order)))
+
+
+_cache: LLMResponseCache | None = None
+_cache_loaded = False
+_cache_lock = threading.Lock()
+
+
+def _build_embeddings(config_cls):
+    from gpt_researcher.memory import Memory
+
+    provider, model = config_cls.parse_embedding(config_cls.get_setting("EMBEDDING"))
+    return Memory(provider, model, **(config_cls.get_setting("EMBEDDING_KWARGS") or {})).get_embeddings()
+
+
+def get_llm_cache() -> LLMResponseCache | None:
+    """
+    Get the process-wide LLM response cache.
+
+    Returns:
+        LLMResponseCache | None: The cache, or None when LLM_CACHE is "none".
+    """
+    global _cache, _cache_loaded
+    if _cache_loaded:
+        return _cache
+
+    from gpt_researcher.config.config import Config
+
+    with _cache_lock:
+        if not _cache_loaded:
+            kind = Config.get_setting("LLM_CACHE")
+            path = Config.get_setting("LLM_CACHE_PATH")
+            max_entries = Config.get_setting("LLM_CACHE_MAX_ENTRIES")
+            backend = get_cache_backend(kind, namespace="llm_responses", path=path, max_entries=max_entries)
+            if backend is not None:
+                threshold = Config.get_setting("LLM_CACHE_SEMANTIC_THRESHOLD")
+                semantic_backend, embeddings = None, None
+                if threshold:
+                    semantic_backend = get_cache_backend(
+                        kind, namespace="llm_prompt_embeddings", path=path, max_entries=max_entries
+                    )
+                    try:
+                        embeddings = _build_embeddings(Config)
+                    except Exception as e:
+                        logger.warning(f"Semantic LLM cache disabled, embeddings unavailable: {e}")
+                _cache = LLMResponseCache(
+                    backend,
+                    ttl=Config.get_setting("LLM_CACHE_TTL"),
+                    semantic_backend=semantic_backend,
+                    semantic_threshold=threshold,
+                    embeddings=embeddings,
+                    max_index_entries=max_entries,
+                )
+            _cache_loaded = True
+    return _cache
@@ -0,0 +1,129 @@
+"""
+Event-loop lag monitor.
+
+A heartbeat task ticks on the event loop while a watchdog thread checks how long
+ago the last tick happened. When the loop has been held for longer than the
+threshold, the watchdog logs the stack of the loop thread, which points at the
+callback that is blocking it (typically synchronous I/O inside a coroutine).
+"""
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+import weakref
+
+logger = logging.getLogger(__name__)
+
+
+class LoopLagMonitor:
+    """Logs any callback that holds the event loop for more than `threshold` seconds."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, threshold: float):
+        # Weak, so that the entry in _monitors does not keep its own key loop alive
+        self._loop_ref = weakref.ref(loop)
+        self.threshold = threshold
+        self.interval = threshold / 2
+        self.max_lag = 0.0
+        self.stalls = 0
+
+        self._loop_thread_id: int | None = None
+        self._last_beat = time.monotonic()
+        self._stop = threading.Event()
+        self._heartbeat_task: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop | None:
+        return self._loop_ref()
+
+    def start(self) -> None:
+        """Start the heartbeat and the watchdog. Must be called from the loop thread."""
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._heartbeat_task = self.loop.create_task(self._heartbeat())
+        self._heartbeat_task.add_done_callback(self._heartbeat_done)
+        self._watchdog = threading.Thread(target=self._watch, name="loop-lag-monitor", daemon=True)
+        self._watchdog.start()
+        logger.info(f"Event-loop lag monitor started (threshold {self.threshold:.3f}s)")
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+
+    def _heartbeat_done(self, task: asyncio.Task) -> None:
+        # The task references its loop; drop it once the loop has cancelled it on shutdown
+        self._heartbeat_task = None
+        self._stop.set()
+
+    def _loop_closed(self) -> bool:
+        loop = self.loop
+        return loop is None or loop.is_closed()
+
+    async def _heartbeat(self) -> None:
+        while not self._stop.is_set():
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = time.monotonic() - expected
+            self.max_lag = max(self.max_lag, lag)
+            if lag > self.threshold:
+                self.stalls += 1
+                logger.warning(f"[LoopLag] Event loop was blocked for {lag:.3f}s")
+            self._last_beat = time.monotonic()
+
+    def _watch(self) -> None:
+        reported_beat = None
+        while not self._stop.wait(self.interval):
+            if self._loop_closed():
+                return
+            last_beat = self._last_beat
+            blocked_for = time.monotonic() - last_beat - self.interval
+            # Report each stall once, while it is still in progress
+            if blocked_for > self.threshold and reported_beat != last_beat:
+                reported_beat = last_beat
+                frame = sys._current_frames().get(self._loop_thread_id)
+                stack = "".join(traceback.format_stack(frame)) if frame else "<unavailable>"
+                logger.warning(
+                    f"[LoopLag] Event loop blocked for more than {blocked_for:.3f}s, "
+                    f"loop thread is currently at:\n{stack}"
+                )
+
+
+# One monitor per event loop
+_monitors: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, LoopLagMonitor]" = weakref.WeakKeyDictionary()
+
+
+def start_loop_monitor(threshold: float | None = None) -> LoopLagMonitor | None:
+    """
+    Start the lag monitor for the running event loop. Calling it again on the same loop is a no-op.
+
+    Args:
+        threshold (float, optional): Seconds the loop may be held before it is reported.
+            Defaults to LOOP_LAG_THRESHOLD; 0 disables the monitor.
+
+    Returns:
+        LoopLagMonitor | None: The monitor, or None when disabled.
+    """
+    if threshold is None:
+        from ..config.config import Config
+
+        threshold = Config.get_setting("LOOP_LAG_THRESHOLD")
+    if not threshold or threshold <= 0:
+        return None
+
+    loop = asyncio.get_running_loop()
+    monitor = _monitors.get(loop)
+    if monitor is None:
+        monitor = LoopLagMonitor(loop, threshold)
+        monitor.start()
+        _monitors[loop] = monitor
+    return monitor
+
+
+def stop_loop_monitor() -> None:
+    """Stop the lag monitor of the running event loop, if any."""
+    monitor = _monitors.pop(asyncio.get_running_loop(), None)
+    if monitor is not None:
+        monitor.stop()
@@ -1,13 +1,33 @@
+import json
+import logging
+import time
+
 import nbformat
 from nbformat import v4 as nbf
 import ansi2html
 import os
 
+logger = logging.getLogger(__name__)
+
 
 class NotebookSerializer:
-    def __init__(self, work_dir=None, notebook_name="notebook.ipynb"):
+    """
+    写入模式：
+      - flush_interval=None：每次修改后完整重写 .ipynb（原有行为）
+      - flush_interval>=0：写回延迟（write-behind）。修改只在内存中生效并追加到
+        `<notebook>.journal`（每行一条 JSON 记录）；距上次完整写入超过 flush_interval 秒
+        或显式调用 flush() 时才重写 .ipynb 并清空日志。进程崩溃后，下次打开同一路径时
+        会把日志重放进上次的 .ipynb，另存为 `<notebook>.recovered.ipynb`。
+    日志记录按单元/输出的位置写入，重复重放结果不变。
+    """
+
+    def __init__(self, work_dir=None, notebook_name="notebook.ipynb", flush_interval=None):
         self.nb = nbf.new_notebook()
         self.notebook_path = None
+        self.journal_path = None
+        self.flush_interval = flush_interval
+        self.dirty = False
+        self._last_flush = time.monotonic()
         self.initialized = True
         self.segmentation_output_content = {}  # 保存coder_agent 在 jupyter 中执行的 output 结果内容
         # {
@@ -17,6 +37,9 @@ class NotebookSerializer:
         self.current_segmentation: str = ""
 
         self.init_notebook(work_dir, notebook_name)
+        if self.flush_interval is not None and self.notebook_path:
+            # 日志总是相对本次会话起始的 notebook 记录
+            self.write_to_notebook()
 
     def init_notebook(self, work_dir=None, notebook_name="notebook.ipynb"):
         """初始化notebook路径
@@ -33,6 +56,11 @@ class NotebookSerializer:
 
             # 在jupyter工作目录下创建notebook文件
             self.notebook_path = os.path.join(work_dir, notebook_name)
+            self.journal_path = self.notebook_path + ".journal"
+            # 上次运行异常退出留下的日志：恢复出完整的 notebook 另存，避免被本次运行覆盖
+            if os.path.exists(self.journal_path):
+                base, ext = os.path.splitext(self.notebook_path)
+                self.recover(self.notebook_path, f"{base}.recovered{ext}")
 
             # if os.path.exists(self.notebook_path):
             #     raise FileExistsError(
@@ -45,14 +73,105 @@ class NotebookSerializer:
         return html_text
 
     def write_to_notebook(self):
+        """完整写入 .ipynb（先写临时文件再替换，写到一半崩溃也不会损坏原文件），并清空日志。"""
         if self.notebook_path:
-            with open(self.notebook_path, "w", encoding="utf-8") as f:
+            tmp_path = self.notebook_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
                 f.write(nbformat.writes(self.nb))
+            os.replace(tmp_path, self.notebook_path)
+            if self.journal_path and os.path.exists(self.journal_path):
+                os.remove(self.journal_path)
+        self.dirty = False
+        self._last_flush = time.monotonic()
+
+    def flush(self):
+        """写回延迟模式下，把内存中尚未写入的修改写入 .ipynb。"""
+        if self.dirty:
+            self.write_to_notebook()
+
+    def _changed(self, record):
+        """记录一次修改：原有模式立即完整写入；写回延迟模式追加日志，并按间隔合并写入。"""
+        if self.flush_interval is None:
+            self.write_to_notebook()
+            return
+        self.dirty = True
+        if self.journal_path:
+            with open(self.journal_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.write_to_notebook()
+
+    def cell_changed(self, index):
+        """单元在外部被修改（例如内核执行后写入了 outputs）时调用。"""
+        self._changed({"op": "cell", "index": index, "cell": self.nb["cells"][index]})
+
+    def _output_added(self):
+        index = len(self.nb["cells"]) - 1
+        outputs = self.nb["cells"][index]["outputs"]
+        self._changed({"op": "output", "index": index, "position": len(outputs) - 1, "output": outputs[-1]})
+
+    @staticmethod
+    def recover(notebook_path, output_path=None):
+        """
+        把 `<notebook>.journal` 重放进 notebook 文件并删除日志。
+
+        Args:
+            notebook_path (str): notebook 文件路径
+            output_path (str): 恢复结果的写入路径，默认覆盖 notebook_path
+
+        Returns:
+            bool: 是否有日志被恢复
+        """
+        journal_path = notebook_path + ".journal"
+        if not os.path.exists(journal_path):
+            return False
+        if os.path.exists(notebook_path):
+            nb = nbformat.read(notebook_path, as_version=4)
+        else:
+            nb = nbf.new_notebook()
+
+        replayed = 0
+        with open(journal_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    break  # 崩溃时写到一半的最后一行
+                cells = nb["cells"]
+                index = record["index"]
+                if index > len(cells) or (record["op"] == "output" and index == len(cells)):
+                    logger.warning(f"Notebook journal {journal_path} has a gap at cell {index}, stopping replay")
+                    break
+                if record["op"] == "cell":
+                    cell = nbformat.from_dict(record["cell"])
+                    if index == len(cells):
+                        cells.append(cell)
+                    else:
+                        cells[index] = cell
+                elif record["op"] == "output":
+                    outputs = cells[index].setdefault("outputs", [])
+                    del outputs[record["position"]:]
+                    outputs.append(nbformat.from_dict(record["output"]))
+                replayed += 1
+
+        output_path = output_path or notebook_path
+        tmp_path = output_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(nbformat.writes(nb))
+        os.replace(tmp_path, output_path)
+        os.remove(journal_path)
+        logger.info(f"Recovered {replayed} journaled changes of {notebook_path} into {output_path}")
+        return True
+
+    def add_cell_to_notebook(self, cell):
+        """追加一个已构建好的单元（例如从另一个 notebook 复制来的）。"""
+        self.nb["cells"].append(cell)
+        self.cell_changed(len(self.nb["cells"]) - 1)
 
     def add_code_cell_to_notebook(self, code):
         code_cell = nbf.new_code_cell(source=code)
         self.nb["cells"].append(code_cell)
-        self.write_to_notebook()
+        self.cell_changed(len(self.nb["cells"]) - 1)
 
     def add_code_cell_output_to_notebook(self, output):
         """添加代码单元格输出
@@ -71,7 +190,7 @@ class NotebookSerializer:
             output_type="display_data", data={"text/html": html_content}
         )
         self.nb["cells"][-1]["outputs"].append(cell_output)
-        self.write_to_notebook()
+        self._output_added()
 
     def add_code_cell_error_to_notebook(self, error):
         nbf_error_output = nbf.new_output(
@@ -81,21 +200,21 @@ class NotebookSerializer:
             traceback=[error],
         )
         self.nb["cells"][-1]["outputs"].append(nbf_error_output)
-        self.write_to_notebook()
+        self._output_added()
 
     def add_image_to_notebook(self, image, mime_type):
         image_output = nbf.new_output(
             output_type="display_data", data={mime_type: image}
         )
         self.nb["cells"][-1]["outputs"].append(image_output)
-        self.write_to_notebook()
+        self._output_added()
 
     def add_markdown_to_notebook(self, content, title=None):
         if title:
             content = "##### " + title + ":\n" + content
         markdown_cell = nbf.new_markdown_cell(content)
         self.nb["cells"].append(markdown_cell)
-        self.write_to_notebook()
+        self.cell_changed(len(self.nb["cells"]) - 1)
 
     def add_markdown_segmentation_to_notebook(self, content, segmentation):
         """添加markdown分段并初始化对应的output内容存储
@@ -0,0 +1,183 @@
+"""
+Memoized results of CodeGenerator steps.
+
+A step's key hashes its cell source, the keys of the steps it depends on, the
+content of the data files it reads (DATA_PATH, the plan's data sources and its
+file inputs) and the random seed. When a key was already seen, the step is
+restored instead of executed: its artifact files (figures/, tables/, metrics/)
+are copied back and its cell outputs are put back into the notebook. Editing a
+step changes its key and, through the upstream keys, the keys of the steps that
+depend on it, so only those rerun.
+
+Manifests live in a shared cache backend (see `utils.cache`). Artifact files are
+stored once per content hash under CODE_STEP_CACHE_DIR. With
+CODE_STEP_CACHE_NAMESPACE, the variables a step created, changed or deleted in
+the main kernel (compared by pickled content) are saved as well and loaded back
+on a hit; otherwise a restored step is re-executed lazily, only if a later step
+runs in the same kernel.
+"""
+import hashlib
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Any
+
+from .cache import CacheBackend, get_cache_backend, make_cache_key
+
+logger = logging.getLogger(__name__)
+
+# Unreferenced blobs younger than this may belong to a step that is being stored
+_PRUNE_MIN_AGE = 3600
+
+
+class StepCache:
+    """Step results keyed by code, upstream and input hashes, on top of a shared cache backend."""
+
+    def __init__(self, backend: CacheBackend, root: str, namespace: bool = False):
+        """
+        Args:
+            backend (CacheBackend): Stores the step manifests.
+            root (str): Directory for artifact blobs and pickled namespaces.
+            namespace (bool): Also pickle the variables each step defines.
+        """
+        self.backend = backend
+        self.root = Path(root)
+        self.namespace = namespace
+        self.hits = 0
+        self.misses = 0
+        self._file_hashes: dict[tuple[str, int, int], str] = {}
+
+    @classmethod
+    def from_config(cls, cfg) -> "StepCache | None":
+        """The step cache configured by CODE_STEP_CACHE*, or None when it is disabled."""
+        backend = get_cache_backend(
+            cfg.code_step_cache,
+            namespace="code_steps",
+            path=cfg.code_step_cache_path,
+            max_entries=cfg.code_step_cache_max_entries,
+        )
+        if backend is None:
+            return None
+        return cls(backend, cfg.code_step_cache_dir, namespace=cfg.code_step_cache_namespace)
+
+    def file_hash(self, path: str) -> str | None:
+        """Content hash of a file, remembered by path, size and mtime. None if it is not a file."""
+        try:
+            stat = os.stat(path)
+        except (OSError, ValueError):
+            return None
+        if not os.path.isfile(path):
+            return None
+        marker = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+        digest = self._file_hashes.get(marker)
+        if digest is None:
+            sha = hashlib.sha256()
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    sha.update(block)
+            digest = self._file_hashes[marker] = sha.hexdigest()
+        return digest
+
+    def step_key(self, source: str, upstream: list[str], data_files: list[str], seed: Any) -> str:
+        """
+        Args:
+            source (str): The step's cell source.
+            upstream (list[str]): Keys of the steps it depends on.
+            data_files (list[str]): Paths it may read; paths that are not files are ignored.
+            seed: The plan's random seed.
+        """
+        data = {}
+        for path in sorted(set(data_files)):
+            digest = self.file_hash(path)
+            if digest is not None:
+                data[path] = digest
+        return make_cache_key("code_step", source, upstream, data, seed)
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.root / "blobs" / digest[:2] / digest
+
+    def namespace_path(self, key: str) -> Path:
+        """Where a step's pickled variables are kept (absolute, as the kernel may run elsewhere)."""
+        path = (self.root / "namespaces").absolute()
+        path.mkdir(parents=True, exist_ok=True)
+        return path / f"{key}.pkl"
+
+    def lookup(self, key: str) -> dict[str, Any] | None:
+        """The manifest of a stored step, or None. Entries whose files have gone missing count as misses."""
+        entry = self.backend.get(key)
+        if entry is not None and all(self._blob_path(digest).exists() for digest in entry["files"].values()):
+            if entry.get("namespace") and not self.namespace_path(key).exists():
+                entry["namespace"] = False
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return None
+
+    def restore(self, entry: dict[str, Any], output_dir: str) -> list[str]:
+        """Copy a step's artifact files back into output_dir and return their paths."""
+        restored = []
+        for rel, digest in entry["files"].items():
+            target = Path(output_dir) / rel
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(self._blob_path(digest), target)
+            restored.append(str(target.as_posix()))
+        return restored
+
+    def put(self, key: str, files: list[str], output_dir: str, outputs: list, namespace: bool = False) -> None:
+        """
+        Store a step that ran successfully.
+
+        Args:
+            key (str): The step key.
+            files (list[str]): Artifact files it wrote; files outside output_dir are skipped.
+            output_dir (str): Root the artifacts are stored relative to.
+            outputs (list): The cell outputs, as JSON-serializable dicts.
+            namespace (bool): Whether its namespace was pickled to `namespace_path(key)`.
+        """
+        root = Path(output_dir).absolute()
+        stored: dict[str, str] = {}
+        for file in files:
+            path = Path(file).absolute()
+            try:
+                rel = path.relative_to(root).as_posix()
+            except ValueError:
+                continue
+            digest = self.file_hash(str(path))
+            if digest is None:
+                continue
+            blob = self._blob_path(digest)
+            if not blob.exists():
+                blob.parent.mkdir(parents=True, exist_ok=True)
+                tmp = blob.with_suffix(f".{os.getpid()}.tmp")
+                shutil.copyfile(path, tmp)
+                os.replace(tmp, blob)
+            stored[rel] = digest
+        self.backend.set(key, {"files": stored, "outputs": outputs, "namespace": namespace, "stored_at": time.time()})
+
+    def prune(self) -> int:
+        """Delete blobs and pickled namespaces no manifest refers to any more (e.g. after LRU eviction)."""
+        live_blobs: set[str] = set()
+        live_keys: set[str] = set()
+        for key, entry in self.backend.items():
+            live_keys.add(key)
+            live_blobs.update(entry.get("files", {}).values())
+        cutoff = time.time() - _PRUNE_MIN_AGE
+        removed = 0
+        candidates = [(path, path.name) for path in self.root.glob("blobs/*/*")]
+        candidates += [(path, path.stem) for path in self.root.glob("namespaces/*.pkl")]
+        for path, name in candidates:
+            if name in live_blobs or name in live_keys:
+                continue
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                continue
+        return removed
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "hit_ratio": self.hits / lookups if lookups else 0.0}
@@ -1,15 +1,173 @@
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from contextlib import asynccontextmanager
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class StageMetrics:
+    """Throughput of one scrape pipeline stage, measured over the time it had work in flight."""
+
+    def __init__(self):
+        self.items = 0
+        self.failures = 0
+        self.bytes = 0
+        self.busy_seconds = 0.0
+        self.active_seconds = 0.0
+        self._in_flight = 0
+        self._active_since = 0.0
+        self._lock = threading.Lock()
+
+    def start(self) -> float:
+        with self._lock:
+            now = time.perf_counter()
+            if self._in_flight == 0:
+                self._active_since = now
+            self._in_flight += 1
+            return now
+
+    def finish(self, started: float, nbytes: int = 0, ok: bool = True) -> None:
+        with self._lock:
+            now = time.perf_counter()
+            self._in_flight -= 1
+            if self._in_flight == 0:
+                self.active_seconds += now - self._active_since
+            self.busy_seconds += now - started
+            self.items += 1
+            self.bytes += nbytes
+            if not ok:
+                self.failures += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            active = self.active_seconds
+            if self._in_flight:
+                active += time.perf_counter() - self._active_since
+            return {
+                "items": self.items,
+                "failures": self.failures,
+                "bytes": self.bytes,
+                "in_flight": self._in_flight,
+                "items_per_second": self.items / active if active else 0.0,
+                "avg_seconds": self.busy_seconds / self.items if self.items else 0.0,
+            }
+
+
+class ScrapeMetrics:
+    """Per-stage throughput of the fetch -> parse pipeline, plus backpressure on the queue between them."""
+
+    def __init__(self):
+        self.fetch = StageMetrics()
+        self.parse = StageMetrics()
+        self.queue_max_depth = 0
+        self.queue_blocked = 0
+        self.queue_blocked_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def record_put(self, depth: int, waited: float) -> None:
+        with self._lock:
+            self.queue_max_depth = max(self.queue_max_depth, depth)
+            if waited > 0.001:
+                self.queue_blocked += 1
+                self.queue_blocked_seconds += waited
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            queue = {
+                "max_depth": self.queue_max_depth,
+                "blocked_puts": self.queue_blocked,
+                "blocked_seconds": self.queue_blocked_seconds,
+            }
+        return {"fetch": self.fetch.snapshot(), "parse": self.parse.snapshot(), "queue": queue}
+
+
+def _process_context():
+    # Forking a process that runs threads (the event loop's executors) can deadlock
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+# Parse process pools are shared by every WorkerPool in the process, one per pool size
+_parse_executors: dict[int, ProcessPoolExecutor] = {}
+_parse_executors_lock = threading.Lock()
+
+
+def get_parse_executor(processes: int) -> ProcessPoolExecutor:
+    """Get the process-wide parse pool with this many processes, creating it on first use."""
+    with _parse_executors_lock:
+        executor = _parse_executors.get(processes)
+        if executor is None:
+            executor = _parse_executors[processes] = ProcessPoolExecutor(
+                max_workers=processes, mp_context=_process_context()
+            )
+        return executor
+
+
+def _discard_parse_executor(executor: ProcessPoolExecutor) -> None:
+    with _parse_executors_lock:
+        for processes, shared in list(_parse_executors.items()):
+            if shared is executor:
+                del _parse_executors[processes]
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def close_parse_executors() -> None:
+    """Shut down the parse process pools. Meant for application shutdown hooks."""
+    with _parse_executors_lock:
+        executors = list(_parse_executors.values())
+        _parse_executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=False, cancel_futures=True)
 
 
 class WorkerPool:
-    def __init__(self, max_workers: int):
+    def __init__(self, max_workers: int, parse_processes: int | None = 0):
+        """
+        Args:
+            max_workers (int): Threads for blocking scrapers and concurrent scrape slots.
+            parse_processes (int | None): Processes for CPU-bound page parsing. None means one
+                per CPU core, 0 parses in the thread pool instead. Process pools are shared
+                process-wide (see `get_parse_executor`).
+        """
         self.max_workers = max_workers
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
         self.semaphore = asyncio.Semaphore(max_workers)
+        self.parse_processes = (os.cpu_count() or 1) if parse_processes is None else parse_processes
+        self._parse_lock = threading.Lock()
+        self.metrics = ScrapeMetrics()
 
     @asynccontextmanager
     async def throttle(self):
         async with self.semaphore:
             yield
+
+    @property
+    def parse_workers(self) -> int:
+        """How many pages can be parsed at once."""
+        return self.parse_processes or self.max_workers
+
+    def _get_parse_executor(self) -> Executor:
+        with self._parse_lock:
+            if not self.parse_processes:
+                return self.executor
+            return get_parse_executor(self.parse_processes)
+
+    async def run_parse(self, func: Callable, *args):
+        """Run a CPU-bound parse function in the process pool, or the thread pool if processes are off."""
+        loop = asyncio.get_running_loop()
+        executor = self._get_parse_executor()
+        try:
+            return await loop.run_in_executor(executor, func, *args)
+        except BrokenProcessPool as e:
+            logger.warning(f"Parse process pool failed ({e}), parsing in threads from now on")
+            with self._parse_lock:
+                self.parse_processes = 0
+            _discard_parse_executor(executor)
+            return await loop.run_in_executor(self.executor, func, *args)
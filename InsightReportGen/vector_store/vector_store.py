@@ -7,12 +7,16 @@ from langchain.docstore.document import Document
 from langchain.vectorstores import VectorStore
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 
+from ..memory.embedding_cache import CachedEmbeddings
+from ..utils.cache import CacheBackend
+
 class VectorStoreWrapper:
     """
     A Wrapper for LangchainVectorStore to handle GPT-Researcher Document Type
     """
-    def __init__(self, vector_store : VectorStore):
+    def __init__(self, vector_store : VectorStore, embedding_cache: CacheBackend | None = None):
         self.vector_store = vector_store
+        self.embedding_cache = embedding_cache
 
     def load(self, documents):
         """
@@ -21,7 +25,22 @@ class VectorStoreWrapper:
         """
         langchain_documents = self._create_langchain_documents(documents)
         splitted_documents = self._split_documents(langchain_documents)
-        self.vector_store.add_documents(splitted_documents)
+
+        # Stores that accept precomputed vectors reuse cached chunk embeddings
+        store_embeddings = self.vector_store.embeddings
+        if self.embedding_cache is None or store_embeddings is None or not hasattr(self.vector_store, "add_embeddings"):
+            self.vector_store.add_documents(splitted_documents)
+            return
+
+        cached_embeddings = store_embeddings
+        if not isinstance(store_embeddings, CachedEmbeddings):
+            cached_embeddings = CachedEmbeddings(store_embeddings, self.embedding_cache)
+        texts = [doc.page_content for doc in splitted_documents]
+        vectors = cached_embeddings.embed_documents(texts)
+        self.vector_store.add_embeddings(
+            text_embeddings=list(zip(texts, vectors)),
+            metadatas=[doc.metadata for doc in splitted_documents],
+        )
     
     def _create_langchain_documents(self, data: List[Dict[str, str]]) -> List[Document]:
         """Convert GPT Researcher Document to Langchain Document"""
@@ -91,6 +91,9 @@ class DetailedReport:
         return all_subtopics
 
     async def _generate_subtopic_reports(self, subtopics: List[Dict]) -> tuple:
+        if self.gpt_researcher.cfg.detailed_report_parallel and len(subtopics) > 1:
+            return await self._generate_subtopic_reports_parallel(subtopics)
+
         subtopic_reports = []
         subtopics_report_body = ""
 
@@ -102,26 +105,59 @@ class DetailedReport:
 
         return subtopic_reports, subtopics_report_body
 
-    async def _get_subtopic_report(self, subtopic: Dict) -> Dict[str, str]:
-        current_subtopic_task = subtopic.get("task")
-        subtopic_assistant = GPTResearcher(
-            query=current_subtopic_task,
-            query_domains=self.query_domains,
+    async def _generate_subtopic_reports_parallel(self, subtopics: List[Dict]) -> tuple:
+        """
+        Research all subtopics concurrently, then write their sections in order.
+
+        Research has no cross-subtopic dependency, so it runs up to
+        DETAILED_REPORT_MAX_CONCURRENCY subtopics at a time, with a shared URL set so no page
+        is scraped twice. Writing needs the headers and sections of the previous subtopics,
+        so each section is written as soon as its own research and the previous section are done.
+        """
+        semaphore = asyncio.Semaphore(max(1, self.gpt_researcher.cfg.detailed_report_max_concurrency))
+        shared_urls = set(self.global_urls)
+        initial_context = list(set(self.global_context))
+
+        async def research(subtopic: Dict):
+            async with semaphore:
+                assistant = self._create_subtopic_assistant(subtopic, shared_visited_urls=shared_urls)
+                assistant.context = list(initial_context)
+                titles = await self._research_subtopic(assistant, subtopic)
+                return assistant, titles
+
+        tasks = [asyncio.create_task(research(subtopic)) for subtopic in subtopics]
+        subtopic_reports = []
+        subtopics_report_body = ""
+        try:
+            for subtopic, task in zip(subtopics, tasks):
+                assistant, titles = await task
+                result = await self._write_subtopic_report(assistant, subtopic, titles)
+                if result["report"]:
+                    subtopic_reports.append(result)
+                    subtopics_report_body += f"\n\n\n{result['report']}"
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        self.global_urls.update(shared_urls)
+        return subtopic_reports, subtopics_report_body
+
+    def _create_subtopic_assistant(self, subtopic: Dict, shared_visited_urls: Optional[Set[str]] = None) -> GPTResearcher:
+        # Shares the main researcher's clients, worker pool, caches and cost total
+        return self.gpt_researcher.spawn_child(
+            query=subtopic.get("task"),
             report_type="subtopic_report",
-            report_source=self.report_source,
-            websocket=self.websocket,
-            headers=self.headers,
             parent_query=self.query,
             subtopics=self.subtopics,
-            visited_urls=self.global_urls,
-            agent=self.gpt_researcher.agent,
-            role=self.gpt_researcher.role,
-            tone=self.tone,
+            visited_urls=self.global_urls if shared_visited_urls is None else set(),
+            shared_visited_urls=shared_visited_urls,
             complement_source_urls=self.complement_source_urls,
             source_urls=self.source_urls
         )
 
-        subtopic_assistant.context = list(set(self.global_context))
+    async def _research_subtopic(self, subtopic_assistant: GPTResearcher, subtopic: Dict) -> List[str]:
+        """Conduct the research of a subtopic and draft its section titles."""
+        current_subtopic_task = subtopic.get("task")
         await subtopic_assistant.conduct_research()
 
         draft_section_titles = await subtopic_assistant.get_draft_section_titles(current_subtopic_task)
@@ -130,9 +166,12 @@ class DetailedReport:
             draft_section_titles = str(draft_section_titles)
 
         parse_draft_section_titles = self.gpt_researcher.extract_headers(draft_section_titles)
-        parse_draft_section_titles_text = [header.get(
-            "text", "") for header in parse_draft_section_titles]
+        return [header.get("text", "") for header in parse_draft_section_titles]
 
+    async def _write_subtopic_report(self, subtopic_assistant: GPTResearcher, subtopic: Dict,
+                                     parse_draft_section_titles_text: List[str]) -> Dict[str, str]:
+        """Write a subtopic section, avoiding the headers and content of the sections written before it."""
+        current_subtopic_task = subtopic.get("task")
         relevant_contents = await subtopic_assistant.get_similar_written_contents_by_draft_section_titles(
             current_subtopic_task, parse_draft_section_titles_text, self.global_written_sections
         )
@@ -140,7 +179,7 @@ class DetailedReport:
         subtopic_report = await subtopic_assistant.write_report(self.existing_headers, relevant_contents)
 
         self.global_written_sections.extend(self.gpt_researcher.extract_sections(subtopic_report))
-        self.global_context = list(set(subtopic_assistant.context))
+        self.global_context = list(set(self.global_context) | set(subtopic_assistant.context))
         self.global_urls.update(subtopic_assistant.visited_urls)
 
         self.existing_headers.append({
@@ -150,6 +189,12 @@ class DetailedReport:
 
         return {"topic": subtopic, "report": subtopic_report}
 
+    async def _get_subtopic_report(self, subtopic: Dict) -> Dict[str, str]:
+        subtopic_assistant = self._create_subtopic_assistant(subtopic)
+        subtopic_assistant.context = list(set(self.global_context))
+        titles = await self._research_subtopic(subtopic_assistant, subtopic)
+        return await self._write_subtopic_report(subtopic_assistant, subtopic, titles)
+
     async def _construct_detailed_report(self, introduction: str, report_body: str) -> str:
         toc = self.gpt_researcher.table_of_contents(report_body)
         conclusion = await self.gpt_researcher.write_report_conclusion(report_body)
@@ -21,6 +21,10 @@ from backend.server.websocket_manager import run_agent
 from backend.utils import write_md_to_word, write_md_to_pdf
 from gpt_researcher.utils.logging_config import setup_research_logging
 from gpt_researcher.utils.enum import Tone
+from gpt_researcher.utils.http_client import close_http_clients
+from gpt_researcher.utils.workers import close_parse_executors
+from gpt_researcher.llm_provider.registry import close_llm_providers
+from gpt_researcher.utils.loop_monitor import start_loop_monitor, stop_loop_monitor
 from backend.chat.chat import ChatAgentWithMemory
 
 import logging
@@ -100,11 +104,20 @@ DOC_PATH = os.getenv("DOC_PATH", "./my-docs")
 
 
 @app.on_event("startup")
-def startup_event():
+async def startup_event():
     os.makedirs("outputs", exist_ok=True)
     app.mount("/outputs", StaticFiles(directory="outputs"), name="outputs")
+    start_loop_monitor()
     # os.makedirs(DOC_PATH, exist_ok=True)  # Commented out to avoid creating the folder if not needed
-    
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    stop_loop_monitor()
+    await close_http_clients()
+    close_parse_executors()
+    await close_llm_providers()
+
 
 # Routes
 
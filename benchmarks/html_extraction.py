@@ -0,0 +1,90 @@
+"""
+Micro-benchmark: LxmlScraper's single-pass extraction vs BeautifulSoupScraper.
+
+Both scrapers parse the same bytes (no network). The corpus is every *.html file in
+--pages, e.g. pages saved with `curl -o`, or generated article-like pages if none is given.
+Pages where the two extractors disagree on (content, image_urls, title) are listed.
+
+Usage:
+    python benchmarks/html_extraction.py
+    python benchmarks/html_extraction.py --pages ~/saved_pages --repeat 5
+"""
+import argparse
+import random
+import time
+from pathlib import Path
+
+from gpt_researcher.scraper.beautiful_soup.beautiful_soup import BeautifulSoupScraper
+from gpt_researcher.scraper.lxml_scraper.lxml_scraper import LxmlScraper
+
+URL = "https://example.com/articles/page.html"
+
+
+def make_page(rng: random.Random, paragraphs: int) -> bytes:
+    """An article page with the usual boilerplate: scripts, navigation, sidebars, footers and images."""
+    words = ["research", "model", "data", "report", "  analysis", "result\n\n", "market", "growth", "&amp;"]
+
+    def sentence() -> str:
+        return " ".join(rng.choice(words) for _ in range(rng.randint(8, 30)))
+
+    body = [
+        "<header><nav class='nav'><ul>" + "".join(f"<li><a href='/s{i}'>Section {i}</a></li>" for i in range(12))
+        + "</ul></nav></header>",
+        "<div class='sidebar widget'><h3>Related</h3>" + "".join(f"<p>{sentence()}</p>" for _ in range(5)) + "</div>",
+        "<article class='content main'><h1>Title</h1>",
+    ]
+    for i in range(paragraphs):
+        body.append(f"<p>{sentence()} <b>{sentence()}</b> <a href='/x{i}'>{sentence()}</a> {sentence()}</p>")
+        if i % 7 == 0:
+            body.append(f"<img src='/img/{i}.jpg' width='{rng.choice(['1600', '900px', '200'])}' height='600'>")
+        if i % 11 == 0:
+            body.append(f"<div class='ad menu'>{sentence()}</div><script>var x = {i};</script>")
+        if i % 13 == 0:
+            body.append(f"<svg><title>icon</title><path d='M0 0'/></svg><!-- comment {i} -->")
+    body.append("</article><footer>" + "".join(f"<p>{sentence()}</p>" for _ in range(4)) + "</footer>")
+    head = "<head><meta charset='utf-8'><title>Example page</title><style>p { color: red; }</style></head>"
+    return f"<!DOCTYPE html><html>{head}<body>{''.join(body)}</body></html>".encode("utf-8")
+
+
+def load_corpus(pages_dir: str | None, num_pages: int, seed: int = 0) -> list[tuple[str, bytes]]:
+    if pages_dir:
+        return [(path.name, path.read_bytes()) for path in sorted(Path(pages_dir).expanduser().glob("*.html"))]
+    rng = random.Random(seed)
+    return [(f"generated-{i}.html", make_page(rng, rng.randint(20, 400))) for i in range(num_pages)]
+
+
+def bench(scraper_cls, corpus, repeat: int) -> tuple[float, list[tuple]]:
+    scraper = scraper_cls(URL)
+    results = []
+    start = time.perf_counter()
+    for _ in range(repeat):
+        results = [scraper._extract(html, None) for _, html in corpus]
+    elapsed = time.perf_counter() - start
+    return elapsed / repeat, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", help="Directory of saved *.html pages (default: generated pages)")
+    parser.add_argument("--num-pages", type=int, default=50, help="Pages to generate when --pages is not given")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.pages, args.num_pages)
+    if not corpus:
+        parser.error(f"No *.html files in {args.pages}")
+    size = sum(len(html) for _, html in corpus)
+
+    bs_time, bs_results = bench(BeautifulSoupScraper, corpus, args.repeat)
+    lxml_time, lxml_results = bench(LxmlScraper, corpus, args.repeat)
+    mismatches = [name for (name, _), a, b in zip(corpus, bs_results, lxml_results) if tuple(a) != tuple(b)]
+
+    print(f"{'pages':>6} {'MB':>7} {'bs4 (s)':>9} {'lxml (s)':>9} {'speedup':>8} {'identical':>10}")
+    print(f"{len(corpus):>6} {size / 1e6:>7.2f} {bs_time:>9.3f} {lxml_time:>9.3f} "
+          f"{bs_time / lxml_time:>7.1f}x {len(corpus) - len(mismatches):>6}/{len(corpus)}")
+    for name in mismatches:
+        print(f"  differs: {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Micro-benchmark: RelevanceIndex vs LangChain's EmbeddingsFilter.
+
+Both paths get the same pre-split chunks and the same precomputed embeddings, so
+only the filtering (similarity, threshold, top-k) is measured, not the embedding API.
+
+Usage:
+    python benchmarks/relevance_filter.py
+    python benchmarks/relevance_filter.py --sizes 1000 10000 --dim 1536 --queries 5
+"""
+import argparse
+import time
+
+import numpy as np
+from langchain.embeddings.base import Embeddings
+from langchain.retrievers.document_compressors import EmbeddingsFilter
+from langchain.schema import Document
+
+from gpt_researcher.context.relevance import RelevanceIndex
+
+SIMILARITY_THRESHOLD = 0.35
+TOP_K = 10
+
+
+class PrecomputedEmbeddings(Embeddings):
+    """Returns fixed vectors, standing in for an embedding API."""
+
+    def __init__(self, document_vectors: list[list[float]], query_vectors: dict[str, list[float]]):
+        self.document_vectors = document_vectors
+        self.query_vectors = query_vectors
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return self.document_vectors[:len(texts)]
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.query_vectors[text]
+
+
+def make_data(size: int, dim: int, num_queries: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    documents = [Document(page_content=f"chunk {i}", metadata={"source": f"https://example.com/{i}"})
+                 for i in range(size)]
+    doc_vectors = rng.standard_normal((size, dim))
+    queries = [f"query {i}" for i in range(num_queries)]
+    # Make every query close to a few chunks so the threshold lets some through
+    query_vectors = doc_vectors[rng.integers(0, size, num_queries)] + 0.5 * rng.standard_normal((num_queries, dim))
+    embeddings = PrecomputedEmbeddings(
+        doc_vectors.tolist(), {q: v.tolist() for q, v in zip(queries, query_vectors)}
+    )
+    return documents, queries, embeddings
+
+
+def bench_langchain(documents, queries, embeddings) -> tuple[float, list[list[str]]]:
+    relevance_filter = EmbeddingsFilter(embeddings=embeddings, similarity_threshold=SIMILARITY_THRESHOLD)
+    start = time.perf_counter()
+    results = [relevance_filter.compress_documents(documents, query)[:TOP_K] for query in queries]
+    elapsed = time.perf_counter() - start
+    return elapsed, [[d.metadata["source"] for d in docs] for docs in results]
+
+
+def bench_relevance_index(documents, queries, embeddings) -> tuple[float, list[list[str]]]:
+    start = time.perf_counter()
+    index = RelevanceIndex.from_documents(documents, embeddings)
+    query_vectors = [embeddings.embed_query(query) for query in queries]
+    results = index.search(query_vectors, k=TOP_K, similarity_threshold=SIMILARITY_THRESHOLD)
+    elapsed = time.perf_counter() - start
+    return elapsed, [[d.metadata["source"] for d in docs] for docs in results]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--dim", type=int, default=256, help="Embedding dimension")
+    parser.add_argument("--queries", type=int, default=5, help="Queries scored against the same chunks")
+    args = parser.parse_args()
+
+    print(f"{'chunks':>8} {'queries':>8} {'langchain (s)':>14} {'numpy (s)':>10} {'speedup':>8} {'same top-k':>11}")
+    for size in args.sizes:
+        documents, queries, embeddings = make_data(size, args.dim, args.queries)
+        langchain_time, langchain_results = bench_langchain(documents, queries, embeddings)
+        numpy_time, numpy_results = bench_relevance_index(documents, queries, embeddings)
+        same = all(set(a) == set(b) for a, b in zip(langchain_results, numpy_results))
+        print(f"{size:>8} {args.queries:>8} {langchain_time:>14.3f} {numpy_time:>10.3f} "
+              f"{langchain_time / numpy_time:>7.1f}x {str(same):>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,12 +9,21 @@ class ResearchAgent:
         self.stream_output = stream_output
         self.headers = headers or {}
         self.tone = tone
+        # Holds the clients and caches every researcher shares; it does no research itself, so
+        # its costs are the total of its children and each child's costs are its own
+        self.root_researcher = None
+
+    def _create_researcher(self, **kwargs) -> GPTResearcher:
+        if self.root_researcher is None:
+            self.root_researcher = GPTResearcher(**kwargs)
+        return self.root_researcher.spawn_child(**kwargs)
 
     async def research(self, query: str, research_report: str = "research_report",
                        parent_query: str = "", verbose=True, source="web", tone=None, headers=None):
         # Initialize the researcher
-        researcher = GPTResearcher(query=query, report_type=research_report, parent_query=parent_query,
-                                   verbose=verbose, report_source=source, tone=tone, websocket=self.websocket, headers=self.headers)
+        researcher = self._create_researcher(query=query, report_type=research_report, parent_query=parent_query,
+                                             verbose=verbose, report_source=source, tone=tone,
+                                             websocket=self.websocket, headers=self.headers)
         # Conduct research on the given query
         await researcher.conduct_research()
         # Write the report